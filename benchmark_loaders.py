@@ -0,0 +1,208 @@
+"""
+엑셀 로더 벤치마크
+- 기존 경로: 시트 목록 조회 후 시트마다 pd.read_excel 호출 (read_user_sheet)
+- 단일 패스 openpyxl + pandas 열 단위 정리 (parse_user_sheets_columnar)
+- 원시 xlsx 리더: zip 안의 시트 XML 에서 M/N 열만 스트리밍 (pandas 미사용)
+- 증분 로더 첫 로드 (IncrementalWorkbookLoader.load)
+- load_users_from_excel: 현재 기본 경로 (xlsx 는 원시 리더)
+
+로더마다 새 프로세스에서 실행해 최단 시간과 최대 RSS(프로세스 최고 메모리)를 함께 잰다.
+--sizes 를 주면 synthetic_workbook 으로 크기별 워크북을 만들어 차례로 잰다.
+
+사용법:
+  python benchmark_loaders.py <엑셀 파일> [반복 횟수]
+  python benchmark_loaders.py --sizes 10,100,1000,10000 [--repeat 3] [--json 결과.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from ev_automation.excel_loader import load_users_from_excel, parse_user_sheets_columnar, USER_SHEET_PATTERN
+from ev_automation.incremental_loader import IncrementalWorkbookLoader
+from ev_automation.synthetic_workbook import write_workbook
+from ev_automation.user_record import UserRecord
+from ev_automation.xlsx_reader import load_users_raw
+
+# 기존 경로는 시트 수에 비례해 워크북을 다시 열어서 큰 워크북에서는 기본으로 건너뜀
+LEGACY_MAX_SHEETS = 1000
+
+
+def load_users_per_sheet(excel_file):
+    """기존 경로: 시트마다 워크북을 다시 여는 방식"""
+    import pandas as pd
+    from working_excel_reader import read_user_sheet
+    sheet_names = pd.ExcelFile(excel_file).sheet_names
+    users = []
+    for sheet_name in sheet_names:
+        if not USER_SHEET_PATTERN.match(sheet_name):
+            continue
+        user_data = read_user_sheet(excel_file, sheet_name)
+        if user_data:
+            users.append(user_data)
+    return users
+
+
+def load_users_columnar(excel_file):
+    """openpyxl 단일 패스 + pandas 열 단위 정리"""
+    return [UserRecord.from_dict(user_data)
+            for _, user_data in parse_user_sheets_columnar(excel_file) if user_data]
+
+
+def load_users_incremental(excel_file):
+    """증분 로더 첫 로드 (캐시 미사용)"""
+    return IncrementalWorkbookLoader(excel_file, use_cache=False).load()
+
+
+LOADERS = [
+    ("시트별 read_excel (기존)", load_users_per_sheet),
+    ("openpyxl + pandas 열 단위", load_users_columnar),
+    ("원시 xlsx 리더 (pandas 없음)", load_users_raw),
+    ("증분 로더 첫 로드", load_users_incremental),
+    ("load_users_from_excel", load_users_from_excel),
+]
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB). 잴 수 없으면 None"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS 는 바이트, 리눅스는 KB
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except (ImportError, AttributeError):
+        return None
+
+
+def time_loader(loader, excel_file, repeat):
+    """repeat 회 실행 중 최단 시간과 마지막 결과 반환"""
+    best = None
+    users = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        users = loader(excel_file)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, users
+
+
+def _measure(loader_index, excel_file, repeat):
+    """작업 프로세스에서 실행: 로더 하나의 (최단 시간, 결과, 시작 전 RSS, 최대 RSS)"""
+    _, loader = LOADERS[loader_index]
+    rss_before = peak_rss_mb()
+    # 시트별 누락 경고 출력은 표를 가리므로 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed, users = time_loader(loader, excel_file, repeat)
+    # 기존 경로는 dict 를 반환하므로 레코드로 맞춰 비교
+    users = [UserRecord.coerce(u) for u in users]
+    return elapsed, users, rss_before, peak_rss_mb()
+
+
+def run_loader(loader_index, excel_file, repeat):
+    """새 프로세스에서 로더 실행 (이전 로더의 메모리 사용이 최대 RSS 에 섞이지 않도록)"""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(_measure, (loader_index, excel_file, repeat))
+
+
+def _format_mb(value):
+    return f"{value:>8.1f} MB" if value is not None else "       - MB"
+
+
+def benchmark_file(excel_file, repeat, skip_legacy=False):
+    """워크북 하나에 대해 전체 로더 측정, 결과 행 목록 반환"""
+    print(f"📊 로더 벤치마크: {excel_file} (반복 {repeat}회, 최단 시간)")
+    print("-" * 84)
+    print(f"{'로더':<34} {'시간':>13} {'인원':>6} {'최대 RSS':>11} {'로드 중 증가':>11}")
+    results = []
+    for index, (label, _) in enumerate(LOADERS):
+        if skip_legacy and index == 0:
+            print(f"{label:<34} {'건너뜀':>13}")
+            continue
+        elapsed, users, rss_before, rss_peak = run_loader(index, excel_file, repeat)
+        growth = rss_peak - rss_before if rss_peak is not None and rss_before is not None else None
+        results.append({'loader': label, 'seconds': elapsed, 'users': len(users),
+                        'peak_rss_mb': rss_peak, 'rss_growth_mb': growth, 'records': users})
+        print(f"{label:<34} {elapsed * 1000:>10.1f} ms {len(users):>5}명 "
+              f"{_format_mb(rss_peak)} {_format_mb(growth)}")
+
+    print("-" * 84)
+    baseline = results[0]
+    for result in results[1:]:
+        same = "일치" if result['records'] == baseline['records'] else "불일치"
+        print(f"{result['loader']}: {baseline['loader']} 대비 {baseline['seconds'] / result['seconds']:.1f}배, 결과 {same}")
+    for result in results:
+        del result['records']
+    return results
+
+
+def benchmark_sizes(sizes, repeat, legacy_max):
+    """synthetic_workbook 으로 크기별 워크북을 만들어 측정"""
+    report = []
+    with tempfile.TemporaryDirectory(prefix="ev_bench_") as workdir:
+        for sheets in sizes:
+            excel_file = os.path.join(workdir, f"synthetic_{sheets}.xlsx")
+            write_workbook(excel_file, sheets)
+            print()
+            results = benchmark_file(excel_file, repeat, skip_legacy=sheets > legacy_max)
+            for result in results:
+                result['sheets'] = sheets
+            report.extend(results)
+
+    print()
+    print("📈 시트 수별 요약 (ms / 최대 RSS MB)")
+    labels = [label for label, _ in LOADERS]
+    print(f"{'로더':<34}" + "".join(f"{sheets:>18}" for sheets in sizes))
+    for label in labels:
+        cells = []
+        for sheets in sizes:
+            row = next((r for r in report if r['loader'] == label and r['sheets'] == sheets), None)
+            if row is None:
+                cells.append(f"{'-':>18}")
+            else:
+                rss = f"{row['peak_rss_mb']:.0f}" if row['peak_rss_mb'] is not None else "-"
+                cells.append(f"{row['seconds'] * 1000:>10.1f} / {rss:>5}")
+        print(f"{label:<34}" + "".join(cells))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="엑셀 로더 벤치마크")
+    parser.add_argument("excel_file", nargs="?", help="측정할 엑셀 파일 (--sizes 를 쓰면 생략)")
+    parser.add_argument("repeat_count", nargs="?", type=int, help="반복 횟수 (기존 사용법 호환)")
+    parser.add_argument("--sizes", help="합성 워크북 고객 시트 수 목록 (예: 10,100,1000,10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="로더별 반복 횟수 (최단 시간 사용)")
+    parser.add_argument("--legacy-max", type=int, default=LEGACY_MAX_SHEETS,
+                        help="기존 시트별 경로를 잴 최대 시트 수")
+    parser.add_argument("--json", help="결과를 저장할 JSON 경로 (회귀 비교용)")
+    args = parser.parse_args(argv)
+    repeat = args.repeat_count or args.repeat
+
+    if args.sizes:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+        report = benchmark_sizes(sizes, repeat, args.legacy_max)
+    elif args.excel_file:
+        report = benchmark_file(args.excel_file, repeat)
+    else:
+        parser.print_usage()
+        return
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+정규화 마이크로 벤치마크 - 날짜/전화번호 호출당 비용
+
+- 처음 보는 값 (메모 비운 상태, 전체 파싱 경로)
+- 반복 값 (LRU 메모 적중)
+- 이미 정규화된 값 (빠른 경로: YYYY-MM-DD / 010-XXXX-XXXX)
+- 열 단위 일괄 API (normalize_dates / format_phone_numbers)
+
+사용법: python benchmark_normalize.py [값 개수]
+"""
+
+import random
+import sys
+import time
+
+from ev_automation.normalize import (
+    clear_normalize_cache, format_phone_number, format_phone_numbers, normalize_date_string, normalize_dates,
+)
+
+
+def make_date_values(count, rng):
+    """엑셀에서 들어오는 여러 날짜 형식을 섞은 값 목록"""
+    values = []
+    for _ in range(count):
+        y, m, d = rng.randint(1960, 2005), rng.randint(1, 12), rng.randint(1, 28)
+        kind = rng.randrange(6)
+        if kind == 0:
+            values.append(str(rng.randint(22000, 38000)))
+        elif kind == 1:
+            values.append(f"{y}-{m:02d}-{d:02d} 00:00:00")
+        elif kind == 2:
+            values.append(f"{y}년 {m}월 {d}일")
+        elif kind == 3:
+            values.append(f"{y}.{m}.{d}")
+        elif kind == 4:
+            values.append(f"{y}{m:02d}{d:02d}")
+        else:
+            values.append(f"{y}/{m}/{d}")
+    return values
+
+
+def make_phone_values(count, rng):
+    values = []
+    for _ in range(count):
+        middle, last = rng.randint(1000, 9999), rng.randint(0, 9999)
+        kind = rng.randrange(3)
+        if kind == 0:
+            values.append(f"010{middle}{last:04d}")
+        elif kind == 1:
+            values.append(f"010 {middle} {last:04d}")
+        else:
+            values.append(f"010.{middle}.{last:04d}")
+    return values
+
+
+def per_call_ns(func, values, clear_cache=False):
+    """값 목록 전체를 한 번 처리하는 시간의 호출당 평균 (ns), 3회 중 최단"""
+    best = None
+    for _ in range(3):
+        if clear_cache:
+            clear_normalize_cache()
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(values) * 1e9
+
+
+def batch_ns(func, values):
+    best = None
+    for _ in range(3):
+        clear_normalize_cache()
+        start = time.perf_counter()
+        func(values)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(values) * 1e9
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(0)
+    dates = make_date_values(count, rng)
+    phones = make_phone_values(count, rng)
+    iso_dates = [normalize_date_string(v) for v in dates]
+    masked_phones = [format_phone_number(v) for v in phones]
+    # 메모에 들어가는 크기의 값 묶음을 반복 (같은 값이 여러 단계에서 다시 정규화되는 경우)
+    warm_dates = [dates[i % 1000] for i in range(count)]
+    warm_phones = [phones[i % 1000] for i in range(count)]
+    # 고객 수백 명이 같은 날짜(계약일/출고일)를 공유하는 열
+    repeated_dates = [rng.choice(dates[:200]) for _ in range(count)]
+
+    print(f"📊 정규화 벤치마크 (값 {count}개, 호출당 ns, 3회 중 최단)")
+    print("-" * 56)
+    rows = [
+        ("날짜: 처음 보는 값", per_call_ns(normalize_date_string, dates, clear_cache=True)),
+        ("날짜: 반복 값 (메모 적중)", per_call_ns(normalize_date_string, warm_dates)),
+        ("날짜: 이미 YYYY-MM-DD", per_call_ns(normalize_date_string, iso_dates)),
+        ("날짜: 일괄 API (중복 많은 열)", batch_ns(normalize_dates, repeated_dates)),
+        ("전화: 처음 보는 값", per_call_ns(format_phone_number, phones, clear_cache=True)),
+        ("전화: 반복 값 (메모 적중)", per_call_ns(format_phone_number, warm_phones)),
+        ("전화: 이미 010-XXXX-XXXX", per_call_ns(format_phone_number, masked_phones)),
+        ("전화: 일괄 API", batch_ns(format_phone_numbers, phones)),
+    ]
+    for label, ns in rows:
+        print(f"{label:<32} {ns:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
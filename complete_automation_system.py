@@ -10,10 +10,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from ev_automation.browser import create_browser
-from ev_automation.excel_loader import load_users_from_excel
-from ev_automation.fill_fields import build_fill_script
+from ev_automation.excel_loader import cached_users_from_excel, iter_users_from_excel, load_users_from_excel
+from ev_automation.preflight import print_report, run_preflight, summarize_issues, validate_user
+from ev_automation.fill_fields import fill_fields_planned
 from ev_automation.temp_save import run_temp_save, finalize_temp_save
 from ev_automation.file_attachment import attach_pdf_files, find_and_click_submit_button, handle_final_popup
+from ev_automation.selectors_learning import get_locator_cache
+from ev_automation.verify_fill import format_verify_report, reset_verify_stats, verify_and_refill
+from ev_automation.waits import format_wait_report, reset_wait_stats
 
 class CompleteAutomationSystem:
     """완전한 자동화 시스템"""
@@ -28,13 +32,27 @@ class CompleteAutomationSystem:
     def load_users_from_excel(self):
         """엑셀에서 사용자 데이터 로드"""
         try:
-            self.users_data = load_users_from_excel(self.excel_file)
+            self.users_data = load_users_from_excel(self.excel_file, use_cache=True)
             print(f"총 {len(self.users_data)}명의 사용자 로드 완료")
             return True
         except Exception as e:
             print(f"엑셀 로드 실패: {e}")
             return False
     
+    def iter_users(self):
+        """시트가 파싱되는 대로 사용자 데이터 반환 (나머지 시트는 백그라운드에서 계속 파싱)"""
+        self.users_data = []
+        try:
+            for user in iter_users_from_excel(self.excel_file):
+                self.users_data.append(user)
+                yield user
+            print(f"총 {len(self.users_data)}명의 사용자 로드 완료")
+        except Exception as e:
+            print(f"엑셀 스트리밍 로드 실패: {e}")
+            # 아직 아무도 처리하지 않았으면 기존 방식으로 전체 로드
+            if not self.users_data and self.load_users_from_excel():
+                yield from list(self.users_data)
+    
     def create_browser(self, profile_id):
         """브라우저 생성"""
         try:
@@ -85,8 +103,14 @@ class CompleteAutomationSystem:
             # 1단계: 신청서 필드 자동 입력
             print(f"[STEP 1] {user_data['성명']} 신청서 필드 입력")
             try:
-                driver.execute_script(build_fill_script(user_data))
-                time.sleep(3)
+                # 입력 계획 단계별로 입력 + 읽어 온 값으로 확인 (의존 필드만 조건 대기)
+                result = fill_fields_planned(driver, user_data)
+                if result.get('error'):
+                    raise RuntimeError(result['error'])
+                if result['failed']:
+                    print(f"[WARNING] 확인되지 않은 필드: {', '.join(result['failed'])}")
+                # 페이지 change 핸들러가 값을 바꾸는 경우가 있어 다시 읽어 틀린 필드만 재입력
+                verify_and_refill(driver, user_data)
                 print(f"[SUCCESS] 신청서 필드 입력 완료")
             except Exception as e:
                 print(f"[ERROR] 필드 입력 실패: {e}")
@@ -138,42 +162,67 @@ class CompleteAutomationSystem:
         print("🎯 완전한 전기차 신청서 자동화 시스템")
         print("=" * 60)
         
-        # 데이터 로드
-        if not self.load_users_from_excel():
-            print("처리할 데이터가 없습니다.")
-            return
-        
         # 처리할 사용자 선택
-        if selected_user_indices is None:
+        show_users = selected_user_indices is None
+        if show_users:
             print(f"\n처리 가능한 사용자:")
-            for i, user in enumerate(self.users_data):
-                priority_info = user.get('우선순위', '일반')
-                print(f"  {i+1}. {user['성명']} - {user['휴대전화']} - {priority_info}")
-            
             # 기본적으로 첫 번째 사용자만 처리
             selected_user_indices = [0]
+        selected = set(selected_user_indices)
+        total = len(selected)
+        reset_wait_stats()
+        reset_verify_stats()
+        print(f"\n{total}명을 처리합니다.")
         
-        selected_users = [self.users_data[i] for i in selected_user_indices]
-        print(f"\n{len(selected_users)}명을 처리합니다.")
+        # 캐시로 전체 목록을 이미 알면 브라우저를 띄우기 전에 사전 검증 표 출력
+        # (스트리밍일 때는 레코드마다 건너뛰기만 하고 표는 끝에 요약으로 출력)
+        upfront_users = cached_users_from_excel(self.excel_file)
+        if upfront_users is not None:
+            print_report(run_preflight(upfront_users))
         
-        # 순차 처리 (단일 컴퓨터, 단일 계정)
+        # 데이터 로드와 순차 처리 겹치기 (단일 컴퓨터, 단일 계정)
+        # 시트가 파싱되는 대로 바로 처리하므로 첫 고객은 워크북 전체를 기다리지 않음
         success_count = 0
-        for i, user in enumerate(selected_users):
+        processed = 0
+        for index, user in enumerate(self.iter_users()):
+            if show_users:
+                priority_info = user.get('우선순위', '일반')
+                print(f"  {index+1}. {user['성명']} - {user['휴대전화']} - {priority_info}")
+            if index not in selected or processed >= total:
+                continue
             if not self.automation_running:
                 break
             
-            print(f"\n{'='*50}")
-            print(f"사용자 {i+1}/{len(selected_users)} 처리 중...")
-            
-            if self.complete_user_process(user, i+1):
-                success_count += 1
+            # 사전 검증 실패 레코드는 브라우저를 띄우지 않음
+            issues = validate_user(user)
+            if issues:
+                print(f"[PREFLIGHT] {user.get('성명', '')} 건너뜀: {summarize_issues(issues)}")
+                total -= 1
+                continue
             
             # 다음 사용자 처리 전 대기
-            if i < len(selected_users) - 1:
+            if processed > 0:
                 print(f"\n다음 사용자 처리 전 5초 대기...")
                 time.sleep(5)
+            
+            processed += 1
+            print(f"\n{'='*50}")
+            print(f"사용자 {processed}/{total} 처리 중...")
+            
+            if self.complete_user_process(user, processed):
+                success_count += 1
+        
+        if not self.users_data:
+            print("처리할 데이터가 없습니다.")
+            return
         
-        print(f"\n🎊 전체 처리 완료! 성공: {success_count}/{len(selected_users)}")
+        if upfront_users is None:
+            print_report(run_preflight(self.users_data))
+        print(f"\n🎊 전체 처리 완료! 성공: {success_count}/{processed}")
+        print(format_wait_report())
+        get_locator_cache().flush()
+        print(get_locator_cache().format_stats())
+        print(format_verify_report())
     
     def stop_automation(self):
         """자동화 중지"""
@@ -0,0 +1,185 @@
+"""
+주소 정규화 인덱스 - 시도/시군구(/읍면동) 행정구역 데이터로 주소 앞부분 보정
+
+로더는 '제천시' 주소에만 '충청북도' 를 붙이고 나머지 시도 없는 주소는 그대로 넘겨서
+사람이 손으로 고쳐야 했다. 여기서는 오프라인 행정구역 데이터(regions.json)를
+접두어 트라이에 올려 주소 앞부분을
+- 시도 약칭 → 정식 명칭 ('충북' → '충청북도', '인천시' → '인천광역시')
+- 시도 없는 시군구 → 시도 보충 ('제천시 의림지로' → '충청북도 제천시 의림지로')
+- 시군구 '시/군' 생략 → 보충 ('충북 제천 의림지로' → '충청북도 제천시 의림지로')
+- 띄어쓰기 없는 시도+시군구 분리 ('충청북도제천시' → '충청북도 제천시')
+로 맞춘다. 여러 시도에 같은 이름이 있는 시군구(중구, 고성군 등)는 시도가 없으면 건드리지 않는다.
+읍면동은 데이터 파일에 있을 때만 시군구 보충에 쓴다. 해석한 주소는 캐시한다.
+"""
+
+import json
+import os
+import threading
+from functools import lru_cache
+
+DEFAULT_REGIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "regions.json")
+
+# 해석한 주소 캐시 크기
+ADDRESS_CACHE_SIZE = 8192
+
+SIDO = "sido"
+SIGUNGU = "sigungu"
+EMD = "emd"
+
+
+class RegionTrie:
+    """글자 단위 접두어 트라이. 노드마다 [(종류, 시도, 시군구, 등록한 이름), ...] 을 담는다"""
+
+    _END = ""
+
+    def __init__(self):
+        self.root = {}
+
+    def add(self, key: str, payload: tuple):
+        node = self.root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node.setdefault(self._END, []).append(payload)
+
+    def get(self, key: str) -> list:
+        """key 와 정확히 같은 이름의 항목 목록"""
+        node = self.root
+        for ch in key:
+            node = node.get(ch)
+            if node is None:
+                return []
+        return node.get(self._END, [])
+
+    def prefixes(self, text: str) -> list:
+        """text 의 접두어와 일치하는 [(길이, 항목 목록), ...] (짧은 것부터)"""
+        matches = []
+        node = self.root
+        for length, ch in enumerate(text, 1):
+            node = node.get(ch)
+            if node is None:
+                break
+            if self._END in node:
+                matches.append((length, node[self._END]))
+        return matches
+
+
+class AddressIndex:
+    """행정구역 데이터 인덱스"""
+
+    def __init__(self, regions_file: str = DEFAULT_REGIONS_FILE):
+        self.regions_file = regions_file
+        self.trie = RegionTrie()
+        self.sido_names = []
+        with open(regions_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for sido in data.get("시도", []):
+            self._add_sido(sido)
+
+    def _add_sido(self, sido: dict):
+        name = sido["name"]
+        self.sido_names.append(name)
+        for key in [name] + list(sido.get("aliases", [])):
+            self.trie.add(key, (SIDO, name, "", name))
+        for sigungu in sido.get("시군구", []):
+            self.trie.add(sigungu, (SIGUNGU, name, sigungu, sigungu))
+            # '제천' → '제천시', '단양' → '단양군' (구는 '중', '동' 처럼 너무 짧아 제외)
+            stem = sigungu[:-1]
+            if sigungu[-1] in "시군" and len(stem) >= 2:
+                self.trie.add(stem, (SIGUNGU, name, sigungu, stem))
+        for sigungu, towns in (sido.get("읍면동") or {}).items():
+            for town in towns:
+                self.trie.add(town, (EMD, name, sigungu, town))
+
+    # ---------- 해석 ----------
+    def _sigungu_of(self, token: str, sido: str):
+        """sido 안에서 token 에 해당하는 정식 시군구 이름 (없으면 None)"""
+        for kind, parent, sigungu, _ in self.trie.get(token):
+            if kind == SIGUNGU and parent == sido:
+                return sigungu
+        return None
+
+    def _split_glued(self, token: str):
+        """'충청북도제천시' → ('충청북도', '제천시'). 분리 안 되면 None"""
+        for length, payloads in reversed(self.trie.prefixes(token)):
+            if length == len(token):
+                continue
+            for kind, sido, _, _ in payloads:
+                if kind == SIDO and self._sigungu_of(token[length:], sido):
+                    return token[:length], token[length:]
+        return None
+
+    def normalize(self, address: str) -> str:
+        """주소 앞부분의 시도/시군구를 정식 명칭으로 보정 (모르는 주소는 공백만 정리)"""
+        tokens = str(address).split()
+        if not tokens:
+            return address
+        glued = self._split_glued(tokens[0])
+        if glued:
+            tokens = list(glued) + tokens[1:]
+
+        head = self.trie.get(tokens[0])
+        next_token = tokens[1] if len(tokens) > 1 else ""
+        sido_hits = [p for p in head if p[0] == SIDO]
+        sigungu_hits = {(p[1], p[2]) for p in head if p[0] == SIGUNGU}
+        # 시도 약칭과 시군구 정식 이름이 겹침 ('광주시': 광주광역시 / 경기도 광주시)
+        ambiguous = bool(sido_hits) and any(p[0] == SIGUNGU and p[2] == p[3] for p in head)
+        town_hits = {(p[1], p[2], p[3]) for p in head if p[0] == EMD}
+
+        sido = sigungu = None
+        rest = tokens
+        # 1) 시도 + 그 시도의 시군구 ('광주시 북구' 는 광주광역시)
+        if sido_hits and next_token and self._sigungu_of(next_token, sido_hits[0][1]):
+            sido = sido_hits[0][1]
+            sigungu = self._sigungu_of(next_token, sido)
+            rest = tokens[2:]
+        elif ambiguous:
+            return " ".join(tokens)
+        # 2) 시도 없이 유일한 시군구 ('제천시', '단양 ...'). 시도 약칭과 겹치는 생략형('광주')은 시도로 봄
+        elif len(sigungu_hits) == 1 and not sido_hits:
+            sido, sigungu = next(iter(sigungu_hits))
+            rest = tokens[1:]
+        # 3) 시도만
+        elif sido_hits:
+            sido = sido_hits[0][1]
+            rest = tokens[1:]
+        # 4) 시군구 없이 유일한 읍면동
+        elif len(town_hits) == 1:
+            sido, sigungu, _ = next(iter(town_hits))
+        else:
+            return " ".join(tokens)
+
+        parts = [sido]
+        if sigungu:
+            parts.append(sigungu)
+        return " ".join(parts + list(rest))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_address_index() -> AddressIndex:
+    """공용 주소 인덱스 (처음 쓸 때 로드)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = AddressIndex()
+    return _index
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _normalize_cached(address: str) -> str:
+    return get_address_index().normalize(address)
+
+
+def normalize_address(address: str) -> str:
+    """주소 시도/시군구 보정 (해석 결과 캐시)"""
+    if not address or not isinstance(address, str):
+        return address
+    return _normalize_cached(address)
+
+
+def normalize_addresses(values) -> list:
+    """주소 열 일괄 보정"""
+    return [normalize_address(value) for value in values]
@@ -0,0 +1,154 @@
+"""
+여러 워크북 일괄 수집 - 지점별 엑셀을 프로세스 풀로 병렬 파싱
+
+지점마다 워크북이 하나씩 오기 때문에 하루에 수십 개를 처리해야 할 때가 있다.
+openpyxl/pandas 파싱은 CPU 작업이라 스레드로는 GIL 때문에 빨라지지 않으므로
+ProcessPoolExecutor 로 파일별로 나눠 파싱하고, 결과를 휴대전화+성명 기준으로
+중복 제거한 하나의 사용자 큐로 합친다. CRM 내보내기 CSV/JSONL/Parquet 도 같이 받는다.
+
+사용법: python -m ev_automation.bulk_ingest <폴더 또는 엑셀 파일...> [--workers N] [--no-cache] [--output users.json]
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ev_automation.input_adapters import CSV_EXTENSIONS, JSONL_EXTENSIONS, PARQUET_EXTENSIONS, load_users_from_file
+
+# 폴더에서 수집할 입력 파일 (엑셀 워크북 + CRM 내보내기)
+INPUT_EXTENSIONS = (".xlsx", ".xlsm") + CSV_EXTENSIONS + JSONL_EXTENSIONS + PARQUET_EXTENSIONS
+
+
+def collect_workbooks(paths) -> list:
+    """폴더/파일 목록에서 워크북 경로 수집 (엑셀 임시파일 ~$ 제외, 이름순)"""
+    if isinstance(paths, str):
+        paths = [paths]
+    workbooks = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.lower().endswith(INPUT_EXTENSIONS) and not name.startswith("~$"):
+                    workbooks.append(os.path.join(path, name))
+        elif os.path.isfile(path):
+            workbooks.append(path)
+        else:
+            print(f"[WARNING] 경로를 찾을 수 없습니다: {path}")
+    # 같은 파일이 여러 번 지정된 경우 한 번만
+    seen = set()
+    unique = []
+    for path in workbooks:
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def dedupe_key(user) -> tuple:
+    """중복 판별 키: (휴대전화 숫자, 성명)"""
+    phone = re.sub(r"\D", "", user.get('휴대전화', '') or '')
+    return phone, (user.get('성명', '') or '').strip()
+
+
+def _parse_workbook(excel_file: str, use_cache: bool):
+    """작업 프로세스에서 실행: (사용자 목록, 소요 시간, 오류 메시지)"""
+    start = time.perf_counter()
+    try:
+        users = load_users_from_file(excel_file, use_cache=use_cache)
+        return users, time.perf_counter() - start, None
+    except Exception as e:
+        return [], time.perf_counter() - start, str(e)
+
+
+def ingest_workbooks(paths, max_workers: int | None = None, use_cache: bool = True) -> dict:
+    """여러 워크북을 병렬 파싱해 중복 제거한 사용자 목록 반환
+
+    반환: {
+        'users': [UserRecord, ...],      # 파일 순서 → 시트 순서, 첫 등장만 유지
+        'files': [{'file', 'users', 'seconds', 'error'}, ...],
+        'duplicates': [{'file', '성명', '휴대전화', 'first_file'}, ...],
+        'seconds': 전체 소요 시간,
+    }
+    """
+    workbooks = collect_workbooks(paths)
+    start = time.perf_counter()
+    parsed = {}
+    if workbooks:
+        workers = max_workers or min(len(workbooks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_parse_workbook, path, use_cache): path for path in workbooks}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    parsed[path] = future.result()
+                except Exception as e:
+                    # 작업 프로세스 자체가 죽은 경우
+                    parsed[path] = ([], 0.0, str(e))
+
+    users = []
+    files = []
+    duplicates = []
+    first_seen = {}
+    for path in workbooks:
+        file_users, seconds, error = parsed[path]
+        files.append({'file': path, 'users': len(file_users), 'seconds': seconds, 'error': error})
+        for user in file_users:
+            key = dedupe_key(user)
+            if key in first_seen:
+                duplicates.append({
+                    'file': path, '성명': key[1], '휴대전화': user.get('휴대전화', ''),
+                    'first_file': first_seen[key],
+                })
+                continue
+            first_seen[key] = path
+            users.append(user)
+
+    return {
+        'users': users,
+        'files': files,
+        'duplicates': duplicates,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def print_report(result: dict) -> None:
+    """파일별 파싱 시간/인원 표 출력"""
+    print(f"📊 워크북 {len(result['files'])}개 수집 결과")
+    print("-" * 70)
+    for entry in result['files']:
+        name = os.path.basename(entry['file'])
+        if entry['error']:
+            print(f"❌ {name:<40} {entry['seconds'] * 1000:>9.1f} ms  실패: {entry['error']}")
+        else:
+            print(f"✅ {name:<40} {entry['seconds'] * 1000:>9.1f} ms  {entry['users']:>5}명")
+    print("-" * 70)
+    total_parse = sum(entry['seconds'] for entry in result['files'])
+    print(f"총 {len(result['users'])}명 (중복 제외 {len(result['duplicates'])}명)")
+    print(f"전체 {result['seconds']:.2f}초 (파일별 합계 {total_parse:.2f}초)")
+    for dup in result['duplicates']:
+        print(f"  [DUP] {dup['성명']} {dup['휴대전화']} - {os.path.basename(dup['file'])} "
+              f"(처음: {os.path.basename(dup['first_file'])})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 워크북 병렬 수집")
+    parser.add_argument("paths", nargs="+", help="엑셀 파일 또는 폴더")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--no-cache", action="store_true", help="워크북 캐시 사용 안 함")
+    parser.add_argument("--output", help="중복 제거한 사용자 목록을 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    result = ingest_workbooks(args.paths, max_workers=args.workers, use_cache=not args.no_cache)
+    print_report(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([user.to_dict() for user in result['users']], f, ensure_ascii=False, indent=2)
+        print(f"💾 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+버튼 찾기 - 임시저장/지원 신청/확인/팝업 버튼을 페이지 안에서 점수로 골라 한 번에 반환
+
+기존에는 흐름마다 button/input/a 요소를 모두 가져와 is_displayed(), text, get_attribute 를
+요소마다 호출했기 때문에 큰 신청서에서는 WebDriver 왕복이 수백 번 생겼다.
+여기서는 역할별 가중치(BUTTON_ROLES)를 페이지 헬퍼(window.__ev.rankButtons)에 넘겨
+텍스트 / onclick(goSave, goCompare 등) / id·class 힌트 / 보이는지 여부로 점수를 매기고
+가장 높은 요소와 점수를 한 번의 호출로 받는다. 찾은 버튼의 선택자는 페이지 서명별로
+학습해 두고 다음에는 그 선택자부터 시도한다 (selectors_learning.LocatorCache).
+"""
+
+from ev_automation.page_helpers import call_page_helper
+from ev_automation.selectors_learning import get_locator_cache
+
+# 역할별 점수 규칙
+#   text / onclick / attr(id, class, name): 포함되면 해당 가중치 (분류마다 가장 큰 값만)
+#   exact: 텍스트가 정확히 같으면 +5,  container: 그 안(팝업/모달)에 있으면 +4
+#   exclude: 텍스트에 포함되면 후보에서 제외,  min: 이 점수 미만이면 찾지 못한 것으로 처리
+#   보이는 요소 +3, 보이지 않는 요소 -10, disabled -5
+BUTTON_ROLES = {
+    'temp_save': {
+        'text': {'임시저장': 10, '저장': 5, 'temp': 3, 'save': 3},
+        'onclick': {'goSave': 12, 'tempSave': 10, 'temp_save': 10, 'save': 4},
+        'attr': {'tempSave': 6, 'temp_save': 6, 'btn-blue': 2, 'save': 2},
+        'exact': ['임시저장'],
+        'exclude': ['삭제', '취소', '닫기'],
+        'min': 8,
+    },
+    'submit': {
+        'text': {'지원 신청': 10, '신청 완료': 10, '최종 제출': 10, '신청': 5, '제출': 5, '지원': 3},
+        'onclick': {'submit': 6, 'apply': 6, '신청': 5, '지원': 3},
+        'attr': {'submitBtn': 6, 'applyBtn': 6, 'btn-submit': 5, 'btn-apply': 5, 'submit': 2, 'apply': 2},
+        'exclude': ['임시저장', '취소', '삭제'],
+        'min': 8,
+    },
+    'confirm': {
+        'text': {'확인': 8, 'ok': 6},
+        'onclick': {'goCompare': 12, 'confirm': 6, '확인': 6},
+        'attr': {'confirmBtn': 6, 'okBtn': 6, 'btn-confirm': 5, 'btn-ok': 5, 'btn-primary': 2},
+        'exact': ['확인', 'OK'],
+        'exclude': ['취소', '확인코드'],
+        'container': ".modal, .popup, .dialog, [role='dialog']",
+        'min': 8,
+    },
+    'popup_ok': {
+        'text': {'확인': 8, 'ok': 6, '완료': 6, '닫기': 4},
+        'onclick': {'close': 4, 'confirm': 4},
+        'attr': {'btn-confirm': 5, 'btn-ok': 5, 'btn-close': 4, 'btn-primary': 2},
+        'exact': ['확인', 'OK', '닫기'],
+        'exclude': ['취소', '확인코드'],
+        'container': ".modal, .popup, .dialog, .layer, [role='dialog']",
+        'min': 8,
+    },
+}
+
+
+def _spec(role: str) -> dict:
+    if role not in BUTTON_ROLES:
+        raise ValueError(f"알 수 없는 버튼 역할: {role}")
+    return BUTTON_ROLES[role]
+
+
+def _rank(driver, role: str):
+    """페이지 안 점수 계산으로 전체 탐색 → (element, selector, score)"""
+    spec = _spec(role)
+    try:
+        best = call_page_helper(driver, 'rankButtons', spec)
+    except Exception as e:
+        print(f"[BUTTON] {role} 버튼 찾기 실패: {e}")
+        return None, None, 0
+    if not best:
+        return None, None, 0
+    score = best.get('score') or 0
+    if score < spec['min']:
+        print(f"[BUTTON] {role}: 최고 점수 {score} < {spec['min']} ('{best.get('text', '')}')")
+        return None, None, score
+    print(f"[BUTTON] {role}: '{best.get('text', '')}' (점수 {score}, 후보 {best.get('count', 0)}개)")
+    return best.get('element'), best.get('selector'), score
+
+
+def find_button(driver, role: str):
+    """역할에 가장 잘 맞는 버튼과 점수. 최소 점수 미만이거나 없으면 (None, 점수)
+
+    이 페이지(서명)에서 전에 찾은 선택자가 있으면 먼저 시도하고, 못 찾을 때만 점수 탐색
+    """
+    _spec(role)
+    return get_locator_cache().find(driver, role, lambda: _rank(driver, role))
+
+
+def click_button(driver, role: str) -> bool:
+    """역할에 가장 잘 맞는 버튼을 찾아 페이지 안에서 클릭"""
+    element, _ = find_button(driver, role)
+    if element is None:
+        return False
+    try:
+        return bool(call_page_helper(driver, 'click', element))
+    except Exception as e:
+        print(f"[BUTTON] {role} 버튼 클릭 실패: {e}")
+        return False
@@ -1,38 +1,299 @@
-import json
-import os
-import re
-import pandas as pd
-
-
-def load_users_from_excel(excel_file: str):
-    users = []
-    try:
-        from working_excel_reader import read_user_sheet
-        excel_obj = pd.ExcelFile(excel_file)
-        sheet_names = excel_obj.sheet_names
-        user_sheets = [name for name in sheet_names if re.match(r'^[가-힣]{2,4}$', name)]
-        for sheet_name in user_sheets:
-            user_data = read_user_sheet(excel_file, sheet_name)
-            if user_data:
-                users.append(user_data)
-        return users
-    except Exception:
-        # fallback 샘플
-        return [
-            {
-                '성명': '장원', '계약일자': '2025-08-16', '신청유형': '개인',
-                '생년월일': '1990-01-01', '성별': '여자', '신청차종': 'EV3 스탠다드',
-                '신청대수': '1', '출고예정일자': '2025-08-29',
-                '주소': '충청북도 제천시 의림지로 171', '휴대전화': '010-9199-6844',
-                '이메일': '.', '전화': '.', '우선순위': '사회계층 Y. 다자녀가구. 2자녀 클릭'
-            },
-            {
-                '성명': '전문수', '계약일자': '2025-08-18', '신청유형': '개인',
-                '생년월일': '1990-01-01', '성별': '남자', '신청차종': '레이EV 4인승',
-                '신청대수': '1', '출고예정일자': '2025-08-29',
-                '주소': '인천시 강저로 57번 19', '휴대전화': '010-9557-5256',
-                '이메일': '.', '전화': '.', '우선순위': ''
-            }
-        ]
-
-
+import json
+import os
+import queue
+import threading
+import zipfile
+from ev_automation.header_alias import canonicalize_keys, report_unknown_headers
+from ev_automation.user_record import UserRecord
+from ev_automation.workbook_cache import WorkbookCache
+from ev_automation.xlsx_reader import USER_SHEET_PATTERN, iter_user_sheet_cells_raw, parse_user_sheets_raw
+
+# 파싱 규칙/캐시 형식이 바뀌면 올려서 이전 캐시를 무시
+LOADER_VERSION = "5"
+
+# 시트 내 필드명/값 열 (M/N, 0 기반 인덱스)
+FIELD_NAME_COL = 12
+FIELD_VALUE_COL = 13
+
+
+def iter_user_sheet_cells(excel_file: str, sheet_names=None):
+    """워크북을 읽기 전용으로 한 번만 열고 고객 시트마다 (시트명, [(필드명, 값), ...]) 반환
+
+    시트마다 pd.read_excel 을 호출하면 매번 xlsx 전체를 다시 열고 압축을 풀기 때문에
+    시트가 수백 개인 워크북에서는 로딩이 수십 초 걸린다. 여기서는 한 번의 패스로
+    M/N 열만 꺼낸다. pd.read_excel 과 동일하게 비어 있지 않은 첫 행은 헤더로 건너뛴다.
+    sheet_names 를 주면 해당 시트만 읽는다 (증분 새로고침용).
+    openpyxl 은 .xls(BIFF) 를 읽지 못하므로 .xls 는 pandas(xlrd) 로 읽는다.
+    """
+    if excel_file.lower().endswith('.xls'):
+        yield from iter_user_sheet_cells_xls(excel_file, sheet_names)
+        return
+    from openpyxl import load_workbook
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        if sheet_names is None:
+            worksheets = wb.worksheets
+        else:
+            worksheets = [wb[name] for name in sheet_names if name in wb.sheetnames]
+        for ws in worksheets:
+            sheet_name = ws.title
+            if not USER_SHEET_PATTERN.match(sheet_name):
+                continue
+            try:
+                cells = []
+                header_seen = False
+                for row in ws.iter_rows(values_only=True):
+                    if not header_seen:
+                        header_seen = any(v is not None for v in row)
+                        continue
+                    name = row[FIELD_NAME_COL] if len(row) > FIELD_NAME_COL else None
+                    value = row[FIELD_VALUE_COL] if len(row) > FIELD_VALUE_COL else None
+                    cells.append((name, value))
+            except Exception as e:
+                print(f"[ERROR] {sheet_name} 시트 읽기 실패: {e}")
+                continue
+            yield sheet_name, cells
+    finally:
+        wb.close()
+
+
+def iter_user_sheet_cells_xls(excel_file: str, sheet_names=None):
+    """구형 .xls 워크북: pd.ExcelFile 로 한 번 열고 시트마다 M/N 열 셀 쌍 반환 (xlrd 필요)"""
+    import pandas as pd
+    with pd.ExcelFile(excel_file) as book:
+        names = book.sheet_names if sheet_names is None else [n for n in sheet_names if n in book.sheet_names]
+        for sheet_name in names:
+            if not USER_SHEET_PATTERN.match(sheet_name):
+                continue
+            try:
+                df = book.parse(sheet_name, dtype=object)
+            except Exception as e:
+                print(f"[ERROR] {sheet_name} 시트 읽기 실패: {e}")
+                continue
+            cells = []
+            if df.shape[1] > FIELD_NAME_COL:
+                names_col = df.iloc[:, FIELD_NAME_COL]
+                values_col = df.iloc[:, FIELD_VALUE_COL] if df.shape[1] > FIELD_VALUE_COL else [None] * len(df)
+                for name, value in zip(names_col, values_col):
+                    cells.append((None if pd.isna(name) else name, None if pd.isna(value) else value))
+            yield sheet_name, cells
+
+
+_workbook_cache = None
+
+
+def get_workbook_cache() -> WorkbookCache:
+    """로더 공용 워크북 캐시"""
+    global _workbook_cache
+    if _workbook_cache is None:
+        _workbook_cache = WorkbookCache(namespace=f"users-v{LOADER_VERSION}")
+    return _workbook_cache
+
+
+def invalidate_workbook_cache(excel_file: str | None = None) -> int:
+    """워크북 캐시 명시적 삭제 (excel_file 생략 시 전체)"""
+    return get_workbook_cache().invalidate(excel_file)
+
+
+def load_user_sheets(excel_file: str, use_cache: bool = False):
+    """시트 순서대로 [(시트명, 사용자 데이터), ...] 반환 (실패 시 예외 발생)
+
+    use_cache=True 이면 파일 지문이 같은 이전 결과를 디스크 캐시에서 바로 반환한다.
+    """
+    if use_cache:
+        cached = get_workbook_cache().get_or_load(excel_file, parse_user_sheets)
+        return [(sheet_name, user_data) for sheet_name, user_data in cached]
+    return parse_user_sheets(excel_file)
+
+
+def parse_users_from_excel(excel_file: str, use_cache: bool = False):
+    """워크북에서 사용자 목록(UserRecord) 파싱 (실패 시 예외 발생)"""
+    sheets = load_user_sheets(excel_file, use_cache=use_cache)
+    users = [UserRecord.from_dict(user_data) for _, user_data in sheets if user_data]
+    report_unknown_headers(users, os.path.basename(excel_file))
+    return users
+
+
+def is_raw_readable(excel_file: str) -> bool:
+    """원시 xlsx 리더로 읽을 수 있는 파일인지 (zip 기반 xlsx/xlsm)"""
+    try:
+        return zipfile.is_zipfile(excel_file)
+    except OSError:
+        return False
+
+
+def iter_sheet_cells(excel_file: str, sheet_names=None):
+    """xlsx 는 원시 리더(pandas/openpyxl 미사용), 그 외는 openpyxl(.xls 는 pandas) 로 셀 쌍 반환"""
+    if is_raw_readable(excel_file):
+        return iter_user_sheet_cells_raw(excel_file, sheet_names)
+    return iter_user_sheet_cells(excel_file, sheet_names)
+
+
+def parse_user_sheets(excel_file: str, sheet_names=None):
+    """고객 시트를 파싱해 [(시트명, 사용자 데이터), ...] 반환 (데이터가 빈 시트 포함)
+
+    xlsx 는 M/N 열만 스트리밍하는 원시 리더를 쓰고, 그 외 파일만 openpyxl + pandas 열 단위 경로를 쓴다.
+    """
+    if is_raw_readable(excel_file):
+        return parse_user_sheets_raw(excel_file, sheet_names)
+    return parse_user_sheets_columnar(excel_file, sheet_names)
+
+
+def parse_user_sheets_columnar(excel_file: str, sheet_names=None):
+    """openpyxl(.xls 는 pandas) 로 읽은 셀을 pandas 열 단위로 정리 (원시 리더를 못 쓰는 파일용)"""
+    return build_user_data_columnar(iter_user_sheet_cells(excel_file, sheet_names))
+
+
+def build_user_data_columnar(sheet_cells):
+    """[(시트명, [(필드명, 값), ...]), ...] → [(시트명, 사용자 데이터), ...] (extract_user_fields 열 단위 규칙)"""
+    import pandas as pd
+    from working_excel_reader import extract_user_fields, warn_missing_fields
+    # 전체 시트의 필드명/값을 열로 모아 한 번에 정리
+    parsed_sheets = []
+    sheet_col, field_col, value_col = [], [], []
+    for sheet_name, cells in sheet_cells:
+        parsed_sheets.append(sheet_name)
+        sheet_col.extend([sheet_name] * len(cells))
+        for name, value in cells:
+            field_col.append(name)
+            value_col.append(value)
+    frame = extract_user_fields(pd.DataFrame(
+        {'sheet': sheet_col, 'field': field_col, 'value': value_col}, dtype=object
+    ))
+
+    by_sheet = {name: {} for name in parsed_sheets}
+    for sheet_name, field, value in zip(frame['sheet'], frame['field'], frame['value']):
+        by_sheet[sheet_name][field] = value
+    parsed = []
+    for sheet_name, user_data in by_sheet.items():
+        user_data = canonicalize_keys(user_data)
+        warn_missing_fields(user_data, sheet_name)
+        parsed.append((sheet_name, user_data))
+    return parsed
+
+
+def cached_users_from_excel(excel_file: str):
+    """캐시 히트면 전체 사용자 목록(UserRecord), 아니면 None (파싱하지 않음)
+
+    스트리밍 실행 전에 목록 전체를 알 수 있는 경우에만 사전 검증 표를 먼저 보여 주는 용도.
+    """
+    try:
+        cached = get_workbook_cache().get(excel_file)
+    except Exception:
+        return None
+    if cached is None:
+        return None
+    return [UserRecord.from_dict(user_data) for _, user_data in cached if user_data]
+
+
+_STREAM_DONE = object()
+
+
+def iter_users_from_excel(excel_file: str, background: bool = True, use_cache: bool = True):
+    """시트가 파싱되는 즉시 사용자 데이터를 하나씩 반환하는 제너레이터
+
+    전체 목록을 기다리지 않고 첫 고객의 브라우저 작업을 시작할 수 있도록
+    background=True 이면 별도 스레드가 워크북을 읽어 큐로 넘긴다.
+    캐시 히트면 저장된 결과를 바로 반환한다. 실패 시 예외는 소비하는 쪽에서 발생한다.
+    """
+    if use_cache:
+        cached = get_workbook_cache().get(excel_file)
+        if cached is not None:
+            print(f"[CACHE] 캐시 사용: {os.path.basename(excel_file)}")
+            for _, user_data in cached:
+                if user_data:
+                    yield UserRecord.from_dict(user_data)
+            return
+
+    if not background:
+        for _, user_data in _iter_parsed_sheets(excel_file, use_cache):
+            if user_data:
+                yield UserRecord.from_dict(user_data)
+        return
+
+    results = queue.Queue(maxsize=16)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for _, item in _iter_parsed_sheets(excel_file, use_cache):
+                if not item:
+                    continue
+                if not offer(UserRecord.from_dict(item)):
+                    return
+            offer(_STREAM_DONE)
+        except Exception as e:
+            offer(e)
+
+    def offer(item) -> bool:
+        """소비 쪽이 멈추면(stop) 큐가 가득 차 있어도 기다리지 않고 False"""
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    producer = threading.Thread(target=produce, name="excel-stream", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = results.get()
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # 소비 쪽이 중간에 멈추면 생산 스레드도 정리
+        stop.set()
+
+
+def _iter_parsed_sheets(excel_file: str, use_cache: bool):
+    """시트 단위로 정리한 (시트명, 사용자 데이터) (스트리밍용)
+
+    규칙 경로는 일괄 로드(parse_user_sheets)와 같다: xlsx 는 원시 리더 + 스칼라 규칙,
+    그 외 파일은 시트마다 열 단위 규칙(build_user_data_columnar).
+    끝까지 읽으면 결과를 캐시에 저장한다.
+    """
+    from ev_automation.field_rules import build_user_data
+    raw = is_raw_readable(excel_file)
+    sheets = []
+    for sheet_name, cells in iter_sheet_cells(excel_file):
+        if raw:
+            user_data = build_user_data(cells, sheet_name)
+        else:
+            user_data = build_user_data_columnar([(sheet_name, cells)])[0][1]
+        sheets.append([sheet_name, user_data])
+        yield sheet_name, user_data
+    report_unknown_headers((user_data for _, user_data in sheets), os.path.basename(excel_file))
+    if use_cache:
+        try:
+            get_workbook_cache().put(excel_file, sheets)
+        except Exception as e:
+            print(f"[WARNING] 워크북 캐시 저장 실패: {e}")
+
+
+def load_users_from_excel(excel_file: str, use_cache: bool = False):
+    try:
+        return parse_users_from_excel(excel_file, use_cache=use_cache)
+    except Exception:
+        # fallback 샘플
+        sample_users = [
+            {
+                '성명': '장원', '계약일자': '2025-08-16', '신청유형': '개인',
+                '생년월일': '1990-01-01', '성별': '여자', '신청차종': 'EV3 스탠다드',
+                '신청대수': '1', '출고예정일자': '2025-08-29',
+                '주소': '충청북도 제천시 의림지로 171', '휴대전화': '010-9199-6844',
+                '이메일': '.', '전화': '.', '우선순위': '사회계층 Y. 다자녀가구. 2자녀 클릭'
+            },
+            {
+                '성명': '전문수', '계약일자': '2025-08-18', '신청유형': '개인',
+                '생년월일': '1990-01-01', '성별': '남자', '신청차종': '레이EV 4인승',
+                '신청대수': '1', '출고예정일자': '2025-08-29',
+                '주소': '인천시 강저로 57번 19', '휴대전화': '010-9557-5256',
+                '이메일': '.', '전화': '.', '우선순위': ''
+            }
+        ]
+        return [UserRecord.from_dict(user_data) for user_data in sample_users]
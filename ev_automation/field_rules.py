@@ -0,0 +1,83 @@
+"""
+고객 시트 필드 규칙 - 셀 값 문자열 변환, 필드별 보정, 필수 필드 확인
+
+pandas 없이 쓸 수 있는 스칼라 규칙만 모아 두었다 (원시 xlsx 리더/스트리밍 경로용).
+열 단위 버전은 working_excel_reader.extract_user_fields 참고.
+"""
+
+from datetime import datetime, timedelta
+
+from ev_automation.address_index import normalize_address
+from ev_automation.header_alias import canonicalize_keys, resolve_header
+
+REQUIRED_FIELDS = ['성명', '휴대전화', '생년월일', '성별', '주소']
+
+
+def cell_to_text(value) -> str:
+    """셀 값을 문자열로 변환 (빈 셀/NaN은 '', 정수형 실수는 정수 문자열)"""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return ""
+        if value.is_integer():
+            return str(int(value))
+    return str(value)
+
+
+def normalize_field_value(field_name: str, field_value: str) -> str:
+    """필드별 특수 처리 (생년월일 Excel 날짜, 성별 약어, 주소 시도/시군구 보정)"""
+    if field_name == '생년월일':
+        # Excel 날짜 형식을 변환
+        try:
+            if field_value.isdigit():
+                excel_date = int(field_value)
+                # Excel의 1900년 기준 날짜를 변환
+                date_obj = datetime(1900, 1, 1) + timedelta(days=excel_date-2)
+                field_value = date_obj.strftime('%Y-%m-%d')
+        except:
+            pass
+
+    elif field_name == '성별':
+        # '여'를 '여자'로 변환
+        if field_value == '여':
+            field_value = '여자'
+        elif field_value == '남':
+            field_value = '남자'
+
+    elif field_name == '주소':
+        # 시도 약칭/누락 보정 (행정구역 인덱스)
+        field_value = normalize_address(field_value)
+
+    return field_value
+
+
+def build_user_data(pairs, sheet_name):
+    """(필드명, 값) 셀 쌍 목록으로 사용자 데이터 생성
+
+    pairs 는 시트의 열 12(필드명)/열 13(값)을 헤더 행 다음부터 순서대로 담은 값이다.
+    필드명 변형('공동명의자 수', '공동1_성명' 등)은 표준 키로 바꾼다 (header_alias).
+    """
+    user_data = {}
+
+    for raw_name, raw_value in pairs:
+        field_name = cell_to_text(raw_name)
+        field_value = cell_to_text(raw_value)
+
+        if field_name and field_value and field_name != 'nan':
+            canonical = resolve_header(field_name)[0] or field_name
+            user_data[field_name] = normalize_field_value(canonical, field_value)
+
+    user_data = canonicalize_keys(user_data)
+
+    # 필수 필드 확인
+    warn_missing_fields(user_data, sheet_name)
+
+    return user_data
+
+
+def warn_missing_fields(user_data, sheet_name):
+    """필수 필드 누락 경고"""
+    missing_fields = [field for field in REQUIRED_FIELDS if field not in user_data]
+    if missing_fields:
+        print(f"[WARNING] {sheet_name} 시트에서 누락된 필드: {missing_fields}")
@@ -1,11 +1,21 @@
+import json
 import time
 import random
-import re
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
+from ev_automation.fill_script import (
+    PLAYWRIGHT_FILL_JS, build_fill_payload, field_payload, gender_radio_id, summarize_fill_results
+)
+from ev_automation.fill_plan import DEPENDENCY_TIMEOUT, FILL_PLAN, describe_plan, plan_values, stage_steps
+from ev_automation.model_catalog import pick_model_option
+from ev_automation.locator import locate_all, locate_element
+from ev_automation.page_helpers import call_page_helper
+from ev_automation.waits import any_of, network_idle, wait_for
+from ev_automation.priority_flags import SELENIUM_APPLY_PRIORITY_JS
+from ev_automation.user_record import UserRecord
 
 def debug_model_selection(driver, model: str) -> dict:
     """
@@ -30,12 +40,13 @@ def debug_model_selection(driver, model: str) -> dict:
     }
     
     try:
-        from selenium.webdriver.common.by import By
         from selenium.webdriver.support.ui import Select
         
         # 드롭다운 요소 찾기
         try:
-            model_select = driver.find_element(By.ID, 'model_cd')
+            model_select = locate_element(driver, '#model_cd')
+            if model_select is None:
+                raise LookupError("model_cd 요소 없음")
             debug_info['element_found'] = True
             debug_info['element_id'] = model_select.get_attribute('id')
             debug_info['element_name'] = model_select.get_attribute('name')
@@ -57,26 +68,18 @@ def debug_model_selection(driver, model: str) -> dict:
         except Exception as e:
             debug_info['error'] = f"드롭다운 요소 찾기 실패: {e}"
             
-            # 대안: 다른 선택자로 찾기
-            try:
-                # name 속성으로 찾기
-                model_select = driver.find_element(By.NAME, "model_cd")
+            # 대안: name 속성 / 부분 일치 선택자로 한 번에 찾기
+            model_select = locate_element(driver, ["[name='model_cd']", "select[name*='model']"])
+            if model_select:
                 debug_info['element_found'] = True
                 debug_info['element_name'] = model_select.get_attribute('name')
                 debug_info['current_value'] = model_select.get_attribute('value')
-            except:
-                try:
-                    # CSS 선택자로 찾기
-                    model_select = driver.find_element(By.CSS_SELECTOR, "select[name*='model']")
-                    debug_info['element_found'] = True
-                    debug_info['element_name'] = model_select.get_attribute('name')
-                    debug_info['current_value'] = model_select.get_attribute('value')
-                except Exception as e2:
-                    debug_info['error'] = f"모든 방법으로 찾기 실패: {e2}"
+            else:
+                debug_info['error'] = "모든 방법으로 찾기 실패: model_cd 요소 없음"
         
         # 페이지의 모든 select 요소 확인
         try:
-            all_selects = driver.find_elements(By.TAG_NAME, "select")
+            all_selects = locate_all(driver, "select")
             debug_info['all_selects'] = []
             for i, select in enumerate(all_selects):
                 select_info = {
@@ -84,7 +87,7 @@ def debug_model_selection(driver, model: str) -> dict:
                     'id': select.get_attribute('id'),
                     'name': select.get_attribute('name'),
                     'class': select.get_attribute('class'),
-                    'options_count': len(select.find_elements(By.TAG_NAME, "option"))
+                    'options_count': select.get_property('length')
                 }
                 debug_info['all_selects'].append(select_info)
         except Exception as e:
@@ -109,26 +112,8 @@ def fill_readonly_field_selenium(driver, field_id: str, value: str) -> bool:
         성공 여부
     """
     try:
-        # JavaScript 실행으로 readonly 필드 처리 + 필수 이벤트 디스패치 (arguments 사용)
-        script = """
-        const field = document.getElementById(arguments[0]);
-        if (field) {
-            field.removeAttribute('readonly');
-            try {
-                const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype,'value').set;
-                setter.call(field, arguments[1]);
-            } catch(e) {
-                field.value = arguments[1];
-            }
-            try { field.dispatchEvent(new Event('input', { bubbles: true })); } catch(e) {}
-            try { field.dispatchEvent(new Event('change', { bubbles: true })); } catch(e) {}
-            field.setAttribute('readonly', 'readonly');
-            return true;
-        }
-        return false;
-        """
-        result = driver.execute_script(script, field_id, value)
-        return bool(result)
+        # 페이지 헬퍼(window.__ev.setValue)로 readonly 해제 → 네이티브 setter → input/change 발화 → 원복
+        return bool(call_page_helper(driver, 'setValue', f'#{field_id}', value))
     except Exception as e:
         print(f"❌ {field_id} 필드 입력 실패: {e}")
         return False
@@ -298,64 +283,6 @@ def pick_date(driver, input_css: str, yyyy: int, mm: int, dd: int) -> bool:
     except Exception:
         return False
 
-def format_phone_number(raw: str) -> str:
-    """휴대폰/전화 마스크 적용: 010-1234-5678 형태로 보정"""
-    if not raw:
-        return raw
-    digits = re.sub(r"\D", "", raw)
-    if len(digits) == 11 and digits.startswith("010"):
-        return f"010-{digits[3:7]}-{digits[7:]}"
-    if len(digits) == 10:
-        return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
-    return raw
-
-def normalize_date_string(date_text: str) -> str | None:
-    """여러 날짜 포맷을 YYYY-MM-DD로 정규화. 실패 시 None"""
-    if not date_text:
-        return None
-    s = str(date_text).strip()
-    
-    # 0) Excel 날짜 숫자 처리 (예: 29269 → 1980-02-18)
-    try:
-        import datetime
-        excel_date_num = float(s)
-        if 1 <= excel_date_num <= 100000:  # Excel 날짜 범위
-            # Excel의 기준일 (1900-01-01)부터 계산
-            base_date = datetime.datetime(1900, 1, 1)
-            target_date = base_date + datetime.timedelta(days=int(excel_date_num) - 2)  # Excel은 1900년을 윤년으로 계산
-            return target_date.strftime("%Y-%m-%d")
-    except (ValueError, OverflowError):
-        pass
-    
-    # 3) 한국어 날짜 형식: "1980년 02월 18일", "1980년 2월 18일" 등
-    korean_pattern = r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일"
-    korean_match = re.search(korean_pattern, s)
-    if korean_match:
-        try:
-            y, m, d = int(korean_match.group(1)), int(korean_match.group(2)), int(korean_match.group(3))
-            return f"{y:04d}-{m:02d}-{d:02d}"
-        except Exception:
-            pass
-    
-    # 1) YYYY-MM-DD / YYYY.MM.DD / YYYY/MM/DD
-    for sep in ("-", ".", "/"):
-        parts = s.split(sep)
-        if len(parts) == 3 and all(parts):
-            try:
-                y, m, d = int(parts[0]), int(parts[1]), int(parts[2])
-                return f"{y:04d}-{m:02d}-{d:02d}"
-            except Exception:
-                pass
-    # 2) 8자리 숫자 YYYYMMDD
-    digits = re.sub(r"\D", "", s)
-    if len(digits) == 8:
-        try:
-            y, m, d = int(digits[:4]), int(digits[4:6]), int(digits[6:])
-            return f"{y:04d}-{m:02d}-{d:02d}"
-        except Exception:
-            return None
-    return None
-
 def human_like_select(driver, element_id, value, description=""):
     """
     사람처럼 자연스럽게 드롭다운을 선택하는 함수
@@ -458,7 +385,221 @@ def human_like_fill_field(driver, field_id, value, description="", field_type="t
         print(f"❌ {description} 입력 실패: {e}")
         return False
 
-def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = True) -> bool:
+def fill_joint_owner_selenium(driver, record) -> None:
+    """공동명의자 수 입력 → 행 생성 대기 → 첫 행 성명/생년월일 입력 (비동기 스크립트 한 번)"""
+    try:
+        # 공동명의자 컬럼 변형은 레코드 생성 시 해석 완료
+        joint_cnt = record.joint_count
+
+        # 엑셀에 공동명의자 수가 없으면 처리하지 않음
+        if joint_cnt is None or joint_cnt <= 0:
+            print("📝 공동명의자 수가 없으므로 공동명의자 처리 건너뜀")
+            # return 제거 - 나머지 필드 입력은 계속 진행
+        else:
+            desired_count = joint_cnt
+            nm_val = record.joint_name or None
+            br_val = record.joint_birth or None
+
+            print(f"🧩 공동명의자 처리 시작: 목표 {desired_count}명 (엑셀: {joint_cnt})")
+            print(f"📝 이름: {nm_val}, 생년월일: {br_val}")
+
+            # 디버깅: 사용 가능한 키들 출력
+            print("🔍 사용 가능한 엑셀 키들:")
+            for key, value in (record.extra or {}).items():
+                if '공동' in key or 'joint' in key.lower():
+                    print(f"  - {key}: {value}")
+
+            # execute_async_script로 타이밍 문제 해결
+            js_async_joint = """
+            const desired = arguments[0];
+            const nm = arguments[1];
+            const birth = arguments[2];
+            const done = arguments[arguments.length - 1]; // async callback
+
+            function setCountAndOpen(){
+              const cnt = document.querySelector('#jn_cnt');
+              if(!cnt){ 
+                console.log('❌ #jn_cnt not found');
+                return done('fail: #jn_cnt not found'); 
+              }
+              try{ cnt.removeAttribute('disabled'); cnt.removeAttribute('readonly'); }catch(e){}
+              cnt.value = String(desired);
+              try{ cnt.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
+              try{ cnt.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
+              console.log('✏️ 공동명의자 수=' + String(desired) + ' 입력');
+
+              const btn = document.querySelector('#t_jnInfo1 button.btn-black[type="button"], #t_jnInfo1 button[onclick*="createNewJointInfo"]');
+              if(btn) { 
+                try{ btn.click(); console.log('✅ 확인 버튼 클릭'); }catch(e){ console.log('❌ 확인 버튼 클릭 실패:', e); } 
+              }
+              try{ 
+                if(typeof window.createNewJointInfo==='function') {
+                  window.createNewJointInfo(); 
+                  console.log('✅ createNewJointInfo() 직접 호출'); 
+                }
+              }catch(e){}
+            }
+
+            function waitRows(n, cb){
+              const body = document.querySelector('#jnBody');
+              if (!body) {
+                console.log('❌ #jnBody not found');
+                return cb('fail: #jnBody not found');
+              }
+
+              const current = () => body.querySelectorAll('tr.c_jnInfo').length;
+              console.log('현재 행 수:', current(), '목표:', n);
+
+              if (current() >= n) {
+                console.log('✅ 행 생성 완료');
+                return cb(null);
+              }
+
+              const obs = new MutationObserver(()=>{
+                const newCount = body.querySelectorAll('tr.c_jnInfo').length;
+                console.log('DOM 변경 감지, 현재 행 수:', newCount);
+                if (newCount >= n){ 
+                  obs.disconnect(); 
+                  console.log('✅ 목표 행 수 달성');
+                  cb(null); 
+                }
+              });
+              obs.observe(body, {childList:true, subtree:true});
+
+              setTimeout(()=>{ 
+                obs.disconnect(); 
+                const finalCount = body.querySelectorAll('tr.c_jnInfo').length;
+                console.log('타임아웃, 최종 행 수:', finalCount);
+                cb(finalCount>=n ? null : 'fail: timeout rows'); 
+              }, 4000);
+            }
+
+            function fillFirst(){
+              const row = document.querySelector('#jnBody tr.c_jnInfo');
+              if(!row) {
+                console.log('❌ 공동명의자 행을 찾지 못함');
+                return 'fail: no row';
+              }
+
+              const nameInput = row.querySelector('input[name="jn_name"]');
+              const birthInput = row.querySelector('input[name="jn_birth"]');
+
+              console.log('🔍 찾은 입력 필드들:');
+              console.log('- nameInput:', nameInput);
+              console.log('- birthInput:', birthInput);
+
+              if (nameInput && nm){
+                try{ nameInput.removeAttribute('readonly'); }catch(e){}
+                nameInput.value = nm;
+                try{ nameInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
+                try{ nameInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
+                console.log('✏️ 성명=' + nm + ' 입력');
+              }
+
+              if (birthInput && birth){
+                try{ birthInput.removeAttribute('readonly'); }catch(e){}
+                try{ birthInput.removeAttribute('disabled'); }catch(e){}
+                birthInput.value = birth;
+                try{ birthInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
+                try{ birthInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
+                console.log('✏️ 생년월일=' + birth + ' 입력');
+              } else {
+                // 생년월일 필드를 찾지 못한 경우 다른 선택자들 시도
+                console.log('⚠️ 기본 생년월일 필드를 찾지 못함, 다른 선택자 시도...');
+                const altBirthInputs = [
+                  row.querySelector('input[name*="birth"]'),
+                  row.querySelector('input[id*="birth"]'),
+                  row.querySelector('input[name*="birthday"]'),
+                  row.querySelector('input[id*="birthday"]'),
+                  row.querySelector('input[type="date"]'),
+                  row.querySelector('input[type="text"]')
+                ];
+
+                for(let i = 0; i < altBirthInputs.length; i++) {
+                  const altInput = altBirthInputs[i];
+                  if(altInput && altInput !== nameInput) {
+                    console.log('🔍 대체 생년월일 필드 발견:', altInput.name || altInput.id || altInput.type);
+                    try{ altInput.removeAttribute('readonly'); }catch(e){}
+                    try{ altInput.removeAttribute('disabled'); }catch(e){}
+                    altInput.value = birth;
+                    try{ altInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
+                    try{ altInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
+                    console.log('✏️ 생년월일(대체)=' + birth + ' 입력');
+                    break;
+                  }
+                }
+              }
+
+              // 백업: 직접 input 선택자로도 시도
+              if(!birthInput || !birth) {
+                console.log('🔍 백업 생년월일 필드 탐색...');
+                const backupBirthInputs = [
+                  document.querySelector('input[name="jn_birth"]'),
+                  document.querySelector('input[name*="birth"]'),
+                  document.querySelector('input[id*="birth"]'),
+                  document.querySelector('input[name*="birthday"]'),
+                  document.querySelector('input[id*="birthday"]')
+                ];
+
+                for(let i = 0; i < backupBirthInputs.length; i++) {
+                  const backupInput = backupBirthInputs[i];
+                  if(backupInput && backupInput !== nameInput) {
+                    console.log('🔍 백업 생년월일 필드 발견:', backupInput.name || backupInput.id);
+                    try{ backupInput.removeAttribute('readonly'); }catch(e){}
+                    try{ backupInput.removeAttribute('disabled'); }catch(e){}
+                    backupInput.value = birth;
+                    try{ backupInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
+                    try{ backupInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
+                    console.log('✏️ 생년월일(백업)=' + birth + ' 입력');
+                    break;
+                  }
+                }
+              }
+
+              return 'ok';
+            }
+
+            try{
+              setCountAndOpen();
+              waitRows(Math.max(1, Number(desired)||1), (err)=>{
+                if (err) {
+                  console.log('❌ 행 대기 실패:', err);
+                  return done(err);
+                }
+                const res = fillFirst();
+                console.log('✅ 공동명의자 입력 완료:', res);
+                done(res);
+              });
+            }catch(e){
+              console.log('❌ 전체 처리 실패:', e);
+              done('fail: ' + (e && e.message ? e.message : e));
+            }
+            """
+
+            # 스크립트 타임아웃 설정 및 실행
+            # 이전 스크립트 타임아웃은 끝나면 되돌림 (call_page_helper_async 와 같은 방식)
+            try:
+                previous_timeout = driver.timeouts.script
+            except Exception:
+                previous_timeout = None
+            driver.set_script_timeout(15)  # 15초 타임아웃
+            try:
+                result = driver.execute_async_script(js_async_joint, desired_count, nm_val, br_val)
+            finally:
+                if previous_timeout is not None:
+                    try:
+                        driver.set_script_timeout(previous_timeout)
+                    except Exception:
+                        pass
+            print(f"🎯 공동명의자 처리 결과: {result}")
+
+            if result and result.startswith('fail:'):
+                print(f"⚠️ 공동명의자 처리 실패: {result}")
+
+    except Exception as e:
+        print("⚠️ 공동명의자 처리 중 오류:", e)
+
+def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = True, single_call: bool = False) -> bool:
     """
     사람처럼 자연스럽게 모든 필드에 데이터 입력
     자동화 감지를 우회하기 위해 랜덤한 지연시간과 타이핑 속도 적용
@@ -466,13 +607,21 @@ def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = T
     Args:
         driver: Selenium WebDriver 인스턴스
         user_data: 입력할 사용자 데이터
+        single_call: True 면 필드별 입력 대신 입력 계획(fill_plan) 단계별로 한 번씩 입력 (fill_fields_planned)
         
     Returns:
         성공 여부
     """
     try:
         print("🚀 사람처럼 자연스럽게 필드 자동 입력 시작...")
-        print(f"📊 입력할 데이터: {user_data}")
+        # 로드 시점에 정규화된 레코드 사용 (dict 가 오면 한 번만 변환)
+        record = UserRecord.coerce(user_data)
+        print(f"📊 입력할 데이터: {record}")
+
+        if single_call:
+            ensure_edit_mode(driver)
+            # 신청유형 → 공동명의자/신청차종, 사회계층 → 유형/자녀수 순서는 입력 계획이 맞춤
+            return fill_fields_planned(driver, record)['ok']
         
         def pause(min_s: float, max_s: float) -> None:
             if fast_mode:
@@ -480,19 +629,19 @@ def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = T
             else:
                 time.sleep(random.uniform(min_s, max_s))
         
-        # 데이터 추출
-        name = user_data.get('성명', '')
-        phone = format_phone_number(user_data.get('휴대전화', ''))
-        email = user_data.get('이메일', '')
-        tel = format_phone_number(user_data.get('전화', ''))
-        addr = user_data.get('주소', '')
-        addr_detail = user_data.get('상세주소', '')
-        contract = normalize_date_string(user_data.get('계약일자', '2025-01-15')) or '2025-01-15'
-        birth = user_data.get('생년월일', '1990-01-01')
-        delivery = normalize_date_string(user_data.get('출고예정일자', '2025-02-15')) or '2025-02-15'
-        gender = user_data.get('성별', '남자')
-        model = user_data.get('신청차종', '')
-        count = user_data.get('신청대수', '1')
+        # 데이터 추출 (전화번호/날짜는 레코드 생성 시 정규화 완료)
+        name = record.name
+        phone = record.phone
+        email = record.email
+        tel = record.tel
+        addr = record.address
+        addr_detail = record.address_detail
+        contract = record.contract_date or '2025-01-15'
+        birth = record.birth_date or '1990-01-01'
+        delivery = record.delivery_date or '2025-02-15'
+        gender = record.gender or '남자'
+        model = record.model
+        count = record.count or '1'
         
         # 입력 결과 추적
         input_results = {}
@@ -510,9 +659,9 @@ def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = T
             input_results['신청유형(초기)'] = success_kind_init
             pause(0.1, 0.2)
             
-            # 신청유형 선택 완료 후 충분한 대기
+            # 신청유형 선택 후 화면 갱신(요청 포함)이 끝나면 바로 진행
             print("⏳ 신청유형 선택 완료 대기 중...")
-            time.sleep(1.0)  # 충분한 대기 시간
+            wait_for(driver, network_idle(200), timeout=3.0, budget=1.0, label='신청유형 선택')
             
         except Exception as e:
             print(f"❌ 신청유형 초기 선택 실패: {e}")
@@ -521,312 +670,20 @@ def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = T
         # 0.1단계: 우선순위 매핑은 공동명의자 처리 후에 적용
 
         # 0.2단계: 공동명의자 처리 (개인 신청에서만) - 신청유형 선택 완료 후
-        try:
-            joint_cnt = None
-            # 다양한 키 인식
-            for k in ['공동명의자수', '공동명의자 수', '공동명의 수', '공동수', '공동명의인수']:
-                if user_data.get(k) not in (None, ''):
-                    try:
-                        joint_cnt = int(str(user_data.get(k)).strip())
-                        break
-                    except Exception:
-                        pass
-            
-            # 엑셀에 공동명의자 수가 없으면 처리하지 않음
-            if joint_cnt is None or joint_cnt <= 0:
-                print("📝 공동명의자 수가 없으므로 공동명의자 처리 건너뜀")
-                # return 제거 - 나머지 필드 입력은 계속 진행
-            else:
-                desired_count = joint_cnt
-         
-                # 첫 번째 공동명의자 이름과 생년월일 데이터 준비
-                nm_val = None
-                br_val = None
-                
-                # 다양한 키로 이름 찾기
-                nm_keys = ['공동1_성명', '공동명의자1_성명', '공동1 성명', '공동명의자 성명', '공동명의자성명', '공동 성명', '공동성명', '공동명의자 이름']
-                for k in nm_keys:
-                    if user_data.get(k):
-                        nm_val = user_data.get(k)
-                        break
-                
-                # 다양한 키로 생년월일 찾기
-                br_keys = ['공동1_생년월일', '공동명의자1_생년월일', '공동1 생년월일', '공동명의자 생년월일', '공동명의자생년월일', '공동 생년월일', '공동생년월일']
-                for k in br_keys:
-                    if user_data.get(k):
-                        br_val = normalize_date_string(user_data.get(k))
-                        break
-                
-                # 정규화된 키로도 시도
-                if not nm_val or not br_val:
-                    try:
-                        import re as _re
-                        normalized = { _re.sub(r"\s+", "", k): k for k in user_data.keys() }
-                        if not nm_val:
-                            for alias in ['공동명의자성명','공동성명','공동명의자이름']:
-                                if alias in normalized:
-                                    v = user_data.get(normalized[alias])
-                                    if v not in (None, ''):
-                                        nm_val = v
-                                        break
-                        if not br_val:
-                            for alias in ['공동명의자생년월일','공동생년월일']:
-                                if alias in normalized:
-                                    v = user_data.get(normalized[alias])
-                                    if v not in (None, ''):
-                                        br_val = normalize_date_string(v)
-                                        break
-                    except Exception:
-                        pass
-    
-                print(f"🧩 공동명의자 처리 시작: 목표 {desired_count}명 (엑셀: {joint_cnt})")
-                print(f"📝 이름: {nm_val}, 생년월일: {br_val}")
-                
-                # 디버깅: 사용 가능한 키들 출력
-                print("🔍 사용 가능한 엑셀 키들:")
-                for key, value in user_data.items():
-                    if '공동' in key or 'joint' in key.lower():
-                        print(f"  - {key}: {value}")
-                
-                # 디버깅: 생년월일 찾기 과정 상세 출력
-                print("🔍 생년월일 찾기 과정:")
-                for k in br_keys:
-                    found_value = user_data.get(k)
-                    print(f"  - {k}: {found_value}")
-                    if found_value:
-                        normalized = normalize_date_string(found_value)
-                        print(f"    → 정규화: {normalized}")
-                
-                # execute_async_script로 타이밍 문제 해결
-                js_async_joint = """
-                const desired = arguments[0];
-                const nm = arguments[1];
-                const birth = arguments[2];
-                const done = arguments[arguments.length - 1]; // async callback
-
-                function setCountAndOpen(){
-                  const cnt = document.querySelector('#jn_cnt');
-                  if(!cnt){ 
-                    console.log('❌ #jn_cnt not found');
-                    return done('fail: #jn_cnt not found'); 
-                  }
-                  try{ cnt.removeAttribute('disabled'); cnt.removeAttribute('readonly'); }catch(e){}
-                  cnt.value = String(desired);
-                  try{ cnt.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
-                  try{ cnt.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
-                  console.log('✏️ 공동명의자 수=' + String(desired) + ' 입력');
-
-                  const btn = document.querySelector('#t_jnInfo1 button.btn-black[type="button"], #t_jnInfo1 button[onclick*="createNewJointInfo"]');
-                  if(btn) { 
-                    try{ btn.click(); console.log('✅ 확인 버튼 클릭'); }catch(e){ console.log('❌ 확인 버튼 클릭 실패:', e); } 
-                  }
-                  try{ 
-                    if(typeof window.createNewJointInfo==='function') {
-                      window.createNewJointInfo(); 
-                      console.log('✅ createNewJointInfo() 직접 호출'); 
-                    }
-                  }catch(e){}
-                }
-
-                function waitRows(n, cb){
-                  const body = document.querySelector('#jnBody');
-                  if (!body) {
-                    console.log('❌ #jnBody not found');
-                    return cb('fail: #jnBody not found');
-                  }
-
-                  const current = () => body.querySelectorAll('tr.c_jnInfo').length;
-                  console.log('현재 행 수:', current(), '목표:', n);
-                  
-                  if (current() >= n) {
-                    console.log('✅ 행 생성 완료');
-                    return cb(null);
-                  }
-
-                  const obs = new MutationObserver(()=>{
-                    const newCount = body.querySelectorAll('tr.c_jnInfo').length;
-                    console.log('DOM 변경 감지, 현재 행 수:', newCount);
-                    if (newCount >= n){ 
-                      obs.disconnect(); 
-                      console.log('✅ 목표 행 수 달성');
-                      cb(null); 
-                    }
-                  });
-                  obs.observe(body, {childList:true, subtree:true});
-                  
-                  setTimeout(()=>{ 
-                    obs.disconnect(); 
-                    const finalCount = body.querySelectorAll('tr.c_jnInfo').length;
-                    console.log('타임아웃, 최종 행 수:', finalCount);
-                    cb(finalCount>=n ? null : 'fail: timeout rows'); 
-                  }, 4000);
-                }
-
-                function fillFirst(){
-                  const row = document.querySelector('#jnBody tr.c_jnInfo');
-                  if(!row) {
-                    console.log('❌ 공동명의자 행을 찾지 못함');
-                    return 'fail: no row';
-                  }
-
-                  const nameInput = row.querySelector('input[name="jn_name"]');
-                  const birthInput = row.querySelector('input[name="jn_birth"]');
-                  
-                  console.log('🔍 찾은 입력 필드들:');
-                  console.log('- nameInput:', nameInput);
-                  console.log('- birthInput:', birthInput);
-
-                  if (nameInput && nm){
-                    try{ nameInput.removeAttribute('readonly'); }catch(e){}
-                    nameInput.value = nm;
-                    try{ nameInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
-                    try{ nameInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
-                    console.log('✏️ 성명=' + nm + ' 입력');
-                  }
-                  
-                  if (birthInput && birth){
-                    try{ birthInput.removeAttribute('readonly'); }catch(e){}
-                    try{ birthInput.removeAttribute('disabled'); }catch(e){}
-                    birthInput.value = birth;
-                    try{ birthInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
-                    try{ birthInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
-                    console.log('✏️ 생년월일=' + birth + ' 입력');
-                  } else {
-                    // 생년월일 필드를 찾지 못한 경우 다른 선택자들 시도
-                    console.log('⚠️ 기본 생년월일 필드를 찾지 못함, 다른 선택자 시도...');
-                    const altBirthInputs = [
-                      row.querySelector('input[name*="birth"]'),
-                      row.querySelector('input[id*="birth"]'),
-                      row.querySelector('input[name*="birthday"]'),
-                      row.querySelector('input[id*="birthday"]'),
-                      row.querySelector('input[type="date"]'),
-                      row.querySelector('input[type="text"]')
-                    ];
-                    
-                    for(let i = 0; i < altBirthInputs.length; i++) {
-                      const altInput = altBirthInputs[i];
-                      if(altInput && altInput !== nameInput) {
-                        console.log('🔍 대체 생년월일 필드 발견:', altInput.name || altInput.id || altInput.type);
-                        try{ altInput.removeAttribute('readonly'); }catch(e){}
-                        try{ altInput.removeAttribute('disabled'); }catch(e){}
-                        altInput.value = birth;
-                        try{ altInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
-                        try{ altInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
-                        console.log('✏️ 생년월일(대체)=' + birth + ' 입력');
-                        break;
-                      }
-                    }
-                  }
-                  
-                  // 백업: 직접 input 선택자로도 시도
-                  if(!birthInput || !birth) {
-                    console.log('🔍 백업 생년월일 필드 탐색...');
-                    const backupBirthInputs = [
-                      document.querySelector('input[name="jn_birth"]'),
-                      document.querySelector('input[name*="birth"]'),
-                      document.querySelector('input[id*="birth"]'),
-                      document.querySelector('input[name*="birthday"]'),
-                      document.querySelector('input[id*="birthday"]')
-                    ];
-                    
-                    for(let i = 0; i < backupBirthInputs.length; i++) {
-                      const backupInput = backupBirthInputs[i];
-                      if(backupInput && backupInput !== nameInput) {
-                        console.log('🔍 백업 생년월일 필드 발견:', backupInput.name || backupInput.id);
-                        try{ backupInput.removeAttribute('readonly'); }catch(e){}
-                        try{ backupInput.removeAttribute('disabled'); }catch(e){}
-                        backupInput.value = birth;
-                        try{ backupInput.dispatchEvent(new Event('input',{bubbles:true})); }catch(e){}
-                        try{ backupInput.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){}
-                        console.log('✏️ 생년월일(백업)=' + birth + ' 입력');
-                        break;
-                      }
-                    }
-                  }
-                  
-                  return 'ok';
-                }
-
-                try{
-                  setCountAndOpen();
-                  waitRows(Math.max(1, Number(desired)||1), (err)=>{
-                    if (err) {
-                      console.log('❌ 행 대기 실패:', err);
-                      return done(err);
-                    }
-                    const res = fillFirst();
-                    console.log('✅ 공동명의자 입력 완료:', res);
-                    done(res);
-                  });
-                }catch(e){
-                  console.log('❌ 전체 처리 실패:', e);
-                  done('fail: ' + (e && e.message ? e.message : e));
-                }
-                """
-                
-                # 스크립트 타임아웃 설정 및 실행
-                driver.set_script_timeout(15)  # 15초 타임아웃
-                result = driver.execute_async_script(js_async_joint, desired_count, nm_val, br_val)
-                print(f"🎯 공동명의자 처리 결과: {result}")
-                
-                if result and result.startswith('fail:'):
-                    print(f"⚠️ 공동명의자 처리 실패: {result}")
-
-        except Exception as e:
-            print("⚠️ 공동명의자 처리 중 오류:", e)
+        fill_joint_owner_selenium(driver, record)
         
-        # 0.3단계: 우선순위 매핑 적용 (사회계층, 다자녀, 생애최초 등)
+        # 0.3단계: 우선순위 매핑 적용 (사회계층, 다자녀, 생애최초 등) - 플래그는 로드 시 해석
         try:
-            priority_text = (user_data.get('우선순위') or '').strip()
-            if priority_text:
-                print("🛠️ 우선순위 매핑 적용 시도:", priority_text)
-                has_social = ('사회계층' in priority_text and ('Y' in priority_text or '예' in priority_text))
-                is_multi_child = ('다자녀' in priority_text)
-                child_count = '2' if '2자녀' in priority_text else ('3' if '3자녀' in priority_text else ('4' if '4자녀' in priority_text or '4자녀 이상' in priority_text else ''))
-                first_buy = ('생애최초' in priority_text)
-                improve_fd = ('미세먼지' in priority_text) or ('노후경유' in priority_text) or ('택시' in priority_text)
-                improve_detail1 = ('노후경유' in priority_text or '폐차' in priority_text)
-                improve_detail2 = ('택시' in priority_text)
-                exchange = ('폐차' in priority_text) or ('수출말소' in priority_text)
-
-                # 사회계층 유형 코드 매핑
-                social_kind = ''
-                if '국가유공' in priority_text: social_kind = '1'
-                elif '장애' in priority_text: social_kind = '2'
-                elif '다자녀' in priority_text: social_kind = '3'
-                elif '다문화' in priority_text: social_kind = '4'
-                elif ('기초생활' in priority_text) or ('차상위' in priority_text): social_kind = '5'
-                elif '소상공인' in priority_text: social_kind = '6'
-                elif '기타' in priority_text: social_kind = '9'
-
-                js = f"""
-				(function(){{
-				  const click = (id) => {{ const el = document.getElementById(id); if (!el) return false; try {{ el.click(); }} catch(e) {{ el.checked=true; }} try{{ el.dispatchEvent(new Event('change',{{bubbles:true}})); }}catch(e){{}} return true; }};
-				  const selectVal = (id, v) => {{ const el = document.getElementById(id); if (!el) return false; try{{ el.disabled=false; }}catch(e){{}} el.value=v; try{{ el.dispatchEvent(new Event('change',{{bubbles:true}})); }}catch(e){{}} return true; }};
-				  const show = (sel, flag) => {{ try{{ const el=document.querySelector(sel); if(el) el.style.display = flag? '' : 'none'; }}catch(e){{}} }};
-
-				  // 사회계층
-				  if ({str(has_social).lower()}) {{ click('social_yn1'); if ('{social_kind}') {{ selectVal('social_kind','{social_kind}'); }} if ('{child_count}') {{ selectVal('children_cnt','{child_count}'); }} }}
-
-				  // 생애최초
-				  if ({str(first_buy).lower()}) {{ click('first_buy_yn1'); }}
-
-				  // 미세먼지 개선효과 관련
-				  if ({str(improve_fd).lower()}) {{ click('improve_fd_yn1'); show('#div_improve_fd_yn', true); }}
-				  if ({str(improve_detail1).lower()}) {{ const c=document.getElementById('improve_fd_detail1'); if(c) c.checked=true; }}
-				  if ({str(improve_detail2).lower()}) {{ const c2=document.getElementById('improve_fd_detail2'); if(c2) c2.checked=true; }}
-
-				  // 내연기관 폐차/수출말소 지원여부
-				  if ({str(exchange).lower()}) {{ click('exchange_yn1'); }}
-
-				  return true;
-				}})();
-				"""
+            flags = record.priority
+            if record.priority_text and flags.any():
+                print("🛠️ 우선순위 매핑 적용 시도:", record.priority_text)
                 try:
-                    driver.execute_script(js)
-                    print("✅ 우선순위 매핑 적용 완료")
+                    applied = driver.execute_script(SELENIUM_APPLY_PRIORITY_JS, flags.to_args())
+                    print("✅ 우선순위 매핑 적용 완료:", ", ".join(applied or []) or "적용 항목 없음")
                 except Exception as e:
                     print("⚠️ 우선순위 매핑 JS 실행 실패:", e)
+            elif record.priority_text:
+                print("ℹ️ 우선순위 텍스트에 해당 항목 없음 - 스킵:", record.priority_text)
             else:
                 print("ℹ️ 우선순위 정보 없음 - 스킵")
         except Exception as e:
@@ -888,7 +745,7 @@ def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = T
         if gender:
             print(f"\n📝 3단계: 성별 선택")
             try:
-                gender_id = 'req_sex1' if gender == '남자' else 'req_sex2'
+                gender_id = gender_radio_id(gender)
                 element = driver.find_element(By.ID, gender_id)
                 
                 # 클릭 전 대기
@@ -934,12 +791,8 @@ def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = T
                     option_value = option.get_attribute('value')
                     available_options.append((option_text, option_value))
                 
-                # 차종 매핑 로직 (기존 로직 재사용)
-                model_code = None
-                model_lower = model.lower()
-                
-                # 정확한 매칭 시도 (완전일치 우선)
-                model_code = match_model_value(available_options, model)
+                # 로드 시 해석한 차종 코드 우선, 없으면 실제 옵션을 카탈로그에 배운 뒤 다시 해석
+                model_code = pick_model_option(model, record.model_code, available_options)
                 
                 if model_code:
                     # 사람처럼 선택
@@ -1059,153 +912,98 @@ def fill_fields_selenium_human_like(driver, user_data: dict, fast_mode: bool = T
         print(f"❌ 필드 입력 중 오류: {e}")
         return False
 
-def build_fill_script(user_data: dict) -> str:
-    """필드 자동 입력 JS 스크립트 생성 (중복 선언 방지 버전)"""
-    name = user_data.get('성명', '')
-    phone = user_data.get('휴대전화', '')
-    email = user_data.get('이메일', '.')
-    tel = user_data.get('전화', '.')
-    addr = user_data.get('주소', '')
-    addr_detail = user_data.get('상세주소', '')
-    contract = user_data.get('계약일자', '2025-08-16')
-    birth = user_data.get('생년월일', '1990-01-01')
-    delivery = user_data.get('출고예정일자', '2025-08-29')
-    gender = user_data.get('성별', '남자')
-    model = user_data.get('신청차종', '')
-    count = user_data.get('신청대수', '1')
+def build_fill_script(user_data) -> str:
+    """필드 자동 입력 JS 스크립트 (값은 JSON 으로 넣어 따옴표가 들어 있어도 깨지지 않음)
+
+    스크립트가 사용자마다 달라지므로 새 코드는 fill_fields_planned
+    (입력 계획 단계별 페이지 헬퍼 window.__ev.fill + 페이로드 인자)을 쓴다.
+    """
+    payload = json.dumps(build_fill_payload(user_data), ensure_ascii=False)
+    return f"return ({PLAYWRIGHT_FILL_JS})({payload});"
+
+
+# 입력 계획의 custom 필드 실행 (handler 이름 → 함수(driver, record))
+PLAN_HANDLERS = {
+    'joint_owner': fill_joint_owner_selenium,
+}
+
+
+def _retry_model_option(driver, record, fields: dict) -> None:
+    """model_cd 옵션에 값이 없으면 실제 옵션 기준으로 골라 그 필드만 한 번 더 (결과는 fields 에 반영)"""
+    model_result = fields.get('model_cd') or {}
+    if not model_result.get('options') or not record.model:
+        return
+    options = [tuple(option) for option in model_result['options']]
+    model_code = pick_model_option(record.model, record.model_code, options)
+    if model_code:
+        retry = call_page_helper(driver, 'fill', {
+            'fields': [field_payload('신청차종', 'model_cd', 'select', model_code)],
+            'priority': None,
+        }) or {}
+        fields.update(retry.get('fields') or {})
+
+
+def fill_fields_planned(driver, user_data, plan=None) -> dict:
+    """입력 계획(fill_plan.FILL_PLAN) 단계별로 window.__ev.fill 입력
+
+    의존 필드는 조건 묶음별로 자기 조건만 기다린다. 조건이 맞은 묶음들은 한 번의 호출로 입력하고,
+    나머지는 남은 조건 중 하나가 맞을 때까지 다시 기다린다 (묶음마다 최대 DEPENDENCY_TIMEOUT).
 
-    return f"""
-    try {{
-      console.log('자동 입력 시작...');
-      
-      // 기본 정보 입력
-      const nm=document.getElementById('req_nm'); if(nm) {{ nm.value='{name}'; console.log('성명 입력:', '{name}'); }}
-      const mb=document.getElementById('mobile'); if(mb) {{ mb.value='{phone}'; console.log('휴대폰 입력:', '{phone}'); }}
-      const em=document.getElementById('email'); if(em) {{ em.value='{email}'; console.log('이메일 입력:', '{email}'); }}
-      const ph=document.getElementById('phone'); if(ph) {{ ph.value='{tel}'; console.log('전화 입력:', '{tel}'); }}
-      
-      // 주소 입력
-      const ad=document.querySelector('input[name="addr"]')||document.getElementById('addr'); 
-      if(ad) {{
-        ad.removeAttribute('readonly'); 
-        ad.value='{addr}'; 
-        ad.dispatchEvent(new Event('input', {{bubbles:true}}));
-        console.log('주소 입력:', '{addr}');
-      }}
-      
-      const ad2=document.getElementById('addr_detail'); 
-      if(ad2) {{ 
-        ad2.value='{addr_detail or '123'}'; 
-        ad2.dispatchEvent(new Event('input', {{bubbles:true}})); 
-        ad2.dispatchEvent(new Event('change', {{bubbles:true}})); 
-        console.log('상세주소 입력:', '{addr_detail or '123'}');
-      }}
-      
-      // 신청대수 입력
-      const cnt=document.getElementById('req_cnt'); if(cnt) {{ cnt.value='{count}'; console.log('신청대수 입력:', '{count}'); }}
-      
-      // 계약일자 입력 (readonly 처리)
-      const ct=document.getElementById('contract_day'); 
-      if(ct) {{
-        ct.removeAttribute('readonly'); 
-        ct.value='{contract}'; 
-        ct.setAttribute('readonly','readonly'); 
-        ct.dispatchEvent(new Event('change', {{bubbles:true}}));
-        console.log('계약일자 입력:', '{contract}');
-      }}
-      
-      // 생년월일 입력 (두 필드 모두 처리)
-      const hb=document.getElementById('birth'); 
-      if(hb) {{ 
-        hb.value='{birth}'; 
-        console.log('생년월일(birth) 입력:', '{birth}');
-      }}
-      
-      const bf=document.getElementById('birth1'); 
-      if(bf) {{ 
-        bf.removeAttribute('readonly'); 
-        bf.value='{birth}'; 
-        bf.dispatchEvent(new Event('input', {{bubbles:true}})); 
-        bf.dispatchEvent(new Event('change', {{bubbles:true}})); 
-        bf.setAttribute('readonly','readonly'); 
-        console.log('생년월일(birth1) 입력:', '{birth}');
-      }}
-      
-      // 출고예정일자 입력 (readonly 처리)
-      const dv=document.getElementById('delivery_sch_day'); 
-      if(dv) {{ 
-        dv.removeAttribute('readonly'); 
-        dv.value='{delivery}'; 
-        dv.setAttribute('readonly','readonly'); 
-        dv.dispatchEvent(new Event('change', {{bubbles:true}})); 
-        console.log('출고예정일자 입력:', '{delivery}');
-      }}
-      
-      // 성별 선택
-      const gid = ('{gender}'==='남자') ? 'req_sex1' : 'req_sex2'; 
-      const r=document.getElementById(gid); 
-      if(r) {{ 
-        r.checked=true; 
-        r.click(); 
-        r.dispatchEvent(new Event('change', {{bubbles:true}})); 
-        console.log('성별 선택:', '{gender}');
-      }}
-      
-      // 신청유형 선택 (개인)
-      const kind=document.getElementById('req_kind'); 
-      if(kind) {{ 
-        kind.value='P'; 
-        kind.dispatchEvent(new Event('change', {{bubbles:true}})); 
-        console.log('신청유형 선택: 개인');
-      }}
-      
-      // 차종 선택
-      let modelVal='';
-      if ('{model}'.includes('EV3') && '{model}'.includes('스탠다드')) modelVal='EV3_2WD_S';
-      else if ('{model}'.includes('레이EV') || '{model}'.includes('레이 EV')) modelVal='RAY_4_R';
-      else if ('{model}'.includes('EV3') && '{model}'.includes('롱레인지')) modelVal='EV3_2WD_L17';
-      
-      const modelEl=document.getElementById('model_cd'); 
-      if(modelEl && modelVal) {{ 
-        modelEl.value=modelVal; 
-        modelEl.dispatchEvent(new Event('change', {{bubbles:true}})); 
-        console.log('차종 선택:', modelVal);
-      }}
-      
-      console.log('자동 입력 완료');
-      return true;
-    }} catch(e) {{ 
-      console.error('자동 입력 오류:', e); 
-      return false; 
-    }}
+    Returns:
+        {'ok': 모든 필드 확인 여부, 'fields': {요소 id: 결과}, 'failed': [한글 키],
+         'priority': [적용된 우선순위 항목], 'stages': 실행한 단계 수, 'error': 실행 실패 메시지(있을 때만)}
     """
+    record = UserRecord.coerce(user_data)
+    plan = FILL_PLAN if plan is None else plan
+    fields = {}
+    stages = 0
+    try:
+        print(f"🧭 입력 계획: {describe_plan(plan)}")
+        for groups in stage_steps(plan, plan_values(record)):
+            stages += 1
+            pending = list(groups)
+            deadline = time.time() + DEPENDENCY_TIMEOUT
+            while pending:
+                waiting = [g for g in pending if g[0] is not None]
+                states = call_page_helper(driver, 'checkEach', [g[0] for g in waiting]) if waiting else []
+                satisfied = [g for g, ok in zip(waiting, states or []) if ok]
+                ready = [g for g in pending if g[0] is None or any(g is s for s in satisfied)]
+                if not ready:
+                    ids = [f['id'] for g in pending for f in g[1]] + [spec.id for g in pending for spec in g[2]]
+                    label = f"입력 {stages}단계 의존 ({', '.join(ids)})"
+                    remaining = deadline - time.time()
+                    if remaining > 0:
+                        wait_for(driver, any_of(*[g[0] for g in pending]), timeout=remaining, label=label)
+                        continue
+                    print(f"⚠️ {label} 조건 시간 초과 - 그대로 입력")
+                    ready = pending
+                pending = [g for g in pending if not any(g is r for r in ready)]
+                payload = [f for g in ready for f in g[1]]
+                if payload:
+                    result = call_page_helper(driver, 'fill', {'fields': payload, 'priority': None}) or {}
+                    fields.update(result.get('fields') or {})
+                for _, _, custom in ready:
+                    for spec in custom:
+                        PLAN_HANDLERS[spec.handler](driver, record)
+
+        _retry_model_option(driver, record, fields)
+        ok, failed = summarize_fill_results(fields)
+        print(f"📊 계획 입력 결과: {stages}단계, 성공 {len(ok)} / 실패 {len(failed)}"
+              + (f" ({', '.join(failed)})" if failed else ""))
+        priority = [field_id for field_id, r in fields.items()
+                    if r.get('ok') and r.get('key') in record.priority.to_args()]
+        if priority:
+            print("✅ 우선순위 매핑 적용 완료:", ", ".join(priority))
+        return {'ok': not failed, 'fields': fields, 'failed': failed, 'priority': priority or None, 'stages': stages}
+    except Exception as e:
+        print(f"❌ 계획 입력 실패: {e}")
+        return {'ok': False, 'fields': fields, 'failed': [], 'priority': None, 'stages': stages, 'error': str(e)}
+
 
 def set_input_value_strict(driver, css: str, value: str) -> bool:
     """disabled/readonly를 잠시 해제하고 네이티브 setter로 값 설정 + input/change/blur 발화 후 원복"""
-    js = """
-    try {
-      const el = document.querySelector(arguments[0]);
-      if (!el) return false;
-      const wasDisabled = !!el.disabled;
-      const wasReadonly = el.hasAttribute('readonly');
-      if (wasDisabled) el.disabled = false;
-      if (wasReadonly) el.removeAttribute('readonly');
-      try {
-        const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
-        setter.call(el, arguments[1]);
-      } catch(e) {
-        el.value = arguments[1];
-      }
-      try { el.dispatchEvent(new Event('input', {bubbles:true})); } catch(e) {}
-      try { el.dispatchEvent(new Event('change', {bubbles:true})); } catch(e) {}
-      if (el.blur) { try { el.blur(); } catch(e) {} }
-      if (wasReadonly) el.setAttribute('readonly','readonly');
-      if (wasDisabled) el.disabled = true;
-      return true;
-    } catch(e) { return false; }
-    """
     try:
-        return bool(driver.execute_script(js, css, value))
+        return bool(call_page_helper(driver, 'setValue', css, value))
     except Exception:
         return False
 
@@ -1223,35 +1021,3 @@ def force_enable_all_inputs(driver) -> None:
     except Exception:
         pass
 
-def match_model_value(options, user_text: str):
-    """차종 텍스트를 옵션 목록에 매핑. 완전일치 > 토큰 교집합 > 부분포함 순"""
-    tx = (user_text or "").lower().strip()
-    if not tx:
-        return None
-    norm = (
-        tx.replace("더뉴", "").replace("the new", "").replace(" ", "")
-    )
-    # 후보 전처리
-    options_lc = [((t or "").lower().strip(), v) for t, v in options]
-    # 1) 완전일치 (공백 제거 버전 포함)
-    exact = [v for t, v in options_lc if t == tx or t.replace(" ", "") == norm]
-    if exact:
-        return exact[0]
-    # 2) 토큰 기반 교집합(가중치): 숫자/영문/한글 토큰 나눠 점수화
-    def tokenize(s: str) -> set[str]:
-        return set(re.findall(r"[a-zA-Z]+|[0-9]+|[가-힣]+", s))
-    user_tokens = tokenize(tx)
-    best = None
-    best_score = 0
-    for t, v in options_lc:
-        score = len(user_tokens.intersection(tokenize(t)))
-        if score > best_score:
-            best_score = score
-            best = v
-    if best and best_score > 0:
-        return best
-    # 3) 부분 포함
-    contains = [v for t, v in options_lc if norm in t.replace(" ", "") or t.replace(" ", "") in norm]
-    return contains[0] if contains else None
-
-
@@ -0,0 +1,207 @@
+"""
+입력 계획 - 필드 명세 표(FIELD_SPECS)와 의존 관계로 입력 단계를 만든다
+
+fill_fields_selenium_human_like 는 입력 순서를 7개 '단계' 블록에 직접 적어 두고,
+신청유형 → 공동명의자/신청차종, 사회계층 → 유형/자녀수 같은 순서 제약을 고정 대기로 맞췄다.
+여기서는 필드마다 (요소 id, 값 키, 종류, 정규화, 이벤트, 의존 필드와 기다릴 DOM 조건)을
+표로 두고 compile_plan 이 의존 깊이별 단계로 묶는다.
+- 서로 의존하지 않는 필드는 같은 단계에서 window.__ev.fill 호출 한 번으로 입력하고
+- 의존 필드는 자기가 기다릴 DOM 변화(옵션 로드, 활성화 등) 조건별로 묶어, 조건이 맞는 묶음부터 입력한다.
+간선은 두 종류다.
+- depends_on: 앞 필드가 입력되지 않으면(값 없음) 이 필드도 입력하지 않는다 (사회계층 → 유형/자녀수)
+- after: 순서만 정한다. 앞 필드가 입력될 때만 그 조건을 기다리고, 아니면 바로 입력한다
+  (미세먼지 세부 항목은 '폐차' 처럼 개선효과 없이도 체크하던 기존 동작 유지)
+실행은 fill_fields.fill_fields_planned.
+"""
+
+from dataclasses import dataclass
+
+from ev_automation.fill_script import fill_values, field_payload, gender_radio_id
+from ev_automation.normalize import format_phone_number, normalize_date_string
+from ev_automation.user_record import UserRecord
+from ev_automation.waits import all_of, element_count, element_enabled, element_present
+
+# 값 정규화 (레코드 생성 시 이미 정규화되어 있으면 그대로)
+NORMALIZERS = {
+    'phone': format_phone_number,
+    'date': normalize_date_string,
+}
+
+# 값 → 실제로 선택할 요소 id (라디오 묶음)
+ELEMENT_RESOLVERS = {
+    'gender': gender_radio_id,
+}
+
+# 의존 조건 대기 시간 (초). 지나도 입력은 진행 (fill 이 disabled 를 잠시 풀어 입력함)
+DEPENDENCY_TIMEOUT = 3.0
+
+
+@dataclass(slots=True)
+class FieldSpec:
+    """입력 필드 하나
+
+    kind: text / date / select / radio / check / custom (handler 이름으로 실행)
+    depends_on: ((앞 필드 id, 그 필드 입력 뒤 기다릴 waits 조건), ...) - 앞 필드가 빠지면 이 필드도 빠짐
+    after: depends_on 과 같은 형식의 순서 제약 - 앞 필드가 빠져도 이 필드는 입력
+    reveal: 입력할 때 보이게 할 영역 선택자
+    resolver: 값으로 요소 id 를 고르는 ELEMENT_RESOLVERS 이름 (성별 라디오)
+    """
+    id: str
+    key: str
+    kind: str
+    normalizer: str = ''
+    events: tuple = ('input', 'change')
+    depends_on: tuple = ()
+    resolver: str = ''
+    handler: str = ''
+    after: tuple = ()
+    reveal: str = ''
+
+    def edges(self) -> tuple:
+        return self.depends_on + self.after
+
+
+# 값 키: 한글 키는 fill_script.fill_values, 영문 키는 PriorityFlags 항목, 공동명의자수는 레코드 값
+FIELD_SPECS = [
+    FieldSpec('req_kind', '신청유형', 'select'),
+    FieldSpec('req_nm', '성명', 'text'),
+    FieldSpec('mobile', '휴대전화', 'text', normalizer='phone'),
+    FieldSpec('email', '이메일', 'text'),
+    FieldSpec('phone', '전화', 'text', normalizer='phone'),
+    FieldSpec('req_cnt', '신청대수', 'text'),
+    FieldSpec('addr', '주소', 'text'),
+    FieldSpec('addr_detail', '상세주소', 'text'),
+    FieldSpec('contract_day', '계약일자', 'date', normalizer='date'),
+    FieldSpec('birth', '생년월일', 'text', normalizer='date'),
+    FieldSpec('birth1', '생년월일', 'date', normalizer='date'),
+    FieldSpec('delivery_sch_day', '출고예정일자', 'date', normalizer='date'),
+    FieldSpec('req_sex', '성별', 'radio', events=('change',), resolver='gender'),
+    # 신청유형 선택 후 차종 옵션이 채워지고 공동명의자 입력란이 생김
+    FieldSpec('model_cd', '신청차종', 'select',
+              depends_on=(('req_kind', element_count('#model_cd option', 2)),)),
+    FieldSpec('jn_cnt', '공동명의자수', 'custom', handler='joint_owner',
+              depends_on=(('req_kind', element_present('#jn_cnt')),)),
+    # 우선순위: 사회계층 '예' 선택 후 유형/자녀수 select 가 활성화됨
+    FieldSpec('social_yn1', 'has_social', 'radio', events=('change',)),
+    FieldSpec('social_kind', 'social_kind', 'select', events=('change',),
+              depends_on=(('social_yn1', element_enabled('#social_kind')),)),
+    FieldSpec('children_cnt', 'child_count', 'select', events=('change',),
+              depends_on=(('social_yn1', element_enabled('#children_cnt')),)),
+    FieldSpec('first_buy_yn1', 'first_buy', 'radio', events=('change',)),
+    # 개선효과 '예' 를 고르면 세부 항목 영역이 열림. 세부 항목은 개선효과 없이도 체크 (기존 동작)
+    FieldSpec('improve_fd_yn1', 'improve_fd', 'radio', events=('change',), reveal='#div_improve_fd_yn'),
+    FieldSpec('improve_fd_detail1', 'improve_detail1', 'check', events=('change',),
+              after=(('improve_fd_yn1', element_present('#improve_fd_detail1', visible=True)),)),
+    FieldSpec('improve_fd_detail2', 'improve_detail2', 'check', events=('change',),
+              after=(('improve_fd_yn1', element_present('#improve_fd_detail2', visible=True)),)),
+    FieldSpec('exchange_yn1', 'exchange', 'radio', events=('change',)),
+]
+
+
+def compile_plan(specs=None) -> list:
+    """필드 명세 → 단계 목록 [[FieldSpec, ...], ...]
+
+    단계 = 1 + 앞 필드(depends_on, after) 중 가장 늦은 단계 (없으면 0). 같은 단계 안은 표 순서.
+    id 중복, 없는 필드 의존, 순환 의존은 ValueError.
+    """
+    specs = FIELD_SPECS if specs is None else specs
+    by_id = {}
+    for spec in specs:
+        if spec.id in by_id:
+            raise ValueError(f"입력 계획: 중복된 필드 id {spec.id}")
+        by_id[spec.id] = spec
+    for spec in specs:
+        for dep, _ in spec.edges():
+            if dep not in by_id:
+                raise ValueError(f"입력 계획: {spec.id} 가 없는 필드 {dep} 에 의존")
+
+    levels = {}
+    visiting = set()
+
+    def level(field_id: str) -> int:
+        if field_id in levels:
+            return levels[field_id]
+        if field_id in visiting:
+            raise ValueError(f"입력 계획: 순환 의존 ({field_id})")
+        visiting.add(field_id)
+        deps = [level(dep) for dep, _ in by_id[field_id].edges()]
+        visiting.discard(field_id)
+        levels[field_id] = 1 + max(deps) if deps else 0
+        return levels[field_id]
+
+    stages = []
+    for spec in specs:
+        n = level(spec.id)
+        while len(stages) <= n:
+            stages.append([])
+        stages[n].append(spec)
+    return stages
+
+
+FILL_PLAN = compile_plan()
+
+
+def describe_plan(plan=None) -> str:
+    """단계별 필드 id (로그용)"""
+    plan = FILL_PLAN if plan is None else plan
+    return ' → '.join(f"[{', '.join(spec.id for spec in stage)}]" for stage in plan)
+
+
+def plan_values(user_data) -> dict:
+    """사용자 → 값 키별 입력 값 (없거나 False 면 그 필드는 입력하지 않음)"""
+    record = UserRecord.coerce(user_data)
+    values = fill_values(record)
+    if record.priority_text and record.priority.any():
+        values.update(record.priority.to_args())
+    if record.joint_count and record.joint_count > 0:
+        values['공동명의자수'] = record.joint_count
+    return values
+
+
+def _normalized(spec: FieldSpec, value):
+    func = NORMALIZERS.get(spec.normalizer)
+    if func is None or not isinstance(value, str):
+        return value
+    return func(value) or value
+
+
+def stage_steps(plan, values: dict, selectors: dict | None = None):
+    """단계마다 조건 묶음 목록 [(기다릴 조건 | None, fill 페이로드 필드 목록, custom 필드 목록), ...] 을 차례로 생성
+
+    값이 없거나 depends_on 의 앞 필드가 빠진 필드는 건너뛴다. 필드의 조건은 입력된 앞 필드의
+    간선 조건만 모으고, 같은 조건을 기다리는 필드끼리 한 묶음이 된다 (조건 없으면 None 묶음).
+    selectors 는 {한글 키: CSS 선택자} (id 보다 먼저 시도).
+    """
+    selectors = selectors or {}
+    active = set()
+    for stage in plan:
+        groups = {}
+        for spec in stage:
+            value = values.get(spec.key)
+            if not value or any(dep not in active for dep, _ in spec.depends_on):
+                continue
+            active.add(spec.id)
+            conditions = []
+            for dep, condition in spec.edges():
+                if dep in active and condition not in conditions:
+                    conditions.append(condition)
+            condition = None
+            if conditions:
+                condition = conditions[0] if len(conditions) == 1 else all_of(*conditions)
+            key = repr(condition)
+            if key not in groups:
+                groups[key] = (condition, [], [])
+            _, fields, custom = groups[key]
+            if spec.kind == 'custom':
+                custom.append(spec)
+                continue
+            element_id = spec.id
+            if spec.resolver:
+                element_id = ELEMENT_RESOLVERS[spec.resolver](value)
+            item = field_payload(spec.key, element_id, spec.kind, _normalized(spec, value), selectors.get(spec.key))
+            item['events'] = list(spec.events)
+            if spec.reveal:
+                item['reveal'] = spec.reveal
+            fields.append(item)
+        if groups:
+            yield list(groups.values())
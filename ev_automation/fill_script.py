@@ -0,0 +1,196 @@
+"""
+단일 호출 입력 스크립트 - 고정된 JS 하나 + JSON 페이로드로 신청서 전체 입력
+
+필드마다 find_element / click / Select / get_attribute / execute_script 를 따로 부르면
+사용자 한 명에 WebDriver 왕복이 수십 번 생기고, build_fill_script 처럼 값을 JS 문자열에
+끼워 넣으면 따옴표가 든 값에서 스크립트가 깨진다. 여기서는
+- 입력할 필드를 표(FILL_FIELDS)로 두고 build_fill_payload 로 값만 담은 dict 를 만들고
+- 고정된 FILL_JS 가 arguments[0] 로 받은 페이로드를 네이티브 setter 로 한 번에 입력한 뒤
+- 같은 호출 안에서 필드별로 다시 읽은 값(read-back)과 우선순위 적용 결과를 돌려준다.
+model_cd 옵션에 값이 없으면 옵션 목록을 돌려주므로 그때만 pick_model_option 으로 고른 값으로
+한 번 더 호출한다. 공동명의자 행 생성은 비동기 대기가 필요해 여기서 다루지 않는다.
+"""
+
+from ev_automation.priority_flags import APPLY_PRIORITY_JS
+from ev_automation.user_record import UserRecord
+
+# (한글 키, 요소 id, 종류) - 입력 순서대로. 종류: text / date / select / radio (fill_plan 은 check 도 사용)
+FILL_FIELDS = [
+    ('신청유형', 'req_kind', 'select'),
+    ('성명', 'req_nm', 'text'),
+    ('휴대전화', 'mobile', 'text'),
+    ('이메일', 'email', 'text'),
+    ('전화', 'phone', 'text'),
+    ('신청대수', 'req_cnt', 'text'),
+    ('주소', 'addr', 'text'),
+    ('상세주소', 'addr_detail', 'text'),
+    ('계약일자', 'contract_day', 'date'),
+    ('생년월일', 'birth', 'text'),
+    ('생년월일', 'birth1', 'date'),
+    ('출고예정일자', 'delivery_sch_day', 'date'),
+    ('성별', 'req_sex', 'radio'),
+    ('신청차종', 'model_cd', 'select'),
+]
+
+# id 로 못 찾을 때 추가로 시도할 선택자
+EXTRA_SELECTORS = {
+    'addr': ['input[name="addr"]'],
+}
+
+GENDER_RADIO_IDS = {'남자': 'req_sex1', '여자': 'req_sex2'}
+
+
+def gender_radio_id(gender) -> str:
+    """성별 값 → 라디오 id ('남자' 만 req_sex1, 그 외 '여성'/'F' 등은 모두 req_sex2)"""
+    return GENDER_RADIO_IDS['남자'] if gender == '남자' else GENDER_RADIO_IDS['여자']
+
+
+def fill_values(record: UserRecord) -> dict:
+    """한글 키 → 입력할 값 (기존 build_fill_script 의 기본값 유지)"""
+    return {
+        '신청유형': '개인',
+        '성명': record.name,
+        '휴대전화': record.phone,
+        '이메일': record.email or '.',
+        '전화': record.tel or '.',
+        '신청대수': record.count or '1',
+        '주소': record.address,
+        '상세주소': record.address_detail or '123',
+        '계약일자': record.contract_date or '2025-08-16',
+        '생년월일': record.birth_date or '1990-01-01',
+        '출고예정일자': record.delivery_date or '2025-08-29',
+        '성별': record.gender or '남자',
+        # 로드 시 해석한 코드, 없으면 옵션 텍스트로 찾도록 차종 텍스트
+        '신청차종': record.model_code or record.model,
+    }
+
+
+def field_payload(key: str, element_id: str, kind: str, value, selector: str | None = None) -> dict:
+    """FILL_JS 가 받는 필드 항목 하나"""
+    selectors = [selector] if selector else []
+    selectors.append(f'#{element_id}')
+    selectors.extend(EXTRA_SELECTORS.get(element_id, []))
+    return {'key': key, 'id': element_id, 'kind': kind, 'value': '' if value is None else str(value),
+            'selectors': selectors}
+
+
+def build_fill_payload(user_data, selectors: dict | None = None, with_priority: bool = True) -> dict:
+    """사용자 → FILL_JS 페이로드 {'fields': [...], 'priority': {...}|None}
+
+    selectors 는 {한글 키: CSS 선택자} (학습한 선택자가 있으면 id 보다 먼저 시도).
+    """
+    record = UserRecord.coerce(user_data)
+    values = fill_values(record)
+    selectors = selectors or {}
+    fields = []
+    for key, element_id, kind in FILL_FIELDS:
+        value = values.get(key)
+        if not value:
+            continue
+        if kind == 'radio':
+            element_id = gender_radio_id(value)
+        fields.append(field_payload(key, element_id, kind, value, selectors.get(key)))
+    priority = None
+    if with_priority and record.priority_text and record.priority.any():
+        priority = record.priority.to_args()
+    return {'fields': fields, 'priority': priority}
+
+
+def summarize_fill_results(fields: dict):
+    """FILL_JS 결과의 fields → (성공 키 목록, 실패 키 목록). 같은 키 필드가 여럿이면 모두 성공해야 성공"""
+    status = {}
+    for result in fields.values():
+        key = result.get('key') or ''
+        status[key] = status.get(key, True) and bool(result.get('ok'))
+    ok = [key for key, passed in status.items() if passed]
+    failed = [key for key, passed in status.items() if not passed]
+    return ok, failed
+
+
+# 인자 payload = build_fill_payload(). Selenium 은 'const payload = arguments[0];' 을 앞에 붙이고,
+# Playwright 는 '(payload) => { ... }' 로 감싸 실행한다.
+# 필드 항목에 events 가 있으면 값 설정 뒤 그 이벤트만 발생 (없으면 input, change),
+# reveal 이 있으면 그 선택자 영역을 보이게 함
+# 반환: {fields: {요소 id: {key, found, ok, value, options?, error?}}, priority: [적용된 id] | null}
+FILL_JS = """
+const applyPriority = (f) => {""" + APPLY_PRIORITY_JS + """};
+const fire = (el, names) => names.forEach(n => { try { el.dispatchEvent(new Event(n, {bubbles:true})); } catch(e) {} });
+const find = (sels) => { for (const s of sels) { try { const el = document.querySelector(s); if (el) return el; } catch(e) {} } return null; };
+const nativeSetter = (el) => {
+  const proto = el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+    : el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  const desc = Object.getOwnPropertyDescriptor(proto, 'value');
+  return desc && desc.set;
+};
+const setValue = (el, v, events) => {
+  const wasDisabled = !!el.disabled;
+  const wasReadonly = el.hasAttribute('readonly');
+  if (wasDisabled) el.disabled = false;
+  if (wasReadonly) el.removeAttribute('readonly');
+  try { nativeSetter(el).call(el, v); } catch(e) { el.value = v; }
+  fire(el, events || ['input', 'change']);
+  if (el.blur) { try { el.blur(); } catch(e) {} }
+  if (wasReadonly) el.setAttribute('readonly', 'readonly');
+  if (wasDisabled && el.tagName !== 'SELECT') el.disabled = true;
+};
+const optionValue = (el, v) => {
+  const opts = Array.from(el.options || []);
+  const byValue = opts.find(o => o.value === v);
+  if (byValue) return byValue.value;
+  const byText = opts.find(o => (o.textContent || '').trim() === v);
+  return byText ? byText.value : null;
+};
+
+const results = {};
+for (const f of (payload.fields || [])) {
+  const r = {key: f.key, found: false, ok: false, value: null};
+  results[f.id] = r;
+  try {
+    const el = find(f.selectors || ['#' + f.id]);
+    if (!el) continue;
+    r.found = true;
+    // 이 필드를 고르면 보여야 하는 영역 (화면 스크립트가 늦게 여는 경우 대비)
+    if (f.reveal) { try { const box = document.querySelector(f.reveal); if (box) box.style.display = ''; } catch(e) {} }
+    if (f.kind === 'radio') {
+      try { el.click(); } catch(e) {}
+      el.checked = true;
+      fire(el, ['change']);
+      r.value = !!el.checked;
+      r.ok = !!el.checked;
+      continue;
+    }
+    // 체크박스는 이미 체크돼 있으면 클릭하지 않음 (클릭하면 해제됨)
+    if (f.kind === 'check') {
+      if (!el.checked) { try { el.click(); } catch(e) {} }
+      el.checked = true;
+      fire(el, f.events || ['change']);
+      r.value = !!el.checked;
+      r.ok = !!el.checked;
+      continue;
+    }
+    let v = f.value;
+    if (f.kind === 'select') {
+      v = optionValue(el, f.value);
+      if (v === null) {
+        r.options = Array.from(el.options || []).map(o => [(o.textContent || '').trim(), o.value]);
+        continue;
+      }
+    }
+    setValue(el, v, f.events);
+    r.value = String(el.value);
+    // 달력 위젯은 값 뒤에 요일 등을 붙이기도 하므로 날짜는 앞부분만 비교
+    r.ok = f.kind === 'date' ? r.value.startsWith(v) : r.value === v;
+  } catch(e) {
+    r.error = String((e && e.message) || e);
+  }
+}
+
+let priority = null;
+if (payload.priority) {
+  try { priority = applyPriority(payload.priority); } catch(e) { priority = null; }
+}
+return {fields: results, priority: priority};
+"""
+
+SELENIUM_FILL_JS = "const payload = arguments[0];\n" + FILL_JS
+PLAYWRIGHT_FILL_JS = "(payload) => {" + FILL_JS + "}"
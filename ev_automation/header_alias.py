@@ -0,0 +1,111 @@
+"""
+헤더 별칭 - 시트마다 조금씩 다른 필드명(컬럼명)을 표준 키 하나로
+
+'공동명의자수' / '공동명의자 수' / '공동 명의수', '공동1_성명' / '공동명의자1 성명' 처럼
+같은 항목이 여러 이름으로 들어온다. 변형 목록을 쓰는 곳마다 복사해 두고 사용자마다
+여러 번 .get() 하던 것을, 표준 키 → 별칭 표(HEADER_ALIASES)로 한 번 컴파일해
+로드할 때 키를 바꿔 둔다. 비교는 NFC 정규화 후 공백/밑줄을 지운 형태로 한다.
+같은 표준 키로 모이는 컬럼이 여럿이면 값이 있는 것 중 표에서 앞선 별칭이 이긴다.
+표에 없는 헤더는 report_unknown_headers 로 로드 한 번에 한 줄로 알린다.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# 표준 키 → 별칭 (앞에 있을수록 우선). 표준 키 자신은 항상 최우선
+HEADER_ALIASES = {
+    '성명': ['이름', '고객명'],
+    '휴대전화': ['휴대폰', '핸드폰', '휴대폰번호', '휴대전화번호'],
+    '이메일': ['email', 'e-mail'],
+    '전화': ['전화번호', '일반전화'],
+    '주소': [],
+    '상세주소': [],
+    '계약일자': ['계약일'],
+    '생년월일': [],
+    '출고예정일자': ['출고예정일'],
+    '성별': [],
+    '신청유형': [],
+    '신청차종': ['차종'],
+    '신청대수': [],
+    '우선순위': [],
+    # 공동명의자
+    '공동명의자수': ['공동명의수', '공동수', '공동명의인수'],
+    '공동명의자 성명': ['공동1_성명', '공동명의자1_성명', '공동성명', '공동명의자이름'],
+    '공동명의자 생년월일': ['공동1_생년월일', '공동명의자1_생년월일', '공동생년월일'],
+}
+
+JOINT_COUNT_KEY = '공동명의자수'
+JOINT_NAME_KEY = '공동명의자 성명'
+JOINT_BIRTH_KEY = '공동명의자 생년월일'
+
+_FOLD = re.compile(r"[\s_]+")
+
+
+def fold_header(name) -> str:
+    """헤더 비교용 형태: NFC + 공백/밑줄 제거 + 영문 소문자"""
+    return _FOLD.sub("", unicodedata.normalize("NFC", str(name))).lower()
+
+
+def _compile_aliases(aliases: dict) -> dict:
+    """접힌 별칭 → (표준 키, 우선순위)"""
+    compiled = {}
+    for canonical, variants in aliases.items():
+        for rank, variant in enumerate([canonical] + list(variants)):
+            folded = fold_header(variant)
+            if folded in compiled and compiled[folded][0] != canonical:
+                raise ValueError(f"헤더 별칭 충돌: {variant} ({compiled[folded][0]} / {canonical})")
+            compiled.setdefault(folded, (canonical, rank))
+    return compiled
+
+
+_ALIAS_INDEX = _compile_aliases(HEADER_ALIASES)
+
+
+@lru_cache(maxsize=1024)
+def resolve_header(name):
+    """헤더 → (표준 키, 우선순위). 모르는 헤더는 (None, 0)"""
+    return _ALIAS_INDEX.get(fold_header(name), (None, 0))
+
+
+def canonicalize_keys(data: dict) -> dict:
+    """dict 의 키를 표준 키로 변환 (모르는 헤더는 원래 이름 그대로, 순서 유지)"""
+    result = {}
+    ranks = {}
+    for key, value in data.items():
+        canonical, rank = resolve_header(key)
+        if canonical is None:
+            canonical, rank = key, 0
+        if canonical in result:
+            has_value = value not in (None, '')
+            kept_has_value = result[canonical] not in (None, '')
+            # 값이 있는 쪽, 둘 다 있으면 표에서 앞선 별칭
+            if not has_value or (kept_has_value and ranks[canonical] <= rank):
+                continue
+        result[canonical] = value
+        ranks[canonical] = rank
+    return result
+
+
+def is_known_header(name) -> bool:
+    return resolve_header(name)[0] is not None
+
+
+def collect_unknown_headers(users) -> dict:
+    """사용자 목록 전체에서 표에 없는 헤더 → 사용자 수"""
+    counts = {}
+    for user in users:
+        for key in user.keys():
+            if not is_known_header(key):
+                counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def report_unknown_headers(users, source: str = '') -> dict:
+    """표에 없는 헤더를 한 줄로 출력하고 {헤더: 사용자 수} 반환"""
+    counts = collect_unknown_headers(users)
+    if counts:
+        listed = ", ".join(f"{key}({count}명)" for key, count in counts.items())
+        prefix = f"{source} " if source else ""
+        print(f"[HEADER] {prefix}알 수 없는 컬럼 {len(counts)}개: {listed}")
+    return counts
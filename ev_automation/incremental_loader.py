@@ -0,0 +1,160 @@
+"""
+증분 워크북 로더 - 수정된 시트만 다시 파싱
+
+xlsx 는 zip 파일이고 시트마다 xl/worksheets/sheetN.xml 파트가 따로 있다.
+zip 디렉터리의 CRC32 는 압축을 풀지 않고도 읽을 수 있으므로, 직전 로드 때의
+파트별 CRC 와 비교해 바뀐 시트만 다시 파싱하고 메모리의 사용자 목록을 그 자리에서 고친다.
+- 시트 추가/삭제/이름 변경은 xl/workbook.xml 의 시트 목록으로 감지
+- 공유 문자열(sharedStrings.xml)은 기존 항목 뒤에 추가만 된 경우에만 증분 처리
+  (기존 인덱스의 문자열이 바뀌면 시트 XML 이 같아도 값이 달라지므로 전체 다시 로드)
+- 셀 서식(styles.xml)이 바뀌면 날짜 판별이 달라질 수 있으므로 전체 다시 로드
+"""
+
+import hashlib
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+
+from ev_automation.excel_loader import (
+    USER_SHEET_PATTERN, get_workbook_cache, load_user_sheets, parse_user_sheets
+)
+from ev_automation.header_alias import report_unknown_headers
+from ev_automation.user_record import UserRecord
+from ev_automation.xlsx_reader import (
+    NS_MAIN, SHARED_STRINGS_PART, STYLES_PART, part_crc, read_sheet_parts
+)
+
+
+def shared_string_digests(zf: zipfile.ZipFile) -> list:
+    """공유 문자열 항목(<si>)별 해시 목록 (추가만 되었는지 비교용)"""
+    if SHARED_STRINGS_PART not in zf.namelist():
+        return []
+    digests = []
+    with zf.open(SHARED_STRINGS_PART) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f"{NS_MAIN}si":
+                digests.append(hashlib.sha1(ET.tostring(elem)).hexdigest())
+                elem.clear()
+    return digests
+
+
+class IncrementalWorkbookLoader:
+    """워크북을 한 번 로드한 뒤 refresh() 때 바뀐 고객 시트만 다시 파싱
+
+    users 리스트 객체는 계속 같은 것을 유지하며, 바뀌지 않은 시트의
+    사용자 레코드(UserRecord)도 그대로 재사용된다.
+    """
+
+    def __init__(self, excel_file: str, use_cache: bool = True):
+        self.excel_file = excel_file
+        self.use_cache = use_cache
+        self.users = []
+        self.sheet_order = []      # 고객 시트명 (워크북 순서)
+        self.sheet_users = {}      # 시트명 -> 사용자 데이터 (캐시 저장용 dict)
+        self.sheet_records = {}    # 시트명 -> UserRecord
+        self.sheet_crcs = {}       # 시트명 -> 워크시트 파트 CRC
+        self.shared_strings = []   # 공유 문자열 항목 해시
+        self.shared_strings_crc = None
+        self.styles_crc = None
+        self.loaded = False
+
+    # ---------- 스냅샷 ----------
+    def _snapshot(self):
+        """현재 파일의 (고객 시트별 파트 CRC, 공유 문자열 해시, styles CRC)"""
+        with zipfile.ZipFile(self.excel_file) as zf:
+            sheet_crcs = {}
+            for sheet_name, part in read_sheet_parts(zf):
+                if USER_SHEET_PATTERN.match(sheet_name):
+                    sheet_crcs[sheet_name] = part_crc(zf, part)
+            strings_crc = part_crc(zf, SHARED_STRINGS_PART)
+            if self.loaded and strings_crc == self.shared_strings_crc:
+                # 공유 문자열이 그대로면 다시 풀지 않음
+                shared_strings = self.shared_strings
+            else:
+                shared_strings = shared_string_digests(zf)
+            return (sheet_crcs, shared_strings, strings_crc,
+                    part_crc(zf, STYLES_PART))
+
+    def _apply(self, sheet_crcs, shared_strings, strings_crc, styles_crc):
+        self.sheet_crcs = sheet_crcs
+        self.shared_strings = shared_strings
+        self.shared_strings_crc = strings_crc
+        self.styles_crc = styles_crc
+        self.sheet_order = list(sheet_crcs)
+        users = []
+        for name in self.sheet_order:
+            user_data = self.sheet_users.get(name)
+            if not user_data:
+                continue
+            record = self.sheet_records.get(name)
+            if record is None:
+                record = self.sheet_records[name] = UserRecord.from_dict(user_data)
+            users.append(record)
+        self.users[:] = users
+        self.loaded = True
+
+    def _store_cache(self):
+        """갱신된 결과를 디스크 캐시에도 반영 (다음 실행 때 바로 사용)"""
+        if not self.use_cache:
+            return
+        try:
+            sheets = [[name, self.sheet_users.get(name, {})] for name in self.sheet_order]
+            get_workbook_cache().put(self.excel_file, sheets)
+        except Exception as e:
+            print(f"[WARNING] 워크북 캐시 저장 실패: {e}")
+
+    # ---------- 로드 ----------
+    def load(self):
+        """전체 로드 (use_cache=True 이면 디스크 캐시 사용). users 반환"""
+        sheets = load_user_sheets(self.excel_file, use_cache=self.use_cache)
+        self.sheet_users = dict(sheets)
+        self.sheet_records = {}
+        self.loaded = False
+        self._apply(*self._snapshot())
+        report_unknown_headers(self.users, os.path.basename(self.excel_file))
+        return self.users
+
+    def refresh(self) -> dict:
+        """직전 로드 이후 바뀐 시트만 다시 파싱해 users 를 갱신
+
+        반환: {'changed': [...], 'added': [...], 'removed': [...], 'full_reload': bool}
+        """
+        if not self.loaded:
+            self.load()
+            return {'changed': [], 'added': list(self.sheet_order), 'removed': [],
+                    'full_reload': True}
+
+        previous = list(self.sheet_order)
+        snapshot = self._snapshot()
+        sheet_crcs, shared_strings, _, styles_crc = snapshot
+
+        old_strings = self.shared_strings
+        strings_appended = shared_strings[:len(old_strings)] == old_strings
+        if styles_crc != self.styles_crc or not strings_appended:
+            print("[INFO] 공유 문자열/서식 변경 - 전체 다시 로드")
+            self.sheet_users = dict(parse_user_sheets(self.excel_file))
+            self.sheet_records = {}
+            self._apply(*snapshot)
+            self._store_cache()
+            return {'changed': [], 'added': list(sheet_crcs), 'removed': previous,
+                    'full_reload': True}
+
+        added = [name for name in sheet_crcs if name not in previous]
+        removed = [name for name in previous if name not in sheet_crcs]
+        changed = [name for name in sheet_crcs
+                   if name in previous and sheet_crcs[name] != self.sheet_crcs[name]]
+
+        dirty = changed + added
+        if dirty:
+            print(f"[INFO] 시트 다시 파싱: {dirty}")
+            self.sheet_users.update(parse_user_sheets(self.excel_file, dirty))
+        for name in dirty:
+            self.sheet_records.pop(name, None)
+        for name in removed:
+            self.sheet_users.pop(name, None)
+            self.sheet_records.pop(name, None)
+        self._apply(*snapshot)
+        if dirty or removed:
+            self._store_cache()
+        return {'changed': changed, 'added': added, 'removed': removed,
+                'full_reload': False}
@@ -0,0 +1,137 @@
+"""
+엑셀 외 입력 형식 어댑터 - CRM 내보내기 CSV / JSONL / Parquet
+
+CRM 에서 내려받는 대량 배치는 고객 한 명이 한 행(레코드)이고 열 이름이 곧 필드명이다
+(성명, 휴대전화, 생년월일, ...). 시트당 고객 한 명인 엑셀과 구조만 다를 뿐 필드는 같으므로
+행마다 (필드명, 값) 쌍을 만들어 엑셀과 같은 build_user_data → UserRecord.from_dict 를
+거친다. 세 형식 모두 한 행씩 읽어 바로 반환하므로 파일 전체를 메모리에 올리지 않는다.
+
+- CSV: UTF-8 (BOM 허용), 엑셀에서 저장한 CP949 파일도 읽음
+- JSONL: 한 줄에 JSON 객체 하나
+- Parquet: pyarrow 가 설치된 경우에만 (배치 단위로 읽음)
+"""
+
+import codecs
+import csv
+import json
+import os
+
+from ev_automation.field_rules import build_user_data
+from ev_automation.header_alias import report_unknown_headers
+from ev_automation.user_record import UserRecord
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+CSV_EXTENSIONS = (".csv",)
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+PARQUET_EXTENSIONS = (".parquet",)
+SUPPORTED_EXTENSIONS = EXCEL_EXTENSIONS + CSV_EXTENSIONS + JSONL_EXTENSIONS + PARQUET_EXTENSIONS
+
+# Parquet 를 읽을 때 한 번에 가져올 행 수
+PARQUET_BATCH_SIZE = 2048
+
+# CSV 인코딩 판별에 쓰는 앞부분 크기
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+
+def _row_to_record(row: dict, label: str):
+    """한 행(dict) → UserRecord (값이 하나도 없는 행은 None)"""
+    user_data = build_user_data(((name, value) for name, value in row.items() if name), label)
+    if not user_data:
+        return None
+    return UserRecord.from_dict(user_data)
+
+
+def _detect_csv_encoding(path: str) -> str:
+    """앞부분이 UTF-8 로 읽히면 utf-8-sig, 아니면 엑셀 기본 저장 형식인 cp949"""
+    with open(path, "rb") as f:
+        head = f.read(ENCODING_SNIFF_BYTES)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        print(f"[WARNING] {os.path.basename(path)} UTF-8 아님, CP949 로 읽습니다")
+        return "cp949"
+
+
+def _iter_rows_csv(path: str):
+    with open(path, newline="", encoding=_detect_csv_encoding(path)) as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def _iter_rows_jsonl(path: str):
+    with open(path, encoding="utf-8-sig") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"[ERROR] {os.path.basename(path)}:{line_no} JSON 파싱 실패: {e}")
+                continue
+            if not isinstance(row, dict):
+                print(f"[ERROR] {os.path.basename(path)}:{line_no} JSON 객체가 아닙니다")
+                continue
+            yield line_no, row
+
+
+def _iter_rows_parquet(path: str):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet 파일을 읽으려면 pyarrow 가 필요합니다 (pip install pyarrow)")
+    parquet_file = pq.ParquetFile(path)
+    row_no = 0
+    for batch in parquet_file.iter_batches(batch_size=PARQUET_BATCH_SIZE):
+        for row in batch.to_pylist():
+            row_no += 1
+            yield row_no, row
+
+
+def iter_rows(path: str):
+    """파일 형식에 맞춰 (행 번호, {열 이름: 값}) 반환"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in CSV_EXTENSIONS:
+        return _iter_rows_csv(path)
+    if ext in JSONL_EXTENSIONS:
+        return _iter_rows_jsonl(path)
+    if ext in PARQUET_EXTENSIONS:
+        return _iter_rows_parquet(path)
+    raise ValueError(f"지원하지 않는 입력 형식입니다: {ext or path}")
+
+
+def iter_users_from_rows(path: str):
+    """CSV/JSONL/Parquet 파일에서 사용자(UserRecord)를 한 행씩 반환"""
+    name = os.path.basename(path)
+    for row_no, row in iter_rows(path):
+        record = _row_to_record(row, f"{name}:{row_no}")
+        if record is not None:
+            yield record
+
+
+def iter_users_from_file(path: str, use_cache: bool = True):
+    """확장자에 맞는 로더로 사용자(UserRecord)를 하나씩 반환 (엑셀은 iter_users_from_excel)"""
+    if path.lower().endswith(EXCEL_EXTENSIONS):
+        from ev_automation.excel_loader import iter_users_from_excel
+        return iter_users_from_excel(path, use_cache=use_cache)
+    return iter_users_from_rows(path)
+
+
+def cached_users_from_file(path: str):
+    """엑셀 워크북 캐시 히트면 전체 사용자 목록, 아니면 None (CSV/JSONL/Parquet 는 캐시 없음)"""
+    if path.lower().endswith(EXCEL_EXTENSIONS):
+        from ev_automation.excel_loader import cached_users_from_excel
+        return cached_users_from_excel(path)
+    return None
+
+
+def load_users_from_file(path: str, use_cache: bool = False):
+    """확장자에 맞는 로더로 사용자 목록 로드 (실패 시 예외 발생)"""
+    if path.lower().endswith(EXCEL_EXTENSIONS):
+        from ev_automation.excel_loader import parse_users_from_excel
+        return parse_users_from_excel(path, use_cache=use_cache)
+    users = list(iter_users_from_rows(path))
+    report_unknown_headers(users, os.path.basename(path))
+    return users
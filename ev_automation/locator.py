@@ -0,0 +1,49 @@
+"""
+빠른 요소 찾기 - 후보 선택자 목록을 페이지 안에서 한 번에 확인
+
+브라우저를 만들 때 implicitly_wait(5) 를 걸어 두기 때문에 후보 선택자를 find_element 로
+하나씩 시도하면 없는 후보마다 5초씩 기다린다 (임시저장 버튼 후보 22개가 모두 없으면 2분 가까이).
+여기서는 후보 목록 전체를 페이지 헬퍼(window.__ev.locate)로 넘겨 querySelectorAll / XPath 평가
+한 번으로 첫 요소를 찾으므로, 없을 때도 바로(수 ms) 돌아온다.
+
+후보 형식: CSS 선택자 / XPath ('/' 또는 '(' 로 시작) / text=문구 (문구를 포함하는 요소)
+"""
+
+from ev_automation.page_helpers import call_page_helper
+
+
+def _as_list(candidates) -> list:
+    if isinstance(candidates, str):
+        return [candidates]
+    return list(candidates or [])
+
+
+def locate(driver, candidates, visible: bool = False, enabled: bool = False):
+    """후보 중 조건에 맞는 첫 요소와 그 선택자. 없으면 (None, None)"""
+    try:
+        hit = call_page_helper(driver, 'locate', _as_list(candidates), {'visible': visible, 'enabled': enabled})
+    except Exception as e:
+        print(f"[LOCATE] 요소 찾기 실패: {e}")
+        return None, None
+    if not hit:
+        return None, None
+    return hit.get('element'), hit.get('selector')
+
+
+def locate_element(driver, candidates, visible: bool = False, enabled: bool = False):
+    """후보 중 조건에 맞는 첫 요소 (없으면 None)"""
+    return locate(driver, candidates, visible=visible, enabled=enabled)[0]
+
+
+def locate_all(driver, candidates, visible: bool = False, enabled: bool = False) -> list:
+    """후보 전체에서 조건에 맞는 요소 목록 (후보 순서, 중복 제거)"""
+    try:
+        return call_page_helper(driver, 'locate', _as_list(candidates),
+                                {'visible': visible, 'enabled': enabled, 'all': True}) or []
+    except Exception as e:
+        print(f"[LOCATE] 요소 목록 찾기 실패: {e}")
+        return []
+
+
+def exists(driver, candidates, visible: bool = False) -> bool:
+    return locate(driver, candidates, visible=visible)[0] is not None
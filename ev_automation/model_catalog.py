@@ -0,0 +1,242 @@
+"""
+차종 카탈로그 - 신청차종 텍스트 → model_cd 옵션 값
+
+EV3 스탠다드 / 레이 / EV3 롱레인지 세 가지를 코드에 박아 두면 그 밖의 차종은 아무것도
+선택되지 않은 채 검증에서 떨어져 재시도 한 바퀴를 통째로 버리게 된다. 여기서는
+- model_catalog.json (배포 파일): 코드, 표시 이름, 별칭
+- data/model_catalog_learned.json: 실제 페이지의 model_cd 옵션에서 배운 코드/텍스트
+를 합친 카탈로그로 해석한다. 해석 순서는
+1) 별칭 완전일치 (소문자, 공백/기호 제거, '더뉴'/'the new' 제거)
+2) 별칭 토큰이 모두 들어 있는 것 중 토큰이 가장 많은 별칭 ('EV3 롱레인지 19인치' → 19인치 옵션 우선)
+3) 글자 3-gram 유사도 (오타/띄어쓰기 차이)
+이고, 사용자마다 로드 시 한 번만 해석한다 (UserRecord.model_code).
+"""
+
+import json
+import os
+import re
+import threading
+
+from ev_automation.model_index import get_model_index
+
+DEFAULT_CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model_catalog.json")
+DEFAULT_LEARNED_FILE = os.path.join("data", "model_catalog_learned.json")
+
+# 3-gram Dice 유사도가 이 값 이상이면 같은 차종으로 본다
+FUZZY_THRESHOLD = 0.6
+
+_TOKEN = re.compile(r"[a-z]+|[0-9]+|[가-힣]+")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]")
+
+
+def normalize_model_text(text) -> str:
+    """소문자 + '더뉴'/'the new' 접두어 제거"""
+    return str(text or "").lower().replace("더뉴", "").replace("the new", "").strip()
+
+
+def _compact(text) -> str:
+    return _NON_WORD.sub("", normalize_model_text(text))
+
+
+def _tokens(text) -> frozenset:
+    return frozenset(_TOKEN.findall(normalize_model_text(text)))
+
+
+def _trigrams(compact: str) -> set:
+    if not compact:
+        return set()
+    padded = f"  {compact} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ModelCatalog:
+    """차종 코드 카탈로그 (배포 파일 + 페이지에서 배운 옵션)"""
+
+    def __init__(self, catalog_file: str = DEFAULT_CATALOG_FILE, learned_file: str | None = DEFAULT_LEARNED_FILE):
+        self.catalog_file = catalog_file
+        self.learned_file = learned_file
+        self.models = {}
+        self.learned = {}
+        self._lock = threading.Lock()
+        for entry in self._load_file(catalog_file):
+            self._merge(self.models, entry)
+        if learned_file:
+            for entry in self._load_file(learned_file):
+                self._merge(self.learned, entry)
+        self._rebuild()
+
+    # ---------- 파일 ----------
+    @staticmethod
+    def _load_file(path: str) -> list:
+        try:
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f).get("models", [])
+        except Exception as e:
+            print(f"[WARNING] 차종 카탈로그 읽기 실패 ({path}): {e}")
+        return []
+
+    def save_learned(self) -> bool:
+        """페이지에서 배운 옵션 저장"""
+        if not self.learned_file:
+            return False
+        try:
+            directory = os.path.dirname(self.learned_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.learned_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "models": list(self.learned.values())}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.learned_file)
+            return True
+        except Exception as e:
+            print(f"[WARNING] 차종 카탈로그 저장 실패: {e}")
+            return False
+
+    # ---------- 카탈로그 ----------
+    @staticmethod
+    def _merge(target: dict, entry: dict) -> bool:
+        """항목 하나를 합침. 새 코드/별칭이 생기면 True"""
+        code = str(entry.get("code") or "").strip()
+        if not code:
+            return False
+        label = str(entry.get("label") or "").strip()
+        aliases = [str(a).strip() for a in entry.get("aliases", []) if str(a).strip()]
+        if label and label not in aliases:
+            aliases.insert(0, label)
+        model = target.get(code)
+        if model is None:
+            target[code] = {"code": code, "label": label or (aliases[0] if aliases else code), "aliases": aliases}
+            return True
+        added = [a for a in aliases if a not in model["aliases"]]
+        model["aliases"].extend(added)
+        return bool(added)
+
+    def entries(self) -> list:
+        """배포 파일 항목 + 배운 항목 (배포 파일 우선)"""
+        merged = {code: dict(model, aliases=list(model["aliases"])) for code, model in self.models.items()}
+        for code, model in self.learned.items():
+            self._merge(merged, model)
+        return list(merged.values())
+
+    def _rebuild(self):
+        """별칭 인덱스 다시 만들기 (완전일치 dict, 토큰/3-gram 역색인)"""
+        aliases = []
+        exact = {}
+        by_token = {}
+        by_trigram = {}
+        for model in self.entries():
+            for alias in model["aliases"]:
+                compact = _compact(alias)
+                if not compact:
+                    continue
+                position = len(aliases)
+                tokens = _tokens(alias)
+                trigrams = _trigrams(compact)
+                aliases.append((model["code"], compact, tokens, len(trigrams)))
+                exact.setdefault(compact, model["code"])
+                for token in tokens:
+                    by_token.setdefault(token, []).append(position)
+                for gram in trigrams:
+                    by_trigram.setdefault(gram, []).append(position)
+        self._aliases, self._exact, self._by_token, self._by_trigram = aliases, exact, by_token, by_trigram
+        self._results = {}
+
+    # ---------- 해석 ----------
+    def resolve(self, model_text) -> str:
+        """신청차종 텍스트 → 차종 코드 (해석 못 하면 '')"""
+        key = str(model_text or "")
+        results = self._results
+        code = results.get(key)
+        if code is None:
+            code = results[key] = self._resolve(key)
+        return code
+
+    def _resolve(self, model_text: str) -> str:
+        compact = _compact(model_text)
+        if not compact:
+            return ""
+        # 1) 별칭 완전일치
+        code = self._exact.get(compact)
+        if code:
+            return code
+
+        # 2) 별칭 토큰이 모두 포함된 별칭 중 가장 구체적인 것 (토큰 수, 길이, 카탈로그 순)
+        tokens = _tokens(model_text)
+        best = None
+        for position in {p for token in tokens for p in self._by_token.get(token, ())}:
+            alias_code, alias_compact, alias_tokens, _ = self._aliases[position]
+            if alias_tokens <= tokens:
+                rank = (len(alias_tokens), len(alias_compact), -position)
+                if best is None or rank > best[0]:
+                    best = (rank, alias_code)
+        if best:
+            return best[1]
+
+        # 3) 3-gram 유사도
+        grams = _trigrams(compact)
+        shared = {}
+        for gram in grams:
+            for position in self._by_trigram.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        best_score, best_code = 0.0, ""
+        for position in sorted(shared):
+            alias_code, _, _, gram_count = self._aliases[position]
+            score = 2 * shared[position] / (len(grams) + gram_count)
+            if score > best_score:
+                best_score, best_code = score, alias_code
+        return best_code if best_score >= FUZZY_THRESHOLD else ""
+
+    def learn_options(self, options) -> int:
+        """페이지의 model_cd 옵션 [(텍스트, 값), ...] 을 카탈로그에 반영. 새로 배운 항목 수 반환"""
+        learned = 0
+        with self._lock:
+            for text, value in options:
+                text, value = (text or "").strip(), (value or "").strip()
+                if not text or not value:
+                    continue  # '선택하세요' 같은 빈 값 옵션
+                if self._merge(self.learned, {"code": value, "label": text, "aliases": [text]}):
+                    learned += 1
+            if learned:
+                self._rebuild()
+                self.save_learned()
+        if learned:
+            print(f"[MODEL] 차종 옵션 {learned}개 카탈로그에 추가")
+        return learned
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_model_catalog() -> ModelCatalog:
+    """공용 차종 카탈로그"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ModelCatalog()
+    return _catalog
+
+
+def resolve_model_code(model: str) -> str:
+    """신청차종 텍스트 → model_cd 옵션 값 (매핑이 없으면 '')"""
+    return get_model_catalog().resolve(model)
+
+
+def pick_model_option(model: str, model_code: str, options):
+    """실제 model_cd 옵션 중 선택할 값 (없으면 None)
+
+    로드 시 해석한 코드가 옵션에 있으면 그대로 쓰고, 없으면 옵션을 카탈로그에 배운 뒤
+    다시 해석하고, 그래도 없으면 옵션 텍스트 매칭(match_model_value)으로 고른다.
+    options 는 [(텍스트, 값), ...] 또는 get_model_index 로 만든 ModelIndex (배치 동안 재사용).
+    """
+    index = get_model_index(options)
+    if model_code and model_code in index.value_set:
+        return model_code
+    catalog = get_model_catalog()
+    catalog.learn_options(index.options)
+    code = catalog.resolve(model)
+    if code in index.value_set:
+        return code
+    return index.match(model)
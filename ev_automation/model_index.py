@@ -0,0 +1,135 @@
+"""
+차종 옵션 인덱스 - model_cd 옵션 목록을 한 번만 전처리해 사용자마다 재사용
+
+match_model_value 는 조회할 때마다 모든 <option> 텍스트를 소문자로 바꾸고 정규식으로
+다시 토큰화한 뒤 완전일치 / 토큰 교집합 / 부분포함 순으로 목록을 세 번 훑는다.
+옵션 목록은 배치 내내 같으므로 목록별로 ModelIndex 를 한 번 만들어
+- 완전일치: 소문자 텍스트 / 공백 제거 텍스트 → 옵션 위치 dict
+- 토큰 교집합: 토큰 → 옵션 위치 역색인 (조회 비용은 사용자 토큰 수에 비례)
+- 조회 결과: 차종 텍스트 → 옵션 값 캐시
+를 두고, 인덱스 자체는 옵션 목록 해시로 캐시한다. 결과는 기존 match_model_value 와 같다.
+배치 내내 같은 목록을 쓰는 호출자는 get_model_index 결과(ModelIndex)를 들고 있다가 그대로 넘기면
+조회마다 목록을 다시 해시하지 않는다 (같은 튜플 객체도 id 로 바로 찾음).
+"""
+
+import re
+import threading
+
+# 옵션 목록별 인덱스 캐시 크기 (페이지/지역별로 목록이 몇 개 안 됨)
+MODEL_INDEX_CACHE_SIZE = 32
+
+_TOKEN = re.compile(r"[a-zA-Z]+|[0-9]+|[가-힣]+")
+
+
+def tokenize(text: str) -> set:
+    """숫자/영문/한글 토큰 집합"""
+    return set(_TOKEN.findall(text))
+
+
+def _normalize_query(user_text: str):
+    """(소문자 텍스트, 접두어/공백 제거 텍스트)"""
+    tx = (user_text or "").lower().strip()
+    norm = tx.replace("더뉴", "").replace("the new", "").replace(" ", "")
+    return tx, norm
+
+
+class ModelIndex:
+    """옵션 목록 [(텍스트, 값), ...] 하나에 대한 차종 매칭 인덱스"""
+
+    def __init__(self, options):
+        self.options = tuple((text, value) for text, value in options)
+        self.values = [value for _, value in self.options]
+        self.value_set = {value for value in self.values if value}
+        self.compact_texts = []
+        self.by_text = {}
+        self.by_compact = {}
+        self.token_index = {}
+        for position, (text, _) in enumerate(self.options):
+            lowered = (text or "").lower().strip()
+            compact = lowered.replace(" ", "")
+            self.compact_texts.append(compact)
+            # 같은 텍스트가 여러 번 나오면 앞 옵션 우선
+            self.by_text.setdefault(lowered, position)
+            self.by_compact.setdefault(compact, position)
+            for token in tokenize(lowered):
+                self.token_index.setdefault(token, []).append(position)
+        self._results = {}
+
+    def match(self, user_text: str):
+        """차종 텍스트 → 옵션 값. 완전일치 > 토큰 교집합 > 부분포함 순 (없으면 None)"""
+        try:
+            return self._results[user_text]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._match(user_text)
+        result = self._results[user_text] = self._match(user_text)
+        return result
+
+    def _match(self, user_text: str):
+        tx, norm = _normalize_query(user_text)
+        if not tx:
+            return None
+
+        # 1) 완전일치 (공백 제거 버전 포함) - 목록에서 먼저 나온 옵션
+        exact = [p for p in (self.by_text.get(tx), self.by_compact.get(norm)) if p is not None]
+        if exact:
+            return self.values[min(exact)]
+
+        # 2) 토큰 교집합 점수 - 최고 점수 중 먼저 나온 옵션
+        scores = {}
+        for token in tokenize(tx):
+            for position in self.token_index.get(token, ()):
+                scores[position] = scores.get(position, 0) + 1
+        if scores:
+            best_score = max(scores.values())
+            best = self.values[min(p for p, score in scores.items() if score == best_score)]
+            if best:
+                return best
+
+        # 3) 부분 포함
+        for position, compact in enumerate(self.compact_texts):
+            if norm in compact or compact in norm:
+                return self.values[position]
+        return None
+
+
+_indexes = {}
+# id(옵션 튜플) → (튜플, 인덱스). 튜플 참조를 잡아 두어 id 가 재사용되지 않게 함
+_indexes_by_id = {}
+_indexes_lock = threading.Lock()
+
+
+def get_model_index(options) -> ModelIndex:
+    """옵션 목록 해시로 캐시한 ModelIndex (같은 목록이면 배치 전체에서 재사용)
+
+    ModelIndex 를 넘기면 그대로, 전에 넘긴 것과 같은 튜플 객체면 해시 없이 바로 반환한다.
+    """
+    if isinstance(options, ModelIndex):
+        return options
+    if isinstance(options, tuple):
+        with _indexes_lock:
+            hit = _indexes_by_id.get(id(options))
+        if hit is not None and hit[0] is options:
+            return hit[1]
+    key = tuple((text, value) for text, value in options)
+    with _indexes_lock:
+        index = _indexes.get(key)
+    if index is None:
+        index = ModelIndex(key)
+        with _indexes_lock:
+            if len(_indexes) >= MODEL_INDEX_CACHE_SIZE:
+                # 가장 먼저 만든 인덱스부터 버림
+                _indexes.pop(next(iter(_indexes)))
+            index = _indexes.setdefault(key, index)
+    if isinstance(options, tuple):
+        with _indexes_lock:
+            if len(_indexes_by_id) >= MODEL_INDEX_CACHE_SIZE:
+                _indexes_by_id.pop(next(iter(_indexes_by_id)))
+            _indexes_by_id[id(options)] = (options, index)
+    return index
+
+
+def match_model_value(options, user_text: str):
+    """차종 텍스트를 옵션 목록(또는 ModelIndex)에 매핑. 완전일치 > 토큰 교집합 > 부분포함 순"""
+    return get_model_index(options).match(user_text)
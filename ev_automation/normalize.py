@@ -0,0 +1,134 @@
+"""
+입력값 정규화 - 전화번호, 날짜
+
+여러 입력 백엔드(Selenium/JS/Playwright)가 같은 규칙을 쓰도록 한곳에 모은다.
+"""
+
+import datetime
+import re
+from functools import lru_cache
+
+# 정규화 결과 메모 크기 (고객 수천 명 × 날짜/전화 필드 몇 개 정도)
+NORMALIZE_CACHE_SIZE = 8192
+
+# 미리 컴파일한 패턴
+_NON_DIGIT = re.compile(r"\D")
+_PHONE_FORMATTED = re.compile(r"010-[0-9]{4}-[0-9]{4}")
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_DATETIME = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})[ T]\d{1,2}:\d{2}")
+_KOREAN_DATE = re.compile(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일")
+
+# Excel 1900 날짜 체계 기준일 (1900년을 윤년으로 계산하므로 1900-01-01 + (n-2)일)
+_EXCEL_BASE_DATE = datetime.datetime(1900, 1, 1)
+
+
+def format_phone_number(raw: str) -> str:
+    """휴대폰/전화 마스크 적용: 010-1234-5678 형태로 보정"""
+    if not raw:
+        return raw
+    if not isinstance(raw, str):
+        return _format_phone_number(raw)
+    # 빠른 경로: 이미 마스크가 적용된 값
+    if _PHONE_FORMATTED.fullmatch(raw):
+        return raw
+    return _format_phone_number_cached(raw)
+
+
+def _format_phone_number(raw):
+    digits = _NON_DIGIT.sub("", raw)
+    if len(digits) == 11 and digits.startswith("010"):
+        return f"010-{digits[3:7]}-{digits[7:]}"
+    if len(digits) == 10:
+        return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+    return raw
+
+
+_format_phone_number_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(_format_phone_number)
+
+
+def normalize_date_string(date_text: str) -> str | None:
+    """여러 날짜 포맷을 YYYY-MM-DD로 정규화. 실패 시 None"""
+    if not date_text:
+        return None
+    s = str(date_text).strip()
+    # 빠른 경로: 이미 YYYY-MM-DD (로더/레코드 단계에서 정규화된 값이 다시 들어오는 경우)
+    if _ISO_DATE.fullmatch(s):
+        return s
+    return _normalize_date_cached(s)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_date_cached(s: str) -> str | None:
+    # 0) Excel 날짜 숫자 처리 (예: 29269 → 1980-02-18)
+    if s[:1].isdigit() or s[:1] in "+-.":
+        try:
+            excel_date_num = float(s)
+            if 1 <= excel_date_num <= 100000:  # Excel 날짜 범위
+                target_date = _EXCEL_BASE_DATE + datetime.timedelta(days=int(excel_date_num) - 2)
+                return target_date.strftime("%Y-%m-%d")
+        except (ValueError, OverflowError):
+            pass
+
+    # 0-1) 엑셀 날짜 셀 문자열: "2025-08-16 00:00:00" (시각 부분 제거)
+    datetime_match = _DATETIME.match(s)
+    if datetime_match:
+        y, m, d = (int(g) for g in datetime_match.groups())
+        return f"{y:04d}-{m:02d}-{d:02d}"
+
+    # 3) 한국어 날짜 형식: "1980년 02월 18일", "1980년 2월 18일" 등
+    korean_match = _KOREAN_DATE.search(s)
+    if korean_match:
+        y, m, d = (int(g) for g in korean_match.groups())
+        return f"{y:04d}-{m:02d}-{d:02d}"
+
+    # 1) YYYY-MM-DD / YYYY.MM.DD / YYYY/MM/DD
+    for sep in ("-", ".", "/"):
+        if sep not in s:
+            continue
+        parts = s.split(sep)
+        if len(parts) == 3 and all(parts):
+            try:
+                y, m, d = int(parts[0]), int(parts[1]), int(parts[2])
+                return f"{y:04d}-{m:02d}-{d:02d}"
+            except ValueError:
+                pass
+    # 2) 8자리 숫자 YYYYMMDD
+    digits = _NON_DIGIT.sub("", s)
+    if len(digits) == 8:
+        try:
+            y, m, d = int(digits[:4]), int(digits[4:6]), int(digits[6:])
+            return f"{y:04d}-{m:02d}-{d:02d}"
+        except ValueError:
+            return None
+    return None
+
+
+def normalize_dates(values) -> list:
+    """날짜 열 일괄 정규화 (같은 값은 한 번만 계산)"""
+    return _map_unique(normalize_date_string, values)
+
+
+def format_phone_numbers(values) -> list:
+    """전화번호 열 일괄 마스크 적용 (같은 값은 한 번만 계산)"""
+    return _map_unique(format_phone_number, values)
+
+
+def _map_unique(func, values) -> list:
+    results = {}
+    out = []
+    for value in values:
+        try:
+            result = results[value]
+        except KeyError:
+            result = results[value] = func(value)
+        except TypeError:  # 해시 불가 값
+            result = func(value)
+        out.append(result)
+    return out
+
+
+def clear_normalize_cache() -> None:
+    """정규화 메모 비우기 (코드 리로드/테스트용)"""
+    _format_phone_number_cached.cache_clear()
+    _normalize_date_cached.cache_clear()
+
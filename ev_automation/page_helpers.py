@@ -0,0 +1,455 @@
+"""
+페이지 헬퍼 - 문서마다 한 번 등록하는 window.__ev 헬퍼 라이브러리
+
+네이티브 setter, 이벤트 발화, readonly 해제/복원, 클릭, 필수 필드 검증, 확인코드 찾기 같은
+JS 를 호출할 때마다 통째로 보내면 매번 같은 스크립트를 전송하고 파싱하게 된다.
+여기서는 헬퍼를 window.__ev 하나로 묶어
+- Selenium: CDP Page.addScriptToEvaluateOnNewDocument 로 등록 (새 문서마다 자동 주입)
+- Playwright: add_init_script 로 등록
+해 두고, 이후에는 call_page_helper(driver, 'setValue', '#birth1', '1990-01-01') 처럼
+짧은 호출만 보낸다. 등록 전에 열린 문서나 CDP 를 못 쓰는 드라이버에서는 헬퍼가 없다는
+응답을 받으면 그 문서에 한 번 주입하고 다시 호출한다.
+"""
+
+import weakref
+
+from ev_automation.fill_script import FILL_JS
+
+# 헬퍼 내용이 바뀌면 올려서 이미 주입된 이전 버전을 덮어씀
+HELPERS_VERSION = 8
+
+_MISSING = '__EV_MISSING__'
+
+# 임시저장 전 필수 필드 (selector 는 선택 여부만 확인)
+REQUIRED_FIELDS_BEFORE_SAVE = [
+    {'id': 'req_nm', 'name': '성명'},
+    {'id': 'mobile', 'name': '휴대전화'},
+    {'id': 'birth1', 'name': '생년월일'},
+    {'id': 'contract_day', 'name': '계약일자'},
+    {'selector': 'input[name="req_sex"]:checked', 'name': '성별'},
+    {'id': 'req_kind', 'name': '신청유형'},
+    {'id': 'model_cd', 'name': '신청차종'},
+    {'id': 'addr', 'name': '주소'},
+    {'id': 'addr_detail', 'name': '상세주소'},
+]
+
+# 입력 직후 확인하는 필드
+REQUIRED_FIELDS_AFTER_FILL = [
+    {'id': 'req_nm', 'name': '성명'},
+    {'id': 'mobile', 'name': '휴대전화'},
+    {'id': 'birth1', 'name': '생년월일'},
+    {'selector': 'input[name="req_sex"]:checked', 'name': '성별'},
+    {'id': 'req_kind', 'name': '신청유형'},
+    {'id': 'model_cd', 'name': '신청차종'},
+]
+
+PAGE_HELPERS_BODY = """
+if (window.__ev && window.__ev.version === %(version)d) return;
+const ev = {version: %(version)d};
+
+ev.fire = (el, names) => names.forEach(n => { try { el.dispatchEvent(new Event(n, {bubbles:true})); } catch(e) {} });
+
+// 요소, CSS 선택자, 선택자 목록 중 무엇이든 받아 첫 요소 반환
+ev.find = (target) => {
+  if (!target) return null;
+  if (typeof target !== 'string' && !Array.isArray(target)) return target;
+  for (const sel of (Array.isArray(target) ? target : [target])) {
+    try { const el = document.querySelector(sel); if (el) return el; } catch(e) {}
+  }
+  return null;
+};
+
+const visible = (el) => !!el && !!(el.offsetWidth || el.offsetHeight || (el.getClientRects && el.getClientRects().length));
+
+// ---------- 요소 찾기 (locator.py) ----------
+const xpathLiteral = (s) => s.includes("'") ? '"' + s + '"' : "'" + s + "'";
+const xpathAll = (expr) => {
+  const out = [];
+  try {
+    const r = document.evaluate(expr, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+  } catch(e) {}
+  return out;
+};
+
+// 선택자 하나 → 요소 목록 (CSS / '/' 나 '(' 로 시작하면 XPath / text=문구)
+ev.queryAll = (sel) => {
+  if (sel.startsWith('text=')) return xpathAll('//*[contains(text(), ' + xpathLiteral(sel.slice(5)) + ')]');
+  if (sel.startsWith('/') || sel.startsWith('(')) return xpathAll(sel);
+  try { return Array.from(document.querySelectorAll(sel)); } catch(e) { return []; }
+};
+
+// 후보 목록을 순서대로 확인해 조건(visible/enabled)에 맞는 첫 요소 {element, selector, index}, 없으면 null
+// opts.all 이면 맞는 요소 전체 (중복 제거)
+ev.locate = (candidates, opts) => {
+  opts = opts || {};
+  const seen = new Set(), found = [];
+  for (let i = 0; i < candidates.length; i++) {
+    for (const el of ev.queryAll(candidates[i])) {
+      if (opts.visible && !visible(el)) continue;
+      if (opts.enabled && el.disabled) continue;
+      if (!opts.all) return {element: el, selector: candidates[i], index: i};
+      if (!seen.has(el)) { seen.add(el); found.push(el); }
+    }
+  }
+  return opts.all ? found : null;
+};
+
+ev.nativeSetter = (el) => {
+  const proto = el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+    : el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  const desc = Object.getOwnPropertyDescriptor(proto, 'value');
+  return desc && desc.set;
+};
+
+// disabled/readonly 를 잠시 해제하고 네이티브 setter 로 값 설정 + input/change/blur 발화 후 원복
+ev.setValue = (target, value) => {
+  const el = ev.find(target);
+  if (!el) return false;
+  const wasDisabled = !!el.disabled;
+  const wasReadonly = el.hasAttribute('readonly');
+  if (wasDisabled) el.disabled = false;
+  if (wasReadonly) el.removeAttribute('readonly');
+  try { ev.nativeSetter(el).call(el, value); } catch(e) { el.value = value; }
+  ev.fire(el, ['input', 'change']);
+  if (el.blur) { try { el.blur(); } catch(e) {} }
+  if (wasReadonly) el.setAttribute('readonly', 'readonly');
+  if (wasDisabled) el.disabled = true;
+  return true;
+};
+
+ev.click = (target) => {
+  const el = ev.find(target);
+  if (!el) return false;
+  try { el.scrollIntoView({block: 'center'}); } catch(e) {}
+  try { el.click(); } catch(e) { ev.fire(el, ['click']); }
+  return true;
+};
+
+// 같은 name 의 라디오를 모두 해제한 뒤 선택 (레이블 클릭까지)
+ev.checkRadio = (target) => {
+  const el = ev.find(target);
+  if (!el) return false;
+  if (el.name) document.querySelectorAll('input[name="' + el.name + '"]').forEach(r => { r.checked = false; });
+  el.checked = true;
+  try { el.click(); } catch(e) {}
+  ev.fire(el, ['change']);
+  if (el.id) { const label = document.querySelector('label[for="' + el.id + '"]'); if (label) { try { label.click(); } catch(e) {} } }
+  return !!el.checked;
+};
+
+// checks: [{id|selector, name}] → {ok, issues: ['성명: 값 없음', ...]}
+ev.validate = (checks) => {
+  const issues = [];
+  for (const c of (checks || [])) {
+    const el = c.selector ? document.querySelector(c.selector) : document.getElementById(c.id);
+    if (!el) issues.push(c.name + ': 요소 없음');
+    else if (c.selector) continue;
+    else if (el.tagName === 'SELECT') { if (!el.value) issues.push(c.name + ': 선택 안됨'); }
+    else if (!el.value) issues.push(c.name + ': 값 없음');
+  }
+  return {ok: issues.length === 0, issues: issues};
+};
+
+// 텍스트/onclick 에 단어가 들어 있는 첫 버튼 클릭
+ev.clickByText = (words, onclickWords, selector) => {
+  const cands = document.querySelectorAll(selector || 'button, input[type="button"], input[type="submit"], a, [role="button"]');
+  for (const el of cands) {
+    const txt = (el.textContent || el.value || '').trim();
+    const oc = (el.getAttribute && el.getAttribute('onclick')) || '';
+    if ((words || []).some(w => txt.includes(w)) || (onclickWords || []).some(w => oc.includes(w))) {
+      return ev.click(el);
+    }
+  }
+  return false;
+};
+
+// ---------- 버튼 찾기 (button_finder.py) ----------
+const BUTTON_SELECTOR = 'button, input[type="button"], input[type="submit"], input[type="image"], a, [role="button"]';
+const bestWeight = (hay, weights) => {
+  let best = 0;
+  for (const k in (weights || {})) if (hay.includes(k.toLowerCase())) best = Math.max(best, weights[k]);
+  return best;
+};
+
+// 역할 spec(text/onclick/attr 가중치, exact, exclude, container)으로 버튼 후보 점수를 매겨
+// 가장 높은 요소 {element, score, text, count}, 해당 후보가 없으면 null
+ev.rankButtons = (spec) => {
+  let best = null, count = 0;
+  for (const el of document.querySelectorAll(spec.selector || BUTTON_SELECTOR)) {
+    const text = (el.textContent || el.value || el.alt || '').replace(/\s+/g, ' ').trim();
+    const t = text.toLowerCase();
+    if ((spec.exclude || []).some(w => t.includes(w.toLowerCase()))) continue;
+    const oc = ((el.getAttribute('onclick') || '') + ' ' + (el.getAttribute('href') || '')).toLowerCase();
+    const attrs = [el.id, typeof el.className === 'string' ? el.className : '', el.getAttribute('name')].join(' ').toLowerCase();
+    let score = bestWeight(t, spec.text) + bestWeight(oc, spec.onclick) + bestWeight(attrs, spec.attr);
+    if (!score) continue;
+    if ((spec.exact || []).some(w => t === w.toLowerCase())) score += 5;
+    if (spec.container && el.closest && el.closest(spec.container)) score += 4;
+    score += visible(el) ? 3 : -10;
+    if (el.disabled) score -= 5;
+    count++;
+    if (!best || score > best.score) best = {element: el, score: score, text: text.slice(0, 40)};
+  }
+  if (best) { best.count = count; best.selector = ev.selectorFor(best.element); }
+  return best;
+};
+
+// ---------- 학습 캐시 (selectors_learning.LocatorCache) ----------
+// 요소를 다시 찾을 수 있는 고유 선택자 (#id / tag[name] / tag[onclick] / 텍스트 XPath / input[value]), 없으면 null
+ev.selectorFor = (el) => {
+  if (!el || !el.tagName) return null;
+  const tag = el.tagName.toLowerCase();
+  const unique = (sel) => ev.queryAll(sel).length === 1 ? sel : null;
+  const safe = (v) => v && !v.includes('"') && !v.includes("'");
+  if (el.id && /^[A-Za-z][\w-]*$/.test(el.id) && unique('#' + el.id)) return '#' + el.id;
+  const name = el.getAttribute('name');
+  if (safe(name) && unique(tag + '[name="' + name + '"]')) return tag + '[name="' + name + '"]';
+  const oc = el.getAttribute('onclick');
+  if (safe(oc) && unique(tag + '[onclick="' + oc + '"]')) return tag + '[onclick="' + oc + '"]';
+  const text = (el.textContent || '').replace(/\s+/g, ' ').trim();
+  if (safe(text) && text.length <= 30 && unique('//' + tag + "[normalize-space()='" + text + "']")) {
+    return '//' + tag + "[normalize-space()='" + text + "']";
+  }
+  if (tag === 'input' && safe(el.value) && unique('input[value="' + el.value + '"]')) return 'input[value="' + el.value + '"]';
+  return null;
+};
+
+ev.hash = (s) => {
+  let h = 0x811c9dc5;
+  for (let i = 0; i < s.length; i++) { h ^= s.charCodeAt(i); h = Math.imul(h, 0x01000193) >>> 0; }
+  return h.toString(16);
+};
+
+// 페이지 서명: URL 경로 + 폼 구조(입력 요소 태그/id/name 순서) 해시
+ev.pageSignature = () => {
+  const parts = [];
+  for (const el of document.querySelectorAll('form, input, select, textarea, button')) {
+    parts.push(el.tagName.toLowerCase() + ':' + (el.id || el.getAttribute('name') || el.type || ''));
+  }
+  return location.pathname + '#' + ev.hash(parts.join('|'));
+};
+
+// 이 페이지 서명으로 배운 선택자(known[서명])가 있으면 바로 찾아 {signature, selector, element}
+ev.locateKnown = (known, opts) => {
+  const signature = ev.pageSignature();
+  const selector = (known || {})[signature] || null;
+  const hit = selector ? ev.locate([selector], opts) : null;
+  return {signature: signature, selector: selector, element: hit ? hit.element : null};
+};
+
+// 확인코드 (영문/숫자 6~15자) 찾기
+ev.findCode = () => {
+  const pattern = /^[A-Za-z0-9]{6,15}$/;
+  const ok = (t) => pattern.test(t) && t !== '123' && t !== '321';
+  for (const row of document.querySelectorAll('table tr')) {
+    const cells = row.querySelectorAll('td,th');
+    if (cells.length >= 2) { const t = cells[1].textContent.trim(); if (ok(t)) return t; }
+  }
+  for (const s of document.querySelectorAll('span')) { const t = (s.textContent || '').trim(); if (ok(t)) return t; }
+  return null;
+};
+
+// 확인코드 입력 후 delay ms 뒤 확인 버튼 클릭 (클릭하면 window.codeSubmitted = true)
+ev.inputCode = (code, delay) => {
+  const input = ev.find(['#randeomChk', 'input[type="text"]', 'input[type="password"]',
+                         'input[placeholder*="코드"]', 'input[title*="코드"]']);
+  if (!input) return false;
+  try { input.focus(); input.select(); } catch(e) {}
+  ev.setValue(input, code);
+  ev.fire(input, ['keyup']);
+  window.codeSubmitted = false;
+  setTimeout(() => {
+    const button = ev.find(['button[onclick*="goCompare"]', 'button[type="submit"]'])
+      || Array.from(document.querySelectorAll('button')).find(b => ['확인', '제출', 'OK'].some(w => b.textContent.includes(w)));
+    if (button) { ev.click(button); window.codeSubmitted = true; }
+    else console.log('❌ 확인 버튼을 찾을 수 없음');
+  }, delay || 0);
+  return true;
+};
+
+// ---------- 대기 (waits.py) ----------
+// 진행 중인 fetch/XHR 수와 마지막 네트워크 활동 시각 (network idle 판단용, 헬퍼 버전이 바뀌어도 유지)
+const net = window.__evNet = window.__evNet || {pending: 0, last: Date.now()};
+const netStart = () => { net.pending++; net.last = Date.now(); };
+const netEnd = () => { net.pending = Math.max(0, net.pending - 1); net.last = Date.now(); };
+if (window.fetch && !window.fetch.__evTracked) {
+  const origFetch = window.fetch;
+  window.fetch = function () {
+    netStart();
+    return origFetch.apply(this, arguments).then((r) => { netEnd(); return r; }, (e) => { netEnd(); throw e; });
+  };
+  window.fetch.__evTracked = true;
+}
+if (window.XMLHttpRequest && !XMLHttpRequest.prototype.__evTracked) {
+  const origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    netStart();
+    this.addEventListener('loadend', netEnd);
+    return origSend.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.__evTracked = true;
+}
+
+// 조건 dict (waits.py 의 dom_ready/element_present/... 가 만듦) → 지금 만족하는지
+ev.check = (c) => {
+  switch (c.kind) {
+    case 'ready': return document.readyState === 'complete';
+    case 'selector': { const el = ev.find(c.selector); return !!el && (!c.visible || visible(el)); }
+    case 'gone': { const el = ev.find(c.selector); return !el || !visible(el); }
+    case 'count': return document.querySelectorAll(c.selector).length >= c.min;
+    case 'enabled': { const el = ev.find(c.selector); return !!el && !el.disabled; }
+    case 'value': { const el = ev.find(c.selector); if (!el) return false;
+      return c.value === null || c.value === undefined ? !!el.value : String(el.value).startsWith(c.value); }
+    case 'text': return !!document.body && (document.body.innerText || '').includes(c.text);
+    case 'idle': {
+      const jq = (typeof jQuery !== 'undefined' && jQuery.active) || 0;
+      return net.pending === 0 && jq === 0 && Date.now() - net.last >= c.quiet;
+    }
+    case 'any': return (c.conditions || []).some(ev.check);
+    case 'all': return (c.conditions || []).every(ev.check);
+  }
+  return false;
+};
+
+// 조건 목록 각각의 현재 만족 여부 (입력 계획의 조건 그룹별 확인)
+ev.checkEach = (conditions) => (conditions || []).map(c => { try { return !!ev.check(c); } catch(e) { return false; } });
+
+// 조건이 만족되면 바로 resolve (DOM 변경 감지 + 값/네트워크 조건용 짧은 주기 확인)
+ev.waitFor = (c, timeout) => new Promise((resolve) => {
+  const start = Date.now();
+  let finished = false, observer = null, timer = null, limit = null;
+  const finish = (ok) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(timer); clearTimeout(limit);
+    resolve({ok: ok, elapsed: Date.now() - start});
+  };
+  const test = () => { try { if (ev.check(c)) finish(true); } catch(e) {} };
+  test();
+  if (finished) return;
+  try {
+    observer = new MutationObserver(test);
+    observer.observe(document.documentElement || document, {childList: true, subtree: true, attributes: true, characterData: true});
+  } catch(e) {}
+  timer = setInterval(test, 50);
+  limit = setTimeout(() => finish(false), timeout);
+});
+
+// 입력 확인용: 필드 목록(fill 페이로드 형식)의 현재 값 {id: {found, value, text?, checked?}}
+ev.readFields = (fields) => {
+  const out = {};
+  for (const f of (fields || [])) {
+    const el = ev.find(f.selectors || ['#' + f.id]);
+    if (!el) { out[f.id] = {found: false}; continue; }
+    const r = {found: true, value: el.value == null ? '' : String(el.value)};
+    if (f.kind === 'radio' || f.kind === 'check') r.checked = !!el.checked;
+    if (el.tagName === 'SELECT' && el.selectedIndex >= 0) r.text = (el.options[el.selectedIndex].textContent || '').trim();
+    out[f.id] = r;
+  }
+  return out;
+};
+
+// 신청서 전체 입력 (fill_script.FILL_JS)
+ev.fill = function (payload) {
+%(fill)s
+};
+
+window.__ev = ev;
+""" % {'version': HELPERS_VERSION, 'fill': FILL_JS}
+
+# Selenium execute_script / CDP 등록용 (즉시 실행)
+PAGE_HELPERS_JS = "(function () {" + PAGE_HELPERS_BODY + "})();"
+# Playwright evaluate 용 (함수 형태)
+PLAYWRIGHT_PAGE_HELPERS_JS = "() => {" + PAGE_HELPERS_BODY + "}"
+
+CALL_HELPER_JS = f"""
+const h = window.__ev;
+if (!h || h.version !== arguments[0]) return '{_MISSING}';
+return h[arguments[1]].apply(h, arguments[2]);
+"""
+PLAYWRIGHT_CALL_HELPER_JS = f"""([version, name, args]) => {{
+  const h = window.__ev;
+  if (!h || h.version !== version) return '{_MISSING}';
+  return h[name].apply(h, args);
+}}"""
+
+ASYNC_CALL_HELPER_JS = f"""
+const done = arguments[arguments.length - 1];
+const h = window.__ev;
+if (!h || h.version !== arguments[0]) {{ done('{_MISSING}'); return; }}
+Promise.resolve(h[arguments[1]].apply(h, arguments[2])).then(done, (e) => done({{error: String(e)}}));
+"""
+
+# CDP 등록을 시도한 드라이버 (드라이버마다 한 번만)
+_registered = weakref.WeakSet()
+
+
+def install_page_helpers(driver) -> bool:
+    """새 문서마다 헬퍼가 주입되도록 CDP 에 등록하고 현재 문서에도 주입"""
+    if driver not in _registered:
+        _registered.add(driver)
+        try:
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': PAGE_HELPERS_JS})
+        except Exception as e:
+            print(f"[WARNING] 페이지 헬퍼 CDP 등록 실패 (필요할 때 문서마다 주입): {e}")
+    try:
+        driver.execute_script(PAGE_HELPERS_JS)
+        return True
+    except Exception as e:
+        print(f"[WARNING] 페이지 헬퍼 주입 실패: {e}")
+        return False
+
+
+def call_page_helper(driver, name: str, *args):
+    """window.__ev.<name>(*args) 호출 (헬퍼가 없는 문서면 주입 후 한 번 더)"""
+    if driver not in _registered:
+        install_page_helpers(driver)
+    result = driver.execute_script(CALL_HELPER_JS, HELPERS_VERSION, name, list(args))
+    if result == _MISSING:
+        driver.execute_script(PAGE_HELPERS_JS)
+        result = driver.execute_script(CALL_HELPER_JS, HELPERS_VERSION, name, list(args))
+    return result
+
+
+def call_page_helper_async(driver, timeout: float, name: str, *args):
+    """Promise 를 돌려주는 헬퍼(waitFor 등)를 execute_async_script 로 호출 (timeout 초)
+
+    스크립트 타임아웃은 드라이버 전체 설정(이후 execute_script 에도 적용)이므로 호출 뒤 원래 값으로 되돌린다.
+    """
+    if driver not in _registered:
+        install_page_helpers(driver)
+    try:
+        previous = driver.timeouts.script
+    except Exception:
+        previous = None
+    driver.set_script_timeout(timeout)
+    try:
+        result = driver.execute_async_script(ASYNC_CALL_HELPER_JS, HELPERS_VERSION, name, list(args))
+        if result == _MISSING:
+            driver.execute_script(PAGE_HELPERS_JS)
+            result = driver.execute_async_script(ASYNC_CALL_HELPER_JS, HELPERS_VERSION, name, list(args))
+    finally:
+        if previous is not None:
+            try:
+                driver.set_script_timeout(previous)
+            except Exception:
+                pass
+    return result
+
+
+def install_page_helpers_playwright(context, page=None) -> None:
+    """Playwright 컨텍스트(또는 페이지)에 init script 로 등록하고 열려 있는 페이지에도 주입"""
+    context.add_init_script(PAGE_HELPERS_JS)
+    if page is not None:
+        page.evaluate(PLAYWRIGHT_PAGE_HELPERS_JS)
+
+
+def call_page_helper_playwright(page, name: str, *args):
+    """Playwright 페이지에서 window.__ev.<name>(*args) 호출"""
+    result = page.evaluate(PLAYWRIGHT_CALL_HELPER_JS, [HELPERS_VERSION, name, list(args)])
+    if result == _MISSING:
+        page.evaluate(PLAYWRIGHT_PAGE_HELPERS_JS)
+        result = page.evaluate(PLAYWRIGHT_CALL_HELPER_JS, [HELPERS_VERSION, name, list(args)])
+    return result
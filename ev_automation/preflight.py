@@ -0,0 +1,98 @@
+"""
+사전 검증 - 브라우저를 띄우기 전에 로드된 사용자 전체를 한 번에 검사
+
+필수 필드 누락은 로더의 경고 출력으로만, 잘못된 날짜는 입력 도중에야 드러나서
+실패할 레코드에 브라우저 시간을 쓰게 된다. 여기서 미리
+- 필수 필드 (성명, 휴대전화, 생년월일, 성별, 주소)
+- 날짜 인식 여부 (계약일자, 생년월일, 출고예정일자, 공동명의자 생년월일)
+- 휴대전화 형식 (010-XXXX-XXXX)
+- 신청차종 → 차종 코드 매핑 여부
+- 공동명의자 정보 (수를 적었으면 성명/생년월일 필요)
+를 검사하고 실패 목록을 표로 보여준다.
+
+스트리밍 실행기(시트가 파싱되는 대로 처리)는 전체 목록을 미리 알 수 없으므로
+레코드마다 validate_user 로 건너뛰기만 하고, 표는 워크북 캐시 히트일 때만 시작 전에,
+그 외에는 실행이 끝난 뒤 요약으로 출력한다.
+"""
+
+import re
+
+from ev_automation.field_rules import REQUIRED_FIELDS
+from ev_automation.user_record import UserRecord
+
+MOBILE_PATTERN = re.compile(r'^01[016789]-\d{3,4}-\d{4}$')
+
+
+def validate_user(user) -> list:
+    """사용자 한 명 검사. 문제 목록 [{'필드', '문제', '값'}, ...] (문제 없으면 빈 목록)"""
+    record = UserRecord.coerce(user)
+    issues = []
+
+    def add(field_name, problem, value=''):
+        issues.append({'필드': field_name, '문제': problem, '값': '' if value is None else str(value)})
+
+    for field_name in REQUIRED_FIELDS:
+        if field_name in (record.invalid or {}):
+            continue  # 날짜 오류로 따로 보고
+        if not record.get(field_name):
+            add(field_name, '필수 필드 누락')
+
+    for field_name, raw_value in (record.invalid or {}).items():
+        add(field_name, '날짜 형식 인식 실패', raw_value)
+
+    if record.phone and not MOBILE_PATTERN.match(record.phone):
+        add('휴대전화', '휴대전화 형식 오류', record.phone)
+
+    if not record.model:
+        add('신청차종', '필수 필드 누락')
+    elif not record.model_code:
+        add('신청차종', '차종 코드 매핑 없음', record.model)
+
+    if record.joint_count is not None and record.joint_count > 0:
+        if not record.joint_name:
+            add('공동명의자 성명', f'공동명의자 {record.joint_count}명인데 성명 없음')
+        if not record.joint_birth and '공동명의자 생년월일' not in (record.invalid or {}):
+            add('공동명의자 생년월일', f'공동명의자 {record.joint_count}명인데 생년월일 없음')
+
+    return issues
+
+
+def summarize_issues(issues) -> str:
+    """문제 목록 한 줄 요약 (스트리밍 처리 중 건너뛸 때 출력용)"""
+    return ", ".join(f"{issue['필드']} {issue['문제']}" for issue in issues)
+
+
+def run_preflight(users) -> dict:
+    """사용자 목록 일괄 검사
+
+    반환: {'passed': [레코드...], 'failed': [(레코드, 문제 목록)...], 'rows': 표 행 목록}
+    """
+    passed = []
+    failed = []
+    rows = []
+    for index, user in enumerate(users, 1):
+        record = UserRecord.coerce(user)
+        issues = validate_user(record)
+        if not issues:
+            passed.append(record)
+            continue
+        failed.append((record, issues))
+        for issue in issues:
+            rows.append({'번호': index, '성명': record.name or '(이름 없음)', **issue})
+    return {'passed': passed, 'failed': failed, 'rows': rows}
+
+
+def format_report(result: dict) -> str:
+    """검사 결과를 표 문자열로"""
+    total = len(result['passed']) + len(result['failed'])
+    lines = [f"🧪 사전 검증: {total}명 중 통과 {len(result['passed'])}명, 실패 {len(result['failed'])}명"]
+    if result['rows']:
+        lines.append(f"{'번호':>4}  {'성명':<8} {'필드':<12} {'문제':<28} 값")
+        lines.append("-" * 72)
+        for row in result['rows']:
+            lines.append(f"{row['번호']:>4}  {row['성명']:<8} {row['필드']:<12} {row['문제']:<28} {row['값']}")
+    return "\n".join(lines)
+
+
+def print_report(result: dict) -> None:
+    print(format_report(result))
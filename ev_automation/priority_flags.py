@@ -0,0 +1,132 @@
+"""
+우선순위 플래그 - '우선순위' 자유 텍스트를 로드 시 한 번 해석해 신청서 체크 항목으로
+
+키워드 → 플래그 규칙을 표(PRIORITY_RULES)로 두고, 텍스트에 들어 있는 키워드를 한 번만
+찾아 모든 규칙을 평가한다. 입력 단계에서는 PriorityFlags 를 인자로 넘겨 고정된
+APPLY_PRIORITY_JS 한 번으로 체크/선택을 적용한다 (사용자마다 JS 문자열을 새로 만들지 않음).
+
+규칙 종류
+- ('flag', 플래그, {'all': [...], 'any': [...]}): all 키워드가 모두, any 키워드 중 하나라도 있으면 True
+- ('first', 플래그, [(키워드 목록, 값), ...]): 키워드가 하나라도 있는 첫 항목의 값
+"""
+
+from dataclasses import asdict, dataclass
+
+PRIORITY_RULES = [
+    ('flag', 'has_social', {'all': ['사회계층'], 'any': ['Y', '예']}),
+    ('first', 'child_count', [(['2자녀'], '2'), (['3자녀'], '3'), (['4자녀'], '4')]),
+    # 다자녀 여부는 유형 코드(첫 일치)와 별도로 키워드만 본다 ('장애 다자녀' 도 다자녀)
+    ('flag', 'multi_child', {'any': ['다자녀']}),
+    ('flag', 'first_buy', {'any': ['생애최초']}),
+    ('flag', 'improve_fd', {'any': ['미세먼지', '노후경유', '택시']}),
+    ('flag', 'improve_detail1', {'any': ['노후경유', '폐차']}),
+    ('flag', 'improve_detail2', {'any': ['택시']}),
+    ('flag', 'exchange', {'any': ['폐차', '수출말소']}),
+    # 사회계층 유형 코드 (social_kind 옵션 값)
+    ('first', 'social_kind', [
+        (['국가유공'], '1'),
+        (['장애'], '2'),
+        (['다자녀'], '3'),
+        (['다문화'], '4'),
+        (['기초생활', '차상위'], '5'),
+        (['소상공인'], '6'),
+        (['기타'], '9'),
+    ]),
+]
+
+
+@dataclass(slots=True)
+class PriorityFlags:
+    """우선순위 텍스트에서 뽑은 신청서 체크 항목"""
+    has_social: bool = False
+    social_kind: str = ''
+    child_count: str = ''
+    multi_child: bool = False
+    first_buy: bool = False
+    improve_fd: bool = False
+    improve_detail1: bool = False
+    improve_detail2: bool = False
+    exchange: bool = False
+
+    def any(self) -> bool:
+        """적용할 항목이 하나라도 있는지"""
+        return any(asdict(self).values())
+
+    def to_args(self) -> dict:
+        """APPLY_PRIORITY_JS 인자"""
+        return asdict(self)
+
+
+def _compile_rules(rules):
+    """규칙 표 → (전체 키워드 튜플, 평가 함수 목록)"""
+    keywords = []
+    compiled = []
+    for kind, flag, spec in rules:
+        if kind == 'flag':
+            all_of = tuple(spec.get('all', ()))
+            any_of = tuple(spec.get('any', ()))
+            keywords.extend(all_of + any_of)
+            compiled.append((flag, kind, (all_of, any_of)))
+        elif kind == 'first':
+            choices = tuple((tuple(words), value) for words, value in spec)
+            for words, _ in choices:
+                keywords.extend(words)
+            compiled.append((flag, kind, choices))
+        else:
+            raise ValueError(f"알 수 없는 우선순위 규칙 종류: {kind}")
+    return tuple(dict.fromkeys(keywords)), compiled
+
+
+_KEYWORDS, _COMPILED_RULES = _compile_rules(PRIORITY_RULES)
+
+
+def parse_priority_flags(priority_text: str) -> PriorityFlags:
+    """우선순위 자유 텍스트 → PriorityFlags (사회계층, 다자녀, 생애최초 등)"""
+    text = (priority_text or '').strip()
+    flags = PriorityFlags()
+    if not text:
+        return flags
+    found = {keyword for keyword in _KEYWORDS if keyword in text}
+    if not found:
+        return flags
+    for flag, kind, spec in _COMPILED_RULES:
+        if kind == 'flag':
+            all_of, any_of = spec
+            value = all(w in found for w in all_of) and (not any_of or any(w in found for w in any_of))
+        else:
+            value = next((v for words, v in spec if any(w in found for w in words)), '')
+        setattr(flags, flag, value)
+    return flags
+
+
+# 인자 f = PriorityFlags.to_args(). Selenium 은 'const f = arguments[0];' 을 앞에 붙여 실행하고,
+# Playwright 는 fill 페이로드의 priority 로 넘겨 FILL_JS 안에서 적용한다.
+APPLY_PRIORITY_JS = """
+const click = (id) => { const el = document.getElementById(id); if (!el) return false; try { el.click(); } catch(e) { el.checked=true; } try{ el.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){} return true; };
+const selectVal = (id, v) => { const el = document.getElementById(id); if (!el) return false; try{ el.disabled=false; }catch(e){} el.value=v; try{ el.dispatchEvent(new Event('change',{bubbles:true})); }catch(e){} return true; };
+const show = (sel, flag) => { try{ const el=document.querySelector(sel); if(el) el.style.display = flag? '' : 'none'; }catch(e){} };
+const check = (id) => { const el=document.getElementById(id); if(el) el.checked=true; return !!el; };
+const applied = [];
+
+// 사회계층
+if (f.has_social) {
+  if (click('social_yn1')) applied.push('social_yn1');
+  if (f.social_kind && selectVal('social_kind', f.social_kind)) applied.push('social_kind');
+  if (f.child_count && selectVal('children_cnt', f.child_count)) applied.push('children_cnt');
+}
+
+// 생애최초
+if (f.first_buy && click('first_buy_yn1')) applied.push('first_buy_yn1');
+
+// 미세먼지 개선효과 관련
+if (f.improve_fd && click('improve_fd_yn1')) { show('#div_improve_fd_yn', true); applied.push('improve_fd_yn1'); }
+if (f.improve_detail1 && check('improve_fd_detail1')) applied.push('improve_fd_detail1');
+if (f.improve_detail2 && check('improve_fd_detail2')) applied.push('improve_fd_detail2');
+
+// 내연기관 폐차/수출말소 지원여부
+if (f.exchange && click('exchange_yn1')) applied.push('exchange_yn1');
+
+return applied;
+"""
+
+SELENIUM_APPLY_PRIORITY_JS = "const f = arguments[0];\n" + APPLY_PRIORITY_JS
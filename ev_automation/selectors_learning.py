@@ -1,8 +1,24 @@
+"""
+선택자 학습
+
+- load_learned_selectors / save_learned_selector: 필드 이름 → 선택자 목록 (단순 JSON)
+- LocatorCache: 페이지 서명(URL 경로 + 폼 구조 해시)별로 역할(temp_save, confirm, submit,
+  file_input ...)마다 실제로 찾은 선택자와 적중/실패 횟수, 소요 시간을 기록한다.
+  다음 조회는 배운 선택자를 먼저 시도하고, 못 찾을 때만 전체 탐색으로 넘어간다.
+  파일은 새 선택자를 배울 때(learn)와 실행 끝(flush)에만 쓴다. 적중/실패 횟수는 메모리에 모아 둔다.
+"""
+
+import atexit
 import json
 import os
+import threading
+import time
+
+from ev_automation.page_helpers import call_page_helper
 
 
 DEFAULT_LEARNED_FILE = "D:/Project/AutoClick/learned_selectors.json"
+DEFAULT_LOCATOR_FILE = os.path.join("data", "learned_locators.json")
 
 
 def load_learned_selectors(path: str = DEFAULT_LEARNED_FILE):
@@ -27,3 +43,154 @@ def save_learned_selector(field_name: str, selectors: list[str], path: str = DEF
         return False
 
 
+class LocatorCache:
+    """페이지 서명 → 역할 → {selector, hits, misses, hit_ms, search_ms, score, updated}"""
+
+    def __init__(self, path: str | None = DEFAULT_LOCATOR_FILE):
+        self.path = path
+        self.pages = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.pages = json.load(f).get('pages', {})
+            except Exception as e:
+                print(f"[WARNING] 선택자 캐시 읽기 실패 ({path}): {e}")
+
+    def save(self) -> bool:
+        if not self.path:
+            return False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with self._lock:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': 1, 'pages': self.pages}, f, ensure_ascii=False, indent=2)
+                self._dirty = False
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"[WARNING] 선택자 캐시 저장 실패: {e}")
+            return False
+
+    def flush(self) -> bool:
+        """저장하지 않은 적중/실패 기록이 있을 때만 저장 (실행 끝에 호출)"""
+        if not self._dirty:
+            return False
+        return self.save()
+
+    def known(self, role: str) -> dict:
+        """페이지 서명 → 이 역할로 배운 선택자"""
+        with self._lock:
+            return {sig: roles[role]['selector'] for sig, roles in self.pages.items()
+                    if role in roles and roles[role].get('selector')}
+
+    def entry(self, signature: str, role: str) -> dict:
+        with self._lock:
+            return dict(self.pages.get(signature, {}).get(role, {}))
+
+    @staticmethod
+    def _average(old: float, count: int, value: float) -> float:
+        return round(value if count <= 1 else old + (value - old) / count, 1)
+
+    def record_hit(self, signature: str, role: str, elapsed_ms: float):
+        with self._lock:
+            e = self.pages.setdefault(signature, {}).setdefault(role, {})
+            e['hits'] = e.get('hits', 0) + 1
+            e['hit_ms'] = self._average(e.get('hit_ms', 0.0), e['hits'], elapsed_ms)
+            self._dirty = True
+
+    def record_miss(self, signature: str, role: str):
+        with self._lock:
+            e = self.pages.setdefault(signature, {}).setdefault(role, {})
+            e['misses'] = e.get('misses', 0) + 1
+            self._dirty = True
+
+    def learn(self, signature: str, role: str, selector: str, elapsed_ms: float, score=None):
+        """전체 탐색으로 찾은 선택자를 이 페이지/역할의 승자로 기록"""
+        with self._lock:
+            e = self.pages.setdefault(signature, {}).setdefault(role, {})
+            if e.get('selector') != selector:
+                print(f"[LEARN] {role} 선택자 학습: {selector}")
+            e['selector'] = selector
+            e['searches'] = e.get('searches', 0) + 1
+            e['search_ms'] = self._average(e.get('search_ms', 0.0), e['searches'], elapsed_ms)
+            if score is not None:
+                e['score'] = score
+            e['updated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.save()
+
+    def find(self, driver, role: str, search, visible: bool = True):
+        """배운 선택자를 먼저 시도하고, 없거나 못 찾으면 search() → (element, selector, score) 전체 탐색
+
+        반환: (element, score). 캐시 적중이면 score 는 학습할 때의 점수
+        """
+        start = time.perf_counter()
+        signature = None
+        try:
+            probe = call_page_helper(driver, 'locateKnown', self.known(role), {'visible': visible}) or {}
+            signature = probe.get('signature')
+            if probe.get('element') is not None:
+                self.record_hit(signature, role, (time.perf_counter() - start) * 1000)
+                print(f"[LEARN] {role} 학습된 선택자로 찾음: {probe['selector']}")
+                return probe['element'], self.entry(signature, role).get('score', 0)
+            if probe.get('selector'):
+                print(f"[LEARN] {role} 학습된 선택자로 못 찾음 → 전체 탐색: {probe['selector']}")
+                self.record_miss(signature, role)
+        except Exception as e:
+            print(f"[LEARN] {role} 캐시 조회 실패: {e}")
+        start = time.perf_counter()
+        element, selector, score = search()
+        if element is not None and selector and signature:
+            self.learn(signature, role, selector, (time.perf_counter() - start) * 1000, score)
+        return element, score
+
+    def summary(self) -> dict:
+        """역할별 적중/실패 합계와 평균 소요 시간"""
+        roles = {}
+        with self._lock:
+            for page in self.pages.values():
+                for role, e in page.items():
+                    r = roles.setdefault(role, {'pages': 0, 'hits': 0, 'misses': 0, 'hit_ms': [], 'search_ms': []})
+                    r['pages'] += 1
+                    r['hits'] += e.get('hits', 0)
+                    r['misses'] += e.get('misses', 0)
+                    if e.get('hits'):
+                        r['hit_ms'].append(e.get('hit_ms', 0.0))
+                    if e.get('searches'):
+                        r['search_ms'].append(e.get('search_ms', 0.0))
+        for r in roles.values():
+            r['hit_ms'] = round(sum(r['hit_ms']) / len(r['hit_ms']), 1) if r['hit_ms'] else None
+            r['search_ms'] = round(sum(r['search_ms']) / len(r['search_ms']), 1) if r['search_ms'] else None
+        return roles
+
+    def format_stats(self) -> str:
+        roles = self.summary()
+        if not roles:
+            return "[LEARN] 학습된 선택자 없음"
+        lines = ["[LEARN] 선택자 캐시:"]
+        for role, r in sorted(roles.items()):
+            hit_ms = f"{r['hit_ms']}ms" if r['hit_ms'] is not None else '-'
+            search_ms = f"{r['search_ms']}ms" if r['search_ms'] is not None else '-'
+            lines.append(f"   - {role}: 페이지 {r['pages']}개, 적중 {r['hits']} / 실패 {r['misses']}"
+                         f" (적중 {hit_ms}, 전체 탐색 {search_ms})")
+        return "\n".join(lines)
+
+
+_locator_cache = None
+_locator_cache_lock = threading.Lock()
+
+
+def get_locator_cache() -> LocatorCache:
+    """공용 선택자 캐시"""
+    global _locator_cache
+    if _locator_cache is None:
+        with _locator_cache_lock:
+            if _locator_cache is None:
+                _locator_cache = LocatorCache()
+                # 실행 끝 보고 전에 멈춘 경우에도 적중/실패 기록을 남김
+                atexit.register(_locator_cache.flush)
+    return _locator_cache
@@ -4,6 +4,8 @@
 간단한 필드 매핑 분석기
 """
 
+from ev_automation.model_catalog import get_model_catalog
+
 def analyze_gui_automation():
     """GUI 자동화에서 데이터-필드 매핑 분석"""
     
@@ -77,14 +79,9 @@ def analyze_gui_automation():
     
     print("\n🎯 차종 매핑 로직")
     print("-" * 60)
-    model_mapping = {
-        "EV3 스탠다드": "EV3_2WD_S",
-        "레이EV / 레이 EV": "RAY_4_R", 
-        "EV3 롱레인지": "EV3_2WD_L17"
-    }
-    
-    for model_name, model_code in model_mapping.items():
-        print(f"{model_name:<20} → {model_code}")
+    # 차종 카탈로그 (model_catalog.json + 페이지에서 배운 옵션)
+    for model in get_model_catalog().entries():
+        print(f"{' / '.join(model['aliases']):<40} → {model['code']}")
     
     print("\n📋 요약")
     print("-" * 60)
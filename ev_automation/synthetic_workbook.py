@@ -0,0 +1,223 @@
+"""
+합성 워크북 생성기 - 실제 고객 워크북과 같은 모양의 xlsx 를 크기별로 생성 (벤치마크용)
+
+- 첫 시트는 '요약', 나머지는 2~4자 한글 이름의 고객 시트 (10 ~ 10,000개)
+- 고객 시트는 1행 헤더, 2행부터 열 M(필드명)/N(값), 열 B 에 메모 셀
+- 생년월일은 Excel 날짜 숫자(서식 없음), 계약일자는 날짜 서식 숫자, 나머지는 공유 문자열
+- 일부 고객은 공동명의자 키(공동명의자수/공동1_성명/공동1_생년월일)를 가짐
+
+openpyxl 로 10,000 시트를 쓰면 몇 분이 걸려서 zip 안의 XML 을 직접 쓴다.
+같은 seed 면 항상 같은 파일 내용이 나온다.
+
+사용법: python -m ev_automation.synthetic_workbook <출력.xlsx> [--sheets N] [--seed S] [--joint-ratio R]
+"""
+
+import argparse
+import random
+import zipfile
+from datetime import date
+from xml.sax.saxutils import escape
+
+MAX_SHEETS = 10000
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_SYLLABLES = "민수영희철호진아서준지현우성은혜주연하윤도경태상"
+GENDERS = ["남", "여", "남자", "여자"]
+MODELS = ["EV3 스탠다드", "EV3 롱레인지", "레이EV 4인승"]
+PRIORITIES = ["", "사회계층 Y. 다자녀가구. 2자녀", "생애최초 구매", "차상위 이하", "다자녀가구 3자녀"]
+REGIONS = ["제천시 의림지로", "청주시 상당구 상당로", "충청북도 충주시 중앙로", "인천시 강저로", "서울특별시 강남구 테헤란로"]
+
+# 1980-02-18 = 29269 부터 약 20년 범위
+BIRTH_SERIAL_START = 29269
+EXCEL_EPOCH_ORDINAL = date(1899, 12, 30).toordinal()
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '{sheets}</Types>'
+)
+_SHEET_CONTENT_TYPE = (
+    '<Override PartName="/xl/worksheets/sheet{index}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+# cellXfs 0 = 일반, 1 = 날짜 서식(14: yyyy-mm-dd)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="맑은 고딕"/></font></fonts>'
+    '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+    '<borders count="1"><border/></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+DATE_STYLE = 1
+
+
+def sheet_names(count: int, seed: int = 0) -> list:
+    """서로 다른 2~4자 한글 고객 이름 count 개 (같은 seed 면 같은 순서)"""
+    if count > MAX_SHEETS:
+        raise ValueError(f"고객 시트는 최대 {MAX_SHEETS}개까지 생성합니다: {count}")
+    rng = random.Random(seed)
+    names = []
+    seen = {"요약"}
+    while len(names) < count:
+        length = rng.choices((1, 2, 3), weights=(2, 7, 1))[0]
+        name = rng.choice(SURNAMES) + "".join(rng.choice(GIVEN_SYLLABLES) for _ in range(length))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def user_fields(name: str, index: int, rng: random.Random, joint_ratio: float) -> list:
+    """고객 시트 한 장의 (필드명, 값) 목록. 날짜 서식 셀은 ('date', 일련번호) 로 표시"""
+    contract = date(2025, 8, 1).toordinal() + rng.randint(0, 30) - EXCEL_EPOCH_ORDINAL
+    fields = [
+        ("성명", name),
+        ("휴대전화", f"010{rng.randint(1000, 9999)}{index % 10000:04d}" if index % 3 == 0
+         else f"010-{rng.randint(1000, 9999)}-{index % 10000:04d}"),
+        ("생년월일", BIRTH_SERIAL_START + rng.randint(0, 7300)),
+        ("성별", rng.choice(GENDERS)),
+        ("주소", f"{rng.choice(REGIONS)} {rng.randint(1, 300)}"),
+        ("계약일자", ("date", contract)),
+        ("신청유형", "개인"),
+        ("신청차종", rng.choice(MODELS)),
+        ("신청대수", 1),
+        ("출고예정일자", f"2025-{rng.randint(9, 12):02d}-{rng.randint(1, 28):02d}"),
+        ("이메일", "."),
+        ("전화", "."),
+        ("우선순위", rng.choice(PRIORITIES)),
+    ]
+    if rng.random() < joint_ratio:
+        fields += [
+            ("공동명의자수", 1),
+            ("공동1_성명", rng.choice(SURNAMES) + "".join(rng.choice(GIVEN_SYLLABLES) for _ in range(2))),
+            ("공동1_생년월일", BIRTH_SERIAL_START + rng.randint(0, 7300)),
+        ]
+    return fields
+
+
+class _SharedStrings:
+    def __init__(self):
+        self.index = {}
+        self.strings = []
+
+    def add(self, text: str) -> int:
+        position = self.index.get(text)
+        if position is None:
+            position = self.index[text] = len(self.strings)
+            self.strings.append(text)
+        return position
+
+    def xml(self) -> str:
+        items = "".join(f"<si><t>{escape(text)}</t></si>" for text in self.strings)
+        return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                f'count="{len(self.strings)}" uniqueCount="{len(self.strings)}">{items}</sst>')
+
+
+def _cell(ref: str, value, strings: _SharedStrings) -> str:
+    if isinstance(value, tuple):
+        return f'<c r="{ref}" s="{DATE_STYLE}"><v>{value[1]}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    return f'<c r="{ref}" t="s"><v>{strings.add(value)}</v></c>'
+
+
+def _sheet_xml(rows, strings: _SharedStrings) -> str:
+    parts = []
+    for r, cells in enumerate(rows, 1):
+        parts.append(f'<row r="{r}">')
+        parts.extend(_cell(f"{column}{r}", value, strings) for column, value in cells)
+        parts.append("</row>")
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f'<sheetData>{"".join(parts)}</sheetData></worksheet>')
+
+
+def _user_sheet_rows(fields) -> list:
+    rows = [[("A", "고객정보"), ("M", "항목"), ("N", "값")]]
+    for field_name, value in fields:
+        rows.append([("B", "x"), ("M", field_name), ("N", value)])
+    return rows
+
+
+def write_workbook(path: str, sheets: int = 10, seed: int = 0, joint_ratio: float = 0.2) -> str:
+    """요약 시트 + 고객 시트 sheets 개짜리 워크북을 path 에 저장"""
+    rng = random.Random(seed)
+    names = sheet_names(sheets, seed)
+    strings = _SharedStrings()
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("_rels/.rels", _ROOT_RELS)
+        zf.writestr("xl/styles.xml", _STYLES)
+
+        summary = [[("A", "summary")], [("A", "고객 수"), ("B", sheets)]]
+        zf.writestr("xl/worksheets/sheet1.xml", _sheet_xml(summary, strings))
+        for index, name in enumerate(names):
+            rows = _user_sheet_rows(user_fields(name, index, rng, joint_ratio))
+            zf.writestr(f"xl/worksheets/sheet{index + 2}.xml", _sheet_xml(rows, strings))
+
+        all_names = ["요약"] + names
+        workbook_sheets = "".join(
+            f'<sheet name="{escape(name)}" sheetId="{i}" r:id="rId{i}"/>' for i, name in enumerate(all_names, 1))
+        zf.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets>{workbook_sheets}</sheets></workbook>'))
+
+        sheet_rels = "".join(
+            f'<Relationship Id="rId{i}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>' for i in range(1, len(all_names) + 1))
+        count = len(all_names)
+        zf.writestr("xl/_rels/workbook.xml.rels", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'{sheet_rels}'
+            f'<Relationship Id="rId{count + 1}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+            'Target="styles.xml"/>'
+            f'<Relationship Id="rId{count + 2}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+            'Target="sharedStrings.xml"/></Relationships>'))
+
+        zf.writestr("xl/sharedStrings.xml", strings.xml())
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES.format(
+            sheets="".join(_SHEET_CONTENT_TYPE.format(index=i) for i in range(1, count + 1))))
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 고객 워크북 생성")
+    parser.add_argument("output", help="저장할 xlsx 경로")
+    parser.add_argument("--sheets", type=int, default=10, help=f"고객 시트 수 (최대 {MAX_SHEETS})")
+    parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+    parser.add_argument("--joint-ratio", type=float, default=0.2, help="공동명의자 있는 고객 비율")
+    args = parser.parse_args(argv)
+
+    write_workbook(args.output, args.sheets, args.seed, args.joint_ratio)
+    print(f"💾 생성: {args.output} (고객 시트 {args.sheets}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,132 +6,25 @@
 
 import time
 import random
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from ev_automation.button_finder import find_button
+from ev_automation.locator import locate, locate_element
 from ev_automation.verification_code import extract_code_smart, input_reversed_code
+from ev_automation.waits import all_of, dom_ready, network_idle, value_present, wait_for
 
 def wait_for_temp_save_button(driver, timeout=10):
     """
-    임시저장 버튼이 클릭 가능할 때까지 대기
+    임시저장 버튼 찾기
+    텍스트(임시저장/저장), onclick(goSave 등), id/class 힌트, 표시 여부 점수로
+    페이지 안에서 한 번에 고른다 (button_finder)
     """
     try:
         print("🔍 임시저장 버튼 찾기 시작...")
-        
-        # 1. 먼저 정확한 ID나 클래스로 찾기
-        exact_selectors = [
-            "#tempSave",
-            "#temp_save", 
-            "#btnTempSave",
-            "#btn_temp_save",
-            ".tempSave",
-            ".temp_save",
-            ".btnTempSave",
-            ".btn_temp_save",
-            ".btn-blue[onclick*='goSave']",
-            "button[onclick*='goSave']",
-            "input[onclick*='goSave']",
-            "button[onclick*='tempSave']",
-            "button[onclick*='temp_save']",
-            "input[onclick*='tempSave']",
-            "input[onclick*='temp_save']"
-        ]
-        
-        for selector in exact_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                if element and element.is_displayed():
-                    print(f"✅ 정확한 선택자로 찾음: {selector}")
-                    return element
-            except:
-                continue
-        
-        # 2. 텍스트 기반으로 찾기
-        text_selectors = [
-            "//button[contains(text(), '임시저장')]",
-            "//input[@value='임시저장']",
-            "//a[contains(text(), '임시저장')]",
-            "//button[contains(text(), '저장')]",
-            "//input[@value='저장']",
-            "//button[contains(text(), 'temp')]",
-            "//input[@value='temp']"
-        ]
-        
-        for xpath in text_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, xpath)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        print(f"✅ 텍스트 기반으로 찾음: {xpath}")
-                        return element
-            except:
-                continue
-        
-        # 3. 모든 버튼과 입력 필드 검사
-        print("🔍 모든 버튼과 입력 필드 검사 중...")
-        all_buttons = driver.find_elements(By.TAG_NAME, "button")
-        all_inputs = driver.find_elements(By.TAG_NAME, "input")
-        all_links = driver.find_elements(By.TAG_NAME, "a")
-        
-        all_elements = all_buttons + all_inputs + all_links
-        
-        for element in all_elements:
-            try:
-                if not element.is_displayed():
-                    continue
-                    
-                text = (element.text or '').lower()
-                value = (element.get_attribute('value') or '').lower()
-                onclick = (element.get_attribute('onclick') or '').lower()
-                class_name = (element.get_attribute('class') or '').lower()
-                id_name = (element.get_attribute('id') or '').lower()
-                
-                # 임시저장 관련 키워드 확인
-                save_keywords = ['임시저장', 'temp', 'save', '저장']
-                for keyword in save_keywords:
-                    if (keyword in text or keyword in value or 
-                        keyword in onclick or keyword in class_name or 
-                        keyword in id_name):
-                        print(f"✅ 키워드 기반으로 찾음: {keyword}")
-                        print(f"   - 텍스트: {text}")
-                        print(f"   - 값: {value}")
-                        print(f"   - 클래스: {class_name}")
-                        print(f"   - ID: {id_name}")
-                        return element
-                        
-            except Exception as e:
-                continue
-        
-        # 4. 폼 하단의 버튼들 확인 (임시저장은 보통 하단에 있음)
-        print("🔍 폼 하단 버튼 확인 중...")
-        try:
-            # 페이지 하단으로 스크롤
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            
-            # 하단의 모든 버튼 확인
-            bottom_buttons = driver.find_elements(By.CSS_SELECTOR, "button, input[type='button'], input[type='submit']")
-            
-            for button in bottom_buttons:
-                try:
-                    if not button.is_displayed():
-                        continue
-                        
-                    text = (button.text or '').lower()
-                    value = (button.get_attribute('value') or '').lower()
-                    
-                    if '저장' in text or '저장' in value:
-                        print(f"✅ 하단 버튼으로 찾음: {text or value}")
-                        return button
-                        
-                except:
-                    continue
-                    
-        except Exception as e:
-            print(f"⚠️ 하단 버튼 확인 중 오류: {e}")
-        
-        print("❌ 임시저장 버튼을 찾을 수 없습니다")
-        return None
+        element, score = find_button(driver, 'temp_save')
+        if element is None:
+            print("❌ 임시저장 버튼을 찾을 수 없습니다")
+        return element
         
     except Exception as e:
         print(f"❌ 임시저장 버튼 찾기 실패: {e}")
@@ -144,8 +37,8 @@ def simulate_human_temp_save(driver):
     try:
         print("🚀 임시저장 시작...")
         
-        # 1. 페이지 완전 로딩 대기
-        time.sleep(random.uniform(2, 3))
+        # 1. 페이지 완전 로딩 대기 (문서 로드 + 진행 중인 요청 종료)
+        wait_for(driver, all_of(dom_ready(), network_idle(500)), timeout=10, budget=3, label='임시저장 전 로딩')
         
         # 2. 임시저장 버튼 찾기
         temp_save_button = wait_for_temp_save_button(driver)
@@ -278,27 +171,10 @@ def wait_for_save_completion(driver, timeout=30):
                     "[id*='loading']"
                 ]
                 
-                loading_found = False
-                for selector in loading_selectors:
-                    try:
-                        if selector.startswith("text="):
-                            text = selector[5:]
-                            elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{text}')]")
-                            for element in elements:
-                                if element.is_displayed():
-                                    loading_found = True
-                                    print(f"⏳ 저장 중... ({text})")
-                                    break
-                            if loading_found:
-                                break
-                        else:
-                            element = driver.find_element(By.CSS_SELECTOR, selector)
-                            if element and element.is_displayed():
-                                loading_found = True
-                                print(f"⏳ 저장 중... ({selector})")
-                                break
-                    except:
-                        continue
+                _, selector = locate(driver, loading_selectors, visible=True)
+                loading_found = selector is not None
+                if loading_found:
+                    print(f"⏳ 저장 중... ({selector.replace('text=', '')})")
                 
                 if not loading_found:
                     # 저장 완료 메시지 확인
@@ -314,22 +190,10 @@ def wait_for_save_completion(driver, timeout=30):
                         "[id*='success']"
                     ]
                     
-                    for selector in success_selectors:
-                        try:
-                            if selector.startswith("text="):
-                                text = selector[5:]
-                                elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{text}')]")
-                                for element in elements:
-                                    if element.is_displayed():
-                                        print(f"✅ 저장 완료: {text}")
-                                        return True
-                            else:
-                                element = driver.find_element(By.CSS_SELECTOR, selector)
-                                if element and element.is_displayed():
-                                    print(f"✅ 저장 완료: {selector}")
-                                    return True
-                        except:
-                            continue
+                    _, selector = locate(driver, success_selectors, visible=True)
+                    if selector:
+                        print(f"✅ 저장 완료: {selector.replace('text=', '')}")
+                        return True
                     
                     # 오류 메시지 확인
                     error_selectors = [
@@ -344,22 +208,10 @@ def wait_for_save_completion(driver, timeout=30):
                         "[id*='error']"
                     ]
                     
-                    for selector in error_selectors:
-                        try:
-                            if selector.startswith("text="):
-                                text = selector[5:]
-                                elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{text}')]")
-                                for element in elements:
-                                    if element.is_displayed():
-                                        print(f"❌ 저장 오류: {text}")
-                                        return False
-                            else:
-                                element = driver.find_element(By.CSS_SELECTOR, selector)
-                                if element and element.is_displayed():
-                                    print(f"❌ 저장 오류: {selector}")
-                                    return False
-                        except:
-                            continue
+                    _, selector = locate(driver, error_selectors, visible=True)
+                    if selector:
+                        print(f"❌ 저장 오류: {selector.replace('text=', '')}")
+                        return False
                 
                 time.sleep(1)
                 
@@ -407,8 +259,8 @@ def force_temp_save_with_retry(driver, max_retries=3):
         print(f"🔄 임시저장 시도 {attempt + 1}/{max_retries}")
         
         try:
-            # 1. 페이지 완전 로딩 대기
-            time.sleep(random.uniform(2, 4))
+            # 1. 페이지 로딩 및 요청 완료 대기 (끝나는 즉시 진행)
+            wait_for(driver, all_of(dom_ready(), network_idle(500)), timeout=10, budget=3, label='임시저장 전 로딩')
             
             # 2. 필수 필드 입력 확인 (선택적)
             print("🔍 필수 필드 입력 상태 확인...")
@@ -416,9 +268,8 @@ def force_temp_save_with_retry(driver, max_retries=3):
             missing_fields = []
             
             for field_id in required_fields:
-                try:
-                    element = driver.find_element(By.ID, field_id)
-                except Exception:
+                element = locate_element(driver, f'#{field_id}')
+                if element is None:
                     # 요소가 없으면 누락으로 간주하지 않고 통과 (페이지 구조 차이 허용)
                     print(f"   - {field_id}: 찾을 수 없음 (무시)")
                     continue
@@ -436,7 +287,8 @@ def force_temp_save_with_retry(driver, max_retries=3):
                 print(f"⚠️ 누락된 필드: {missing_fields}")
                 if attempt < max_retries - 1:
                     print("🔄 필드 입력 후 재시도...")
-                    time.sleep(3)
+                    wait_for(driver, all_of(*[value_present(f'#{f}') for f in missing_fields]),
+                             timeout=3, budget=3, label='누락 필드 입력')
                     continue
             else:
                 print("✅ 모든 필수 필드가 입력되었습니다")
@@ -451,13 +303,13 @@ def force_temp_save_with_retry(driver, max_retries=3):
                 print(f"❌ 임시저장 실패 (시도 {attempt + 1})")
                 if attempt < max_retries - 1:
                     print("🔄 재시도 대기 중...")
-                    time.sleep(random.uniform(3, 5))
+                    wait_for(driver, network_idle(500), timeout=5, budget=4, label='임시저장 재시도')
                 
         except Exception as e:
             print(f"❌ 임시저장 중 오류: {e}")
             if attempt < max_retries - 1:
                 print("🔄 오류 후 재시도 대기 중...")
-                time.sleep(3)
+                wait_for(driver, network_idle(500), timeout=3, budget=3, label='임시저장 재시도')
     
     print("❌ 모든 임시저장 시도 실패")
     return False
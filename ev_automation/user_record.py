@@ -0,0 +1,155 @@
+"""
+사용자 레코드 - 로드 시점에 한 번만 정규화한 고객 데이터
+
+엑셀에서 읽은 한글 키 dict 를 그대로 넘기면 입력 백엔드마다 .get() 기본값 처리와
+전화번호/날짜 정규화를 사용자마다 반복하게 된다. UserRecord 는 로드할 때
+- 전화번호 마스크 적용 (010-1234-5678)
+- 날짜 ISO 형식 (YYYY-MM-DD)
+- 차종 코드 (model_cd 옵션 값, 차종 카탈로그로 해석)
+- 우선순위 플래그 (priority_flags 규칙 표)
+- 공동명의자 정보
+를 미리 계산해 두고, 기존 코드가 쓰던 user['성명'], user.get('우선순위') 형태의 접근도 지원한다.
+"""
+
+from dataclasses import dataclass, field, fields
+
+from ev_automation.header_alias import JOINT_BIRTH_KEY, JOINT_COUNT_KEY, JOINT_NAME_KEY, canonicalize_keys
+from ev_automation.model_catalog import resolve_model_code
+from ev_automation.normalize import format_phone_number, normalize_date_string
+from ev_automation.priority_flags import PriorityFlags, parse_priority_flags
+
+# 한글 필드명 -> 속성명
+FIELD_ATTRS = {
+    '성명': 'name',
+    '휴대전화': 'phone',
+    '이메일': 'email',
+    '전화': 'tel',
+    '주소': 'address',
+    '상세주소': 'address_detail',
+    '계약일자': 'contract_date',
+    '생년월일': 'birth_date',
+    '출고예정일자': 'delivery_date',
+    '성별': 'gender',
+    '신청유형': 'apply_type',
+    '신청차종': 'model',
+    '신청대수': 'count',
+    '우선순위': 'priority_text',
+}
+
+PHONE_FIELDS = ('휴대전화', '전화')
+DATE_FIELDS = ('계약일자', '생년월일', '출고예정일자')
+
+
+@dataclass(slots=True)
+class UserRecord:
+    """정규화된 고객 한 명 (한글 키 dict 와 호환되는 조회 지원)"""
+    name: str = ''
+    phone: str = ''
+    email: str = ''
+    tel: str = ''
+    address: str = ''
+    address_detail: str = ''
+    contract_date: str = ''
+    birth_date: str = ''
+    delivery_date: str = ''
+    gender: str = ''
+    apply_type: str = ''
+    model: str = ''
+    count: str = ''
+    priority_text: str = ''
+    # 로드 시점에 계산되는 값
+    model_code: str = ''
+    priority: PriorityFlags = field(default_factory=PriorityFlags)
+    joint_count: int | None = None
+    joint_name: str = ''
+    joint_birth: str = ''
+    # 위에 없는 나머지 컬럼 (없으면 None 으로 두어 메모리 절약)
+    extra: dict | None = None
+    # 정규화에 실패한 원본 값 {필드명: 값} (사전 검증 보고용)
+    invalid: dict | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UserRecord":
+        """엑셀 한글 키 dict → UserRecord (정규화는 여기서 한 번만)"""
+        data = canonicalize_keys(data)
+        values = {}
+        extra = {}
+        invalid = {}
+        for key, value in data.items():
+            attr = FIELD_ATTRS.get(key)
+            if attr is None:
+                extra[key] = value
+                continue
+            value = '' if value is None else str(value).strip()
+            if key in PHONE_FIELDS:
+                value = format_phone_number(value)
+            elif key in DATE_FIELDS and value:
+                iso = normalize_date_string(value)
+                if iso is None:
+                    print(f"[WARNING] {data.get('성명', '')} {key} 날짜 형식 인식 실패: {value}")
+                    invalid[key] = value
+                value = iso or ''
+            values[attr] = value
+
+        record = cls(**values, extra=extra or None, invalid=invalid or None)
+        record.model_code = resolve_model_code(record.model)
+        record.priority = parse_priority_flags(record.priority_text)
+
+        if extra:
+            # 공동명의자 컬럼 변형은 canonicalize_keys 에서 표준 키로 모아 둠
+            joint_cnt = extra.get(JOINT_COUNT_KEY)
+            if joint_cnt not in (None, ''):
+                try:
+                    record.joint_count = int(str(joint_cnt).strip())
+                except ValueError:
+                    pass
+            record.joint_name = str(extra.get(JOINT_NAME_KEY) or '')
+            joint_birth = extra.get(JOINT_BIRTH_KEY)
+            if joint_birth:
+                record.joint_birth = normalize_date_string(joint_birth) or ''
+                if not record.joint_birth:
+                    record.invalid = {**(record.invalid or {}), JOINT_BIRTH_KEY: joint_birth}
+        return record
+
+    @classmethod
+    def coerce(cls, user) -> "UserRecord":
+        """UserRecord 는 그대로, dict 는 변환"""
+        return user if isinstance(user, cls) else cls.from_dict(user)
+
+    def to_dict(self) -> dict:
+        """한글 키 dict 로 변환 (값이 빈 필드는 제외)"""
+        data = {key: getattr(self, attr) for key, attr in FIELD_ATTRS.items() if getattr(self, attr)}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    # ---------- 기존 dict 방식 호환 ----------
+    def get(self, key, default=None):
+        attr = FIELD_ATTRS.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            return value if value else default
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        if key in _RECORD_ATTRS:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+
+_MISSING = object()
+_RECORD_ATTRS = {f.name for f in fields(UserRecord)}
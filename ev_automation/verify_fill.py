@@ -0,0 +1,190 @@
+"""
+입력 확인 - 대상 필드 값을 한 번에 읽어 기대값과 비교하고 틀린 필드만 다시 입력
+
+입력 뒤 고정 대기 → 성별/생년월일/주소를 무조건 다시 입력(force fill) → 또 대기 → 검증하던
+흐름을 대신한다. 입력 페이로드(build_fill_payload)의 필드 값을 페이지 헬퍼(window.__ev.readFields)
+호출 한 번으로 읽어 기대값과 비교하고, 다른 필드만 window.__ev.fill 로 다시 입력한다.
+모든 필드가 맞거나, 재입력 횟수(MAX_ROUNDS)에 닿거나, 재입력해도 값이 그대로면 멈춘다.
+
+필드 결과: ok (처음부터 일치) / fixed (재입력으로 맞춤) / failed (끝까지 다름) / missing (요소 없음)
+실행 전체의 필드별 결과는 format_verify_report 로 실행 보고에 출력한다.
+"""
+
+import threading
+
+from ev_automation.fill_script import build_fill_payload
+from ev_automation.model_catalog import pick_model_option
+from ev_automation.page_helpers import call_page_helper
+from ev_automation.user_record import UserRecord
+from ev_automation.waits import network_idle, wait_for
+
+# 재입력 최대 횟수
+MAX_ROUNDS = 3
+
+# 하이픈 유무만 다른 값은 같은 것으로 보는 필드
+PHONE_IDS = ('mobile', 'phone')
+
+
+def field_matches(field: dict, expected: str, read: dict) -> bool:
+    """읽어 온 값(read)이 기대값과 맞는지 (날짜는 앞부분, select 는 값 또는 선택된 텍스트)"""
+    if not read or not read.get('found'):
+        return False
+    if field['kind'] == 'radio':
+        return bool(read.get('checked'))
+    value = str(read.get('value') or '')
+    if field['kind'] == 'date':
+        return value.startswith(expected)
+    if field['kind'] == 'select':
+        return value == expected or (read.get('text') or '') == expected
+    if field['id'] in PHONE_IDS:
+        return value.replace('-', '') == expected.replace('-', '')
+    return value == expected
+
+
+def _refill(driver, fields: list, expected: dict, record: UserRecord) -> dict:
+    """틀린 필드만 다시 입력. model_cd 옵션에 값이 없으면 실제 옵션에서 고른 값으로 한 번 더"""
+    payload = [dict(f, value=expected[f['id']]) for f in fields]
+    result = call_page_helper(driver, 'fill', {'fields': payload, 'priority': None}) or {}
+    model_result = (result.get('fields') or {}).get('model_cd') or {}
+    if model_result.get('options') and record.model:
+        options = [tuple(option) for option in model_result['options']]
+        model_code = pick_model_option(record.model, record.model_code, options)
+        if model_code:
+            expected['model_cd'] = model_code
+            model_field = next(f for f in fields if f['id'] == 'model_cd')
+            result = call_page_helper(driver, 'fill', {
+                'fields': [dict(model_field, value=model_code)],
+                'priority': None,
+            }) or {}
+    return result
+
+
+def verify_and_refill(driver, user_data, max_rounds: int = MAX_ROUNDS) -> dict:
+    """입력 결과를 읽어 비교하고 틀린 필드만 재입력
+
+    Returns:
+        {'ok': 실패 필드가 없는지, 'rounds': 재입력 횟수,
+         'fields': [{'key', 'id', 'status', 'expected', 'actual', 'attempts'}],
+         'fixed': [한글 키], 'failed': [한글 키], 'missing': [한글 키], 'error': 실행 실패 메시지(있을 때만)}
+    """
+    record = UserRecord.coerce(user_data)
+    fields = build_fill_payload(record, with_priority=False)['fields']
+    expected = {f['id']: f['value'] for f in fields}
+    attempts = {f['id']: 0 for f in fields}
+    outcomes = {}
+    previous = None
+    rounds = 0
+    error = None
+
+    while True:
+        try:
+            reads = call_page_helper(driver, 'readFields', fields) or {}
+        except Exception as e:
+            error = str(e)
+            print(f"❌ 입력 확인 실패: {e}")
+            break
+        mismatched = []
+        for f in fields:
+            read = reads.get(f['id']) or {}
+            status = 'missing'
+            if read.get('found'):
+                if field_matches(f, expected[f['id']], read):
+                    status = 'fixed' if attempts[f['id']] else 'ok'
+                else:
+                    status = 'failed'
+                    mismatched.append(f)
+            outcomes[f['id']] = {
+                'key': f['key'], 'id': f['id'], 'status': status, 'expected': expected[f['id']],
+                'actual': read.get('checked') if f['kind'] == 'radio' else read.get('value'),
+                'attempts': attempts[f['id']],
+            }
+
+        # 모두 맞음 / 재입력 한도 / 재입력해도 값이 그대로면 종료
+        state = {f['id']: outcomes[f['id']]['actual'] for f in mismatched}
+        if not mismatched or rounds >= max_rounds or state == previous:
+            break
+        previous = state
+        rounds += 1
+        print(f"🔁 재입력 {rounds}/{max_rounds}: {', '.join(sorted({f['key'] for f in mismatched}))}")
+        for f in mismatched:
+            attempts[f['id']] += 1
+        try:
+            _refill(driver, mismatched, expected, record)
+        except Exception as e:
+            print(f"⚠️ 재입력 실패: {e}")
+        # 재입력으로 생긴 change 핸들러 요청이 끝날 때까지만 대기
+        wait_for(driver, network_idle(200), timeout=2, label='재입력 후 처리')
+
+    report = {
+        'ok': error is None and not any(o['status'] == 'failed' for o in outcomes.values()),
+        'rounds': rounds,
+        'fields': list(outcomes.values()),
+    }
+    for status in ('fixed', 'failed', 'missing'):
+        report[status] = sorted({o['key'] for o in outcomes.values() if o['status'] == status})
+    if error:
+        report['error'] = error
+
+    matched = sum(1 for o in outcomes.values() if o['status'] == 'ok')
+    print(f"🔎 입력 확인: 일치 {matched} / 재입력으로 맞춤 {len(report['fixed'])} / 실패 {len(report['failed'])}"
+          f" / 요소 없음 {len(report['missing'])} (재입력 {rounds}회)"
+          + (f" - 실패: {', '.join(report['failed'])}" if report['failed'] else ""))
+    _stats.add(record.name, report)
+    return report
+
+
+# ---------- 실행 보고 ----------
+class VerifyStats:
+    """사용자별 입력 확인 결과 → 필드별 재입력/실패 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reports = []
+
+    def add(self, name: str, report: dict):
+        with self._lock:
+            self.reports.append((name, report))
+
+    def reset(self):
+        with self._lock:
+            self.reports = []
+
+    def summary(self) -> dict:
+        """{'users', 'ok_users', 'fixed': {한글 키: 횟수}, 'failed': {...}, 'missing': {...}}"""
+        with self._lock:
+            reports = list(self.reports)
+        summary = {'users': len(reports), 'ok_users': sum(1 for _, r in reports if r.get('ok')),
+                   'fixed': {}, 'failed': {}, 'missing': {}}
+        for _, report in reports:
+            for status in ('fixed', 'failed', 'missing'):
+                for key in report.get(status, []):
+                    summary[status][key] = summary[status].get(key, 0) + 1
+        return summary
+
+    def format(self) -> str:
+        s = self.summary()
+        if not s['users']:
+            return "[VERIFY] 입력 확인 기록 없음"
+
+        def counts(d):
+            return ', '.join(f"{k} {v}" for k, v in sorted(d.items(), key=lambda kv: -kv[1])) or '없음'
+
+        return (f"[VERIFY] 입력 확인 {s['users']}명 (모두 일치 {s['ok_users']}명)\n"
+                f"   - 재입력으로 맞춘 필드: {counts(s['fixed'])}\n"
+                f"   - 맞추지 못한 필드: {counts(s['failed'])}\n"
+                f"   - 요소 없음: {counts(s['missing'])}")
+
+
+_stats = VerifyStats()
+
+
+def get_verify_stats() -> VerifyStats:
+    return _stats
+
+
+def reset_verify_stats():
+    _stats.reset()
+
+
+def format_verify_report() -> str:
+    return _stats.format()
@@ -0,0 +1,187 @@
+"""
+이벤트 기반 대기 - 고정 time.sleep 대신 조건이 만족되는 즉시 진행
+
+입력/임시저장/첨부/팝업 단계마다 "충분히" 기다리려고 넣어 둔 고정 sleep 은 대부분
+조건이 훨씬 빨리 만족되는데도 끝까지 기다린다. 여기서는 페이지 헬퍼(window.__ev.waitFor)에
+조건 dict 를 넘기고 execute_async_script 로 기다린다. 페이지 안에서는 MutationObserver 와
+짧은 주기 확인으로 조건이 맞는 순간 resolve 하고, timeout 이 지나면 실패로 끝난다.
+
+조건: dom_ready / element_present / element_gone / element_count / element_enabled /
+      value_present / text_present / network_idle (fetch/XHR/jQuery 요청이 quiet_ms 동안 없음) / any_of / all_of
+JS alert 는 DOM 으로 감지할 수 없으므로 wait_for_alert 가 WebDriver 로 짧게 확인한다.
+Playwright 페이지는 같은 조건을 wait_for_playwright 가 page.wait_for_function 으로 기다린다.
+
+budget 에 대체한 고정 sleep 길이를 적어 두면 WaitStats 가 실제 대기와 비교해
+실행 보고에 절감 시간을 보여 준다 (format_wait_report).
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import UnexpectedAlertPresentException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from ev_automation.page_helpers import call_page_helper_async, call_page_helper_playwright
+
+# alert 확인 주기 (초)
+ALERT_POLL_INTERVAL = 0.05
+
+# Playwright 조건 확인 (네트워크 유휴는 시간이 지나야 만족되므로 DOM 변화 대신 주기 확인)
+PLAYWRIGHT_CHECK_JS = "c => !!(window.__ev && window.__ev.check(c))"
+PLAYWRIGHT_POLL_MS = 50
+
+
+# ---------- 조건 ----------
+def dom_ready() -> dict:
+    return {'kind': 'ready'}
+
+
+def element_present(selector, visible: bool = False) -> dict:
+    """selector (문자열 또는 목록) 요소가 있음 (visible=True 면 화면에 보일 때)"""
+    return {'kind': 'selector', 'selector': selector, 'visible': visible}
+
+
+def element_gone(selector) -> dict:
+    """요소가 없거나 보이지 않음 (로딩 표시/팝업 닫힘)"""
+    return {'kind': 'gone', 'selector': selector}
+
+
+def element_count(selector: str, minimum: int) -> dict:
+    return {'kind': 'count', 'selector': selector, 'min': int(minimum)}
+
+
+def element_enabled(selector) -> dict:
+    """요소가 있고 disabled 가 아님 (앞 필드 선택으로 활성화되는 select 등)"""
+    return {'kind': 'enabled', 'selector': selector}
+
+
+def value_present(selector, value: str | None = None) -> dict:
+    """입력 요소 값이 비어 있지 않음 (value 를 주면 그 값으로 시작)"""
+    return {'kind': 'value', 'selector': selector, 'value': value}
+
+
+def text_present(text: str) -> dict:
+    return {'kind': 'text', 'text': text}
+
+
+def network_idle(quiet_ms: int = 500) -> dict:
+    """진행 중인 요청이 없고 마지막 요청 후 quiet_ms 가 지남"""
+    return {'kind': 'idle', 'quiet': int(quiet_ms)}
+
+
+def any_of(*conditions) -> dict:
+    return {'kind': 'any', 'conditions': list(conditions)}
+
+
+def all_of(*conditions) -> dict:
+    return {'kind': 'all', 'conditions': list(conditions)}
+
+
+# ---------- 절감 시간 집계 ----------
+class WaitStats:
+    """대기 기록 (label, 대체한 고정 대기, 실제 대기, 성공 여부)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+
+    def add(self, label: str, budget: float, elapsed: float, ok: bool):
+        with self._lock:
+            self.records.append((label, budget, elapsed, ok))
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+
+    def summary(self) -> dict:
+        with self._lock:
+            records = list(self.records)
+        budget = sum(r[1] for r in records if r[1])
+        waited = sum(r[2] for r in records if r[1])
+        return {
+            'count': len(records),
+            'waited': round(sum(r[2] for r in records), 2),
+            'budget': round(budget, 2),
+            'saved': round(budget - waited, 2),
+            'timeouts': sum(1 for r in records if not r[3]),
+        }
+
+    def format(self) -> str:
+        s = self.summary()
+        if not s['count']:
+            return "[WAIT] 대기 기록 없음"
+        change = f"{s['saved']:.1f}초 절감" if s['saved'] >= 0 else f"{-s['saved']:.1f}초 더 걸림"
+        return (f"[WAIT] 대기 {s['count']}회: 실제 {s['waited']:.1f}초 / 기존 고정 대기 {s['budget']:.1f}초"
+                f" → {change} (시간 초과 {s['timeouts']}회)")
+
+
+_stats = WaitStats()
+
+
+def get_wait_stats() -> WaitStats:
+    return _stats
+
+
+def reset_wait_stats():
+    _stats.reset()
+
+
+def format_wait_report() -> str:
+    return _stats.format()
+
+
+# ---------- 대기 ----------
+def wait_for(driver, condition: dict, timeout: float = 10.0, budget: float = 0.0,
+             label: str = '', on_alert: bool = False) -> bool:
+    """condition 이 만족될 때까지 대기 (timeout 초). 만족하면 True
+
+    budget: 이 대기가 대체한 고정 sleep 길이 (절감 시간 집계용)
+    on_alert: 대기 중 JS alert 가 뜨면 돌려줄 값 (alert 처리는 호출한 쪽에서)
+    """
+    start = time.time()
+    ok = False
+    try:
+        result = call_page_helper_async(driver, timeout + 2, 'waitFor', condition, int(timeout * 1000)) or {}
+        ok = bool(result.get('ok'))
+    except UnexpectedAlertPresentException:
+        ok = on_alert
+    except Exception as e:
+        print(f"[WAIT] {label or condition.get('kind')} 대기 실패: {e}")
+    _stats.add(label or condition.get('kind', ''), budget, time.time() - start, ok)
+    return ok
+
+
+def wait_for_playwright(page, condition: dict, timeout: float = 10.0, budget: float = 0.0,
+                        label: str = '') -> bool:
+    """wait_for 의 Playwright 버전 - window.__ev.check(condition) 이 참이 될 때까지 대기"""
+    start = time.time()
+    ok = False
+    try:
+        # 헬퍼가 없으면 여기서 주입 (이미 만족하면 바로 끝)
+        ok = bool(call_page_helper_playwright(page, 'check', condition))
+        if not ok:
+            page.wait_for_function(PLAYWRIGHT_CHECK_JS, arg=condition, timeout=timeout * 1000,
+                                   polling=PLAYWRIGHT_POLL_MS)
+            ok = True
+    except Exception as e:
+        print(f"[WAIT] {label or condition.get('kind')} 대기 실패: {e}")
+    _stats.add(label or condition.get('kind', ''), budget, time.time() - start, ok)
+    return ok
+
+
+def wait_for_alert(driver, timeout: float = 5.0, budget: float = 0.0, label: str = 'alert'):
+    """JS alert/confirm 이 뜰 때까지 대기. 뜨면 alert 객체, 아니면 None
+
+    budget: alert 확인 앞에 있던 고정 sleep 길이. 기존에는 그만큼 잔 뒤 alert 를 기다렸으므로
+    기존 소요 시간은 max(budget, 실제 대기)로 집계한다.
+    """
+    start = time.time()
+    alert = None
+    try:
+        alert = WebDriverWait(driver, timeout, poll_frequency=ALERT_POLL_INTERVAL).until(EC.alert_is_present())
+    except Exception:
+        alert = None
+    elapsed = time.time() - start
+    _stats.add(label, max(budget, elapsed) if budget else 0.0, elapsed, alert is not None)
+    return alert or None
@@ -0,0 +1,212 @@
+"""
+파싱된 워크북 캐시 - 파일 지문(경로, 크기, 수정시각, 내용 해시) 기준 디스크 캐시
+
+같은 워크북을 클릭/실행마다 다시 파싱하지 않도록 정규화된 사용자 목록을 JSON으로 저장한다.
+- 지문이 하나라도 바뀌면 캐시 미스 → 다시 파싱
+- invalidate() 로 특정 파일 또는 전체 캐시 명시적 삭제
+- 항목 수/용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 인덱스 읽기-수정-쓰기는 잠금 파일(index.lock)로 프로세스 간에도 직렬화한다
+  (bulk_ingest 의 프로세스 풀 작업자들이 같은 캐시 디렉터리를 쓴다)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_CACHE_DIR = os.path.join("data", "workbook_cache")
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+# Windows 잠금 재시도 주기 (초)
+LOCK_RETRY_INTERVAL = 0.05
+
+
+def _lock_file(f) -> None:
+    """열린 잠금 파일에 배타 잠금 (다른 프로세스가 풀 때까지 대기)"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            time.sleep(LOCK_RETRY_INTERVAL)
+
+
+def _unlock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+    f.seek(0)
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _write_atomic(path: str, text: str) -> None:
+    """임시 파일(프로세스/스레드별 이름)에 쓴 뒤 os.replace 로 교체"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def file_fingerprint(path: str) -> dict:
+    """파일 지문: 절대경로, 크기, 수정시각(ns), 내용 SHA-256"""
+    stat = os.stat(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return {
+        "path": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest.hexdigest(),
+    }
+
+
+def cache_key(fingerprint: dict, namespace: str = "") -> str:
+    """지문 + 네임스페이스(로더 버전 등)로 캐시 키 생성"""
+    raw = "|".join([
+        namespace,
+        fingerprint["path"],
+        str(fingerprint["size"]),
+        str(fingerprint["mtime_ns"]),
+        fingerprint["sha256"],
+    ])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class WorkbookCache:
+    """파일 지문 기준 디스크 캐시 (LRU 제거)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 namespace: str = ""):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self._lock = threading.Lock()
+
+    # ---------- 인덱스 ----------
+    @contextmanager
+    def _locked(self):
+        """스레드 잠금 + 잠금 파일 (인덱스 읽기-수정-쓰기 구간)"""
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, LOCK_FILE), "a+b") as f:
+                _lock_file(f)
+                try:
+                    yield
+                finally:
+                    _unlock_file(f)
+
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, INDEX_FILE)
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self, index: dict) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        _write_atomic(self._index_path(), json.dumps(index, ensure_ascii=False))
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remove_entry(self, index: dict, key: str) -> None:
+        index.pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    # ---------- 조회/저장 ----------
+    def get(self, excel_file: str, fingerprint: dict | None = None):
+        """캐시된 값 반환. 없거나 지문이 다르면 None"""
+        fingerprint = fingerprint or file_fingerprint(excel_file)
+        key = cache_key(fingerprint, self.namespace)
+        with self._locked():
+            index = self._load_index()
+            if key not in index:
+                return None
+            try:
+                with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+            except Exception:
+                self._remove_entry(index, key)
+                self._save_index(index)
+                return None
+            index[key]["last_access"] = time.time()
+            self._save_index(index)
+            return payload
+
+    def put(self, excel_file: str, payload, fingerprint: dict | None = None) -> None:
+        """값 저장 후 상한 초과 시 LRU 제거. 같은 경로의 이전 항목은 교체"""
+        fingerprint = fingerprint or file_fingerprint(excel_file)
+        key = cache_key(fingerprint, self.namespace)
+        data = json.dumps(payload, ensure_ascii=False)
+        with self._locked():
+            index = self._load_index()
+            for old_key in [k for k, e in index.items() if e.get("path") == fingerprint["path"]]:
+                self._remove_entry(index, old_key)
+            _write_atomic(self._entry_path(key), data)
+            index[key] = {
+                **fingerprint,
+                "bytes": len(data.encode("utf-8")),
+                "last_access": time.time(),
+            }
+            self._evict(index)
+            self._save_index(index)
+
+    def get_or_load(self, excel_file: str, loader):
+        """캐시 히트면 저장된 값, 미스면 loader(excel_file) 결과를 저장 후 반환"""
+        fingerprint = file_fingerprint(excel_file)
+        payload = self.get(excel_file, fingerprint)
+        if payload is not None:
+            print(f"[CACHE] 캐시 사용: {os.path.basename(excel_file)}")
+            return payload
+        payload = loader(excel_file)
+        self.put(excel_file, payload, fingerprint)
+        return payload
+
+    # ---------- 무효화/제거 ----------
+    def invalidate(self, excel_file: str | None = None) -> int:
+        """excel_file 항목(없으면 전체) 삭제. 삭제한 항목 수 반환"""
+        with self._locked():
+            index = self._load_index()
+            if excel_file is None:
+                keys = list(index)
+            else:
+                path = os.path.abspath(excel_file)
+                keys = [k for k, e in index.items() if e.get("path") == path]
+            for key in keys:
+                self._remove_entry(index, key)
+            self._save_index(index)
+            return len(keys)
+
+    def _evict(self, index: dict) -> None:
+        """항목 수/총 용량 상한을 넘으면 마지막 사용 시각이 오래된 순으로 제거"""
+        by_age = sorted(index, key=lambda k: index[k].get("last_access", 0))
+        total = sum(e.get("bytes", 0) for e in index.values())
+        while by_age and (len(index) > self.max_entries or total > self.max_bytes):
+            key = by_age.pop(0)
+            total -= index[key].get("bytes", 0)
+            self._remove_entry(index, key)
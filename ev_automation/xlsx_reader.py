@@ -0,0 +1,276 @@
+"""
+원시 xlsx 리더 - zip 안의 시트 XML 을 iterparse 로 스트리밍해 M/N 열만 꺼냄
+
+고객 시트에서 필요한 값은 열 M(필드명)/N(값) 뿐인데, pd.read_excel 이나 openpyxl 은
+모든 셀을 객체로 만든다. 여기서는 xl/worksheets/sheetN.xml 을 행 단위로 읽고
+M/N 셀만 값으로 바꾼 뒤 나머지는 바로 버리므로, 시트가 아무리 커도 메모리는
+공유 문자열 표 크기 정도로 유지된다. pandas/openpyxl 을 import 하지 않는다.
+
+셀 값 변환은 openpyxl(read_only, data_only) 결과와 맞춘다.
+- 공유/인라인 문자열 → str, 숫자 → int/float, 불리언 → bool
+- 날짜 서식이 적용된 숫자 → datetime
+"""
+
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+
+from ev_automation.field_rules import build_user_data
+from ev_automation.user_record import UserRecord
+
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+WORKBOOK_PART = "xl/workbook.xml"
+WORKBOOK_RELS_PART = "xl/_rels/workbook.xml.rels"
+SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+STYLES_PART = "xl/styles.xml"
+
+# 고객 시트는 2~4자 한글 이름
+USER_SHEET_PATTERN = re.compile(r'^[가-힣]{2,4}$')
+
+# 시트 내 필드명/값 열 (M/N)
+FIELD_NAME_COLUMN = "M"
+FIELD_VALUE_COLUMN = "N"
+
+# 내장 날짜/시간 서식 번호 (openpyxl BUILTIN_FORMATS 기준)
+BUILTIN_DATE_FORMATS = {14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47}
+
+# 서식 문자열에서 날짜 토큰 판별 전에 지울 부분 (따옴표 문자열, 이스케이프, [색상] 등)
+_FORMAT_STRIP = re.compile(r'\[(?!(?:hh?|mm?|ss?)\])[^\]]*\]|"[^"]*"|\\.|[_*].')
+_DATE_TOKEN = re.compile(r'[dmhysDMHYS]')
+_CELL_COLUMN = re.compile(r'[A-Z]+')
+
+_TAG_SHEET_DATA = f"{NS_MAIN}sheetData"
+_TAG_ROW = f"{NS_MAIN}row"
+_TAG_CELL = f"{NS_MAIN}c"
+_TAG_VALUE = f"{NS_MAIN}v"
+_TAG_INLINE = f"{NS_MAIN}is"
+_TAG_TEXT = f"{NS_MAIN}t"
+_TAG_PHONETIC = f"{NS_MAIN}rPh"
+
+
+# ---------- 워크북 구조 ----------
+def read_sheet_parts(zf: zipfile.ZipFile) -> list:
+    """workbook.xml 순서대로 [(시트명, 워크시트 파트 경로), ...] 반환"""
+    rels = {}
+    rels_root = ET.fromstring(zf.read(WORKBOOK_RELS_PART))
+    for rel in rels_root.iter(f"{NS_PKG_REL}Relationship"):
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            part = target.lstrip("/")
+        else:
+            part = posixpath.normpath(posixpath.join("xl", target))
+        rels[rel.get("Id")] = part
+
+    sheets = []
+    wb_root = ET.fromstring(zf.read(WORKBOOK_PART))
+    for sheet in wb_root.iter(f"{NS_MAIN}sheet"):
+        part = rels.get(sheet.get(f"{NS_REL}id"))
+        if part:
+            sheets.append((sheet.get("name"), part))
+    return sheets
+
+
+def part_crc(zf: zipfile.ZipFile, part: str):
+    """zip 디렉터리에 기록된 파트의 CRC32 (파트가 없으면 None)"""
+    try:
+        return zf.getinfo(part).CRC
+    except KeyError:
+        return None
+
+
+def _is_date1904(zf: zipfile.ZipFile) -> bool:
+    root = ET.fromstring(zf.read(WORKBOOK_PART))
+    pr = root.find(f"{NS_MAIN}workbookPr")
+    return pr is not None and pr.get("date1904") in ("1", "true")
+
+
+def is_date_format(format_code: str) -> bool:
+    """숫자 서식 문자열이 날짜/시간 서식인지"""
+    if not format_code or format_code.lower() == "general":
+        return False
+    return _DATE_TOKEN.search(_FORMAT_STRIP.sub("", format_code)) is not None
+
+
+def read_date_styles(zf: zipfile.ZipFile) -> set:
+    """날짜 서식이 적용된 셀 스타일 인덱스(c/@s) 집합"""
+    if STYLES_PART not in zf.namelist():
+        return set()
+    root = ET.fromstring(zf.read(STYLES_PART))
+    custom_dates = set()
+    num_fmts = root.find(f"{NS_MAIN}numFmts")
+    if num_fmts is not None:
+        for fmt in num_fmts.iter(f"{NS_MAIN}numFmt"):
+            if is_date_format(fmt.get("formatCode", "")):
+                custom_dates.add(int(fmt.get("numFmtId")))
+    date_styles = set()
+    cell_xfs = root.find(f"{NS_MAIN}cellXfs")
+    if cell_xfs is not None:
+        for index, xf in enumerate(cell_xfs.iter(f"{NS_MAIN}xf")):
+            fmt_id = int(xf.get("numFmtId", 0))
+            if fmt_id in BUILTIN_DATE_FORMATS or fmt_id in custom_dates:
+                date_styles.add(index)
+    return date_styles
+
+
+def read_shared_strings(zf: zipfile.ZipFile) -> list:
+    """공유 문자열 표 (윗주 rPh 제외, 서식 있는 텍스트는 이어 붙임)"""
+    if SHARED_STRINGS_PART not in zf.namelist():
+        return []
+    strings = []
+    with zf.open(SHARED_STRINGS_PART) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f"{NS_MAIN}si":
+                strings.append(_rich_text(elem))
+                elem.clear()
+    return strings
+
+
+def _rich_text(elem) -> str:
+    """<si>/<is> 안의 <t> 를 이어 붙임 (윗주 rPh 안의 텍스트 제외)"""
+    parts = []
+    for child in elem:
+        if child.tag == _TAG_TEXT:
+            parts.append(child.text or "")
+        elif child.tag != _TAG_PHONETIC:
+            for t in child.iter(_TAG_TEXT):
+                parts.append(t.text or "")
+    return "".join(parts)
+
+
+# ---------- 셀 값 ----------
+def _from_excel_serial(value: float, date1904: bool) -> datetime:
+    if date1904:
+        return datetime(1904, 1, 1) + timedelta(days=value)
+    if 0 < value < 60:
+        # 1900년 윤년 버그 이전 날짜
+        value += 1
+    return datetime(1899, 12, 30) + timedelta(days=value)
+
+
+def _cell_value(cell, shared_strings, date_styles, date1904):
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(_TAG_INLINE)
+        return _rich_text(inline) if inline is not None else None
+    raw = cell.findtext(_TAG_VALUE)
+    if raw is None:
+        return None
+    if cell_type == "s":
+        return shared_strings[int(raw)]
+    if cell_type in ("str", "e"):
+        return raw
+    if cell_type == "b":
+        return raw == "1"
+    if cell_type == "d":
+        try:
+            return datetime.fromisoformat(raw)
+        except ValueError:
+            return raw
+    # 숫자
+    number = float(raw) if any(ch in raw for ch in ".eE") else int(raw)
+    style = cell.get("s")
+    if style is not None and int(style) in date_styles:
+        try:
+            return _from_excel_serial(number, date1904)
+        except (OverflowError, ValueError):
+            return number
+    return number
+
+
+# ---------- 시트 스트리밍 ----------
+def _iter_sheet_pairs(stream, shared_strings, date_styles, date1904):
+    """시트 XML 을 행 단위로 읽어 헤더 행 다음부터 (M, N) 값 쌍 반환
+
+    openpyxl 경로와 같이 값이 있는 첫 행은 헤더로 건너뛴다.
+    """
+    header_seen = False
+    sheet_data = None
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if elem.tag == _TAG_SHEET_DATA:
+                sheet_data = elem
+            continue
+        if elem.tag != _TAG_ROW:
+            continue
+        name = value = None
+        has_value = False
+        column_index = 0
+        for cell in elem.iter(_TAG_CELL):
+            ref = cell.get("r")
+            if ref:
+                column = _CELL_COLUMN.match(ref).group()
+                column_index = _column_number(column)
+            else:
+                column_index += 1
+                column = _column_letter(column_index)
+            if not header_seen:
+                if cell.find(_TAG_VALUE) is not None or cell.find(_TAG_INLINE) is not None:
+                    has_value = True
+                continue
+            if column == FIELD_NAME_COLUMN:
+                name = _cell_value(cell, shared_strings, date_styles, date1904)
+            elif column == FIELD_VALUE_COLUMN:
+                value = _cell_value(cell, shared_strings, date_styles, date1904)
+        # 처리한 행은 부모에서도 떼어내 메모리를 일정하게 유지
+        if sheet_data is not None:
+            sheet_data.clear()
+        else:
+            elem.clear()
+        if not header_seen:
+            header_seen = has_value
+            continue
+        if name is not None or value is not None:
+            yield name, value
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _column_number(letters: str) -> int:
+    number = 0
+    for ch in letters:
+        number = number * 26 + ord(ch) - 64
+    return number
+
+
+def iter_user_sheet_cells_raw(excel_file: str, sheet_names=None):
+    """고객 시트마다 (시트명, [(필드명, 값), ...]) 반환 (excel_loader.iter_user_sheet_cells 의 원시 버전)"""
+    with zipfile.ZipFile(excel_file) as zf:
+        shared_strings = read_shared_strings(zf)
+        date_styles = read_date_styles(zf)
+        date1904 = _is_date1904(zf)
+        wanted = set(sheet_names) if sheet_names is not None else None
+        for sheet_name, part in read_sheet_parts(zf):
+            if not USER_SHEET_PATTERN.match(sheet_name):
+                continue
+            if wanted is not None and sheet_name not in wanted:
+                continue
+            try:
+                with zf.open(part) as stream:
+                    cells = list(_iter_sheet_pairs(stream, shared_strings, date_styles, date1904))
+            except Exception as e:
+                print(f"[ERROR] {sheet_name} 시트 읽기 실패: {e}")
+                continue
+            yield sheet_name, cells
+
+
+def parse_user_sheets_raw(excel_file: str, sheet_names=None):
+    """고객 시트를 파싱해 [(시트명, 사용자 데이터), ...] 반환 (pandas 미사용)"""
+    return [(sheet_name, build_user_data(cells, sheet_name))
+            for sheet_name, cells in iter_user_sheet_cells_raw(excel_file, sheet_names)]
+
+
+def load_users_raw(excel_file: str):
+    """원시 리더로 사용자 목록(UserRecord) 로드 (실패 시 예외 발생)"""
+    return [UserRecord.from_dict(user_data)
+            for _, user_data in parse_user_sheets_raw(excel_file) if user_data]
@@ -9,13 +9,18 @@ import os
 import time
 import json
 import threading
-import pandas as pd
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from ev_automation.browser import create_browser
-from ev_automation.excel_loader import load_users_from_excel
-from ev_automation.fill_fields import build_fill_script
+from ev_automation.excel_loader import cached_users_from_excel, iter_users_from_excel, parse_users_from_excel
+from ev_automation.preflight import print_report, run_preflight, summarize_issues, validate_user
+from ev_automation.fill_fields import fill_fields_planned
+from ev_automation.page_helpers import REQUIRED_FIELDS_AFTER_FILL, REQUIRED_FIELDS_BEFORE_SAVE, call_page_helper
+from ev_automation.selectors_learning import get_locator_cache
+from ev_automation.user_record import UserRecord
+from ev_automation.verify_fill import format_verify_report, reset_verify_stats, verify_and_refill
+from ev_automation.waits import (all_of, dom_ready, element_present, format_wait_report, network_idle,
+                                 reset_wait_stats, wait_for, wait_for_alert)
 from ev_automation.temp_save import run_temp_save, finalize_temp_save
 
 class FinalVerifiedAutomation:
@@ -246,64 +251,8 @@ class FinalVerifiedAutomation:
             reversed_code = verification_code[::-1]
             print(f"[REVERSE] 코드 변환: {verification_code} → {reversed_code}")
             
-            input_js = f"""
-            console.log('=== 확인코드 역순 입력 ===');
-            console.log('원본: {verification_code}');
-            console.log('역순: {reversed_code}');
-            
-            // 입력 필드 찾기 (여러 방법)
-            let codeInput = document.getElementById('randeomChk') ||
-                           document.querySelector('input[type="text"]') ||
-                           document.querySelector('input[type="password"]') ||
-                           document.querySelector('input[placeholder*="코드"]') ||
-                           document.querySelector('input[title*="코드"]');
-            
-            if (codeInput) {{
-                codeInput.focus();
-                codeInput.select();
-                codeInput.value = '';
-                codeInput.value = '{reversed_code}';
-                
-                // 여러 이벤트 발생
-                codeInput.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                codeInput.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                codeInput.dispatchEvent(new Event('keyup', {{ bubbles: true }}));
-                
-                console.log('✅ 확인코드 입력 완료:', codeInput.value);
-                
-                // 제출 버튼 찾기 및 클릭 (1초 후)
-                setTimeout(() => {{
-                    // 정확한 확인 버튼 찾기
-                    const confirmButton = document.querySelector('button[onclick*="goCompare"]') ||
-                                        document.querySelector('button[type="submit"]') ||
-                                        Array.from(document.querySelectorAll('button')).find(btn => 
-                                            btn.textContent.includes('확인')
-                                        );
-                    
-                    if (confirmButton) {{
-                        console.log('확인 버튼 클릭:', confirmButton.textContent);
-                        confirmButton.click();
-                        window.codeSubmitted = true;
-                    }} else {{
-                        console.log('❌ 확인 버튼을 찾을 수 없음');
-                        
-                        // 모든 버튼 출력 (디버깅용)
-                        const allButtons = document.querySelectorAll('button');
-                        console.log('페이지의 모든 버튼:');
-                        allButtons.forEach((btn, i) => {{
-                            console.log(`  ${{i}}: "${{btn.textContent}}" onclick="${{btn.onclick}}"`);
-                        }});
-                    }}
-                }}, 1000);
-                
-                return true;
-            }} else {{
-                console.log('❌ 코드 입력 필드를 찾을 수 없음');
-                return false;
-            }}
-            """
-            
-            result = driver.execute_script(input_js)
+            # 입력 필드에 값 설정 후 1초 뒤 확인 버튼 클릭 (페이지 헬퍼 window.__ev.inputCode)
+            result = call_page_helper(driver, 'inputCode', reversed_code, 1000)
             
             if result:
                 # 제출 완료 대기
@@ -330,22 +279,8 @@ class FinalVerifiedAutomation:
     def load_users_from_excel(self):
         """엑셀에서 사용자 데이터 로드"""
         try:
-            # 이미 검증된 방식으로 로드
-            from working_excel_reader import read_user_sheet
-            import re
-            
-            excel_obj = pd.ExcelFile(self.excel_file)
-            sheet_names = excel_obj.sheet_names
-            
-            # 한글 이름 시트만 처리
-            user_sheets = [name for name in sheet_names if re.match(r'^[가-힣]{2,4}$', name)]
-            print(f"사용자 시트: {user_sheets}")
-            
-            for sheet_name in user_sheets:
-                user_data = read_user_sheet(self.excel_file, sheet_name)
-                if user_data:
-                    self.users_data.append(user_data)
-            
+            # 공용 로더 (파일 지문 캐시 사용)
+            self.users_data = parse_users_from_excel(self.excel_file, use_cache=True)
             print(f"총 {len(self.users_data)}명 로드 완료")
             return True
             
@@ -665,110 +600,15 @@ class FinalVerifiedAutomation:
         self.selector_map = collected
         return collected
     
-    def force_fill_missing_fields(self, driver, user_data):
-        """누락된 필드 강제 입력"""
-        force_js = f"""
-        console.log('=== 누락된 필드 강제 입력 ===');
-        
-        // 성별 강제 입력 (가장 중요)
-        console.log('1. 성별 강제 입력 시도');
-        const allGenderRadios = document.querySelectorAll('input[name="req_sex"]');
-        console.log('성별 라디오버튼 개수:', allGenderRadios.length);
-        
-        allGenderRadios.forEach((radio, index) => {{
-            console.log(`성별 라디오 ${{index}}: id=${{radio.id}}, value=${{radio.value}}, checked=${{radio.checked}}`);
-        }});
-        
-        // 모든 성별 해제
-        allGenderRadios.forEach(radio => {{
-            radio.checked = false;
-        }});
-        
-        // 대상 성별 선택
-        const targetGenderId = '{user_data.get('성별', '남자')}' === '남자' ? 'req_sex1' : 'req_sex2';
-        const targetGenderRadio = document.getElementById(targetGenderId);
-        
-        if (targetGenderRadio) {{
-            // 여러 방법으로 강제 선택
-            targetGenderRadio.checked = true;
-            targetGenderRadio.click();
-            targetGenderRadio.dispatchEvent(new Event('change', {{ bubbles: true }}));
-            targetGenderRadio.dispatchEvent(new Event('click', {{ bubbles: true }}));
-            
-            // 레이블 클릭도 시도
-            const label = document.querySelector(`label[for="${{targetGenderId}}"]`);
-            if (label) {{
-                label.click();
-            }}
-            
-            console.log(`성별 강제 선택 완료: ${{targetGenderRadio.checked}}`);
-        }}
-        
-        // 생년월일 강제 입력
-        console.log('2. 생년월일 강제 입력 시도');
-        const birthField = document.getElementById('birth1');
-        const hiddenBirth = document.getElementById('birth');
-        
-        if (hiddenBirth) {{
-            hiddenBirth.value = '{user_data.get('생년월일', '1990-01-01')}';
-            hiddenBirth.dispatchEvent(new Event('change', {{ bubbles: true }}));
-            console.log('hidden 생년월일 설정:', hiddenBirth.value);
-        }}
-        
-        if (birthField) {{
-            // 다양한 방법으로 시도
-            birthField.removeAttribute('readonly');
-            birthField.disabled = false;
-            birthField.focus();
-            birthField.select();
-            birthField.value = '';
-            
-            // 직접 입력
-            birthField.value = '{user_data.get('생년월일', '1990-01-01')}';
-            
-            // 이벤트 강제 발생
-            birthField.dispatchEvent(new Event('input', {{ bubbles: true }}));
-            birthField.dispatchEvent(new Event('change', {{ bubbles: true }}));
-            birthField.dispatchEvent(new Event('keyup', {{ bubbles: true }}));
-            birthField.dispatchEvent(new Event('blur', {{ bubbles: true }}));
-            
-            birthField.setAttribute('readonly', 'readonly');
-            console.log('생년월일 강제 입력:', birthField.value);
-        }}
-        
-        // 주소 강제 입력
-        console.log('3. 주소 강제 입력 시도');
-        const addrField = document.querySelector('input[name="addr"]') || document.getElementById('addr');
-        
-        if (addrField) {{
-            addrField.removeAttribute('readonly');
-            addrField.value = '{user_data.get('주소', '')}';
-            addrField.dispatchEvent(new Event('input', {{ bubbles: true }}));
-            addrField.dispatchEvent(new Event('change', {{ bubbles: true }}));
-            console.log('주소 강제 입력:', addrField.value);
-        }}
-        
-        // 최종 상태 확인
-        setTimeout(() => {{
-            console.log('=== 강제 입력 후 상태 확인 ===');
-            console.log('성별:', document.querySelector('input[name="req_sex"]:checked')?.value || '없음');
-            console.log('생년월일:', document.getElementById('birth1')?.value || '없음');
-            console.log('주소:', (document.querySelector('input[name="addr"]') || document.getElementById('addr'))?.value || '없음');
-        }}, 1000);
-        """
-        
-        driver.execute_script(force_js)
-        time.sleep(2)
-        print(f"[FORCE] 누락된 필드 강제 입력 시도 완료")
-    
     def auto_fill_all_fields(self, driver, user_data):
         """검증된 셀렉터로 모든 필드 자동 입력"""
         
-        # 우선순위 분석
-        priority = user_data.get('우선순위', '')
-        has_social = '사회계층' in priority and 'Y' in priority
-        is_multi_child = '다자녀' in priority
-        child_count = '2' if '2자녀' in priority else '1'
+        # 우선순위/차종 코드는 로드 시 해석한 값 사용
+        record = UserRecord.coerce(user_data)
+        has_social = record.priority.has_social
+        is_multi_child = record.priority.multi_child
+        child_count = record.priority.child_count or '1'
+        model_code = record.model_code
         
         # 검증된 JavaScript 코드 생성 (중복 선언 제거)
         js_script = f"""
@@ -809,10 +649,7 @@ class FinalVerifiedAutomation:
             const reqKind = document.getElementById('req_kind');
             if (reqKind) {{ reqKind.value = 'P'; reqKind.dispatchEvent(new Event('change', {{bubbles:true}})); }}
             const modelField = document.getElementById('model_cd');
-            let targetModelValue = '';
-            if ('{user_data['신청차종']}'.includes('EV3') && '{user_data['신청차종']}'.includes('스탠다드')) targetModelValue = 'EV3_2WD_S';
-            else if ('{user_data['신청차종']}'.includes('레이EV') || '{user_data['신청차종']}'.includes('레이 EV')) targetModelValue = 'RAY_4_R';
-            else if ('{user_data['신청차종']}'.includes('EV3') && '{user_data['신청차종']}'.includes('롱레인지')) targetModelValue = 'EV3_2WD_L17';
+            const targetModelValue = '{model_code}';
             if (modelField && targetModelValue) {{ modelField.value = targetModelValue; modelField.dispatchEvent(new Event('change', {{bubbles:true}})); }}
 
             console.log('✅ 필드 입력 완료');
@@ -877,64 +714,9 @@ class FinalVerifiedAutomation:
                 print(f"[TEMP_SAVE] JS 플로우 우선 시도 실패: {_e}")
 
             # 임시저장 전 필수 필드 검증
-            validation_js = """
-            console.log('=== 임시저장 전 필수 필드 검증 ===');
-            
-            const requiredFields = [
-                { id: 'req_nm', name: '성명' },
-                { id: 'mobile', name: '휴대전화' },
-                { id: 'birth1', name: '생년월일' },
-                { id: 'contract_day', name: '계약일자' },
-                { selector: 'input[name="req_sex"]:checked', name: '성별' },
-                { id: 'req_kind', name: '신청유형', isSelect: true },
-                { id: 'model_cd', name: '신청차종', isSelect: true },
-                { id: 'addr', name: '주소' },
-                { id: 'addr_detail', name: '상세주소' }
-            ];
-            
-            let validationPassed = true;
-            const missingFields = [];
-            
-            requiredFields.forEach(field => {
-                let element;
-                if (field.selector) {
-                    element = document.querySelector(field.selector);
-                } else {
-                    element = document.getElementById(field.id);
-                }
-                
-                if (!element) {
-                    missingFields.push(field.name + ' (요소 없음)');
-                    validationPassed = false;
-                } else if (field.isSelect) {
-                    if (!element.value || element.value === '') {
-                        missingFields.push(field.name + ' (선택 안됨)');
-                        validationPassed = false;
-                    } else {
-                        console.log(`✅ ${field.name}: ${element.options[element.selectedIndex].text}`);
-                    }
-                } else if (field.selector) {
-                    console.log(`✅ ${field.name}: 선택됨`);
-                } else {
-                    if (!element.value) {
-                        missingFields.push(field.name + ' (값 없음)');
-                        validationPassed = false;
-                    } else {
-                        console.log(`✅ ${field.name}: ${element.value}`);
-                    }
-                }
-            });
-            
-            if (validationPassed) {
-                console.log('✅ 모든 필수 필드 검증 통과');
-                return true;
-            } else {
-                console.log('❌ 필수 필드 검증 실패:', missingFields);
-                return false;
-            }
-            """
-            
-            if not driver.execute_script(validation_js):
+            validation = call_page_helper(driver, 'validate', REQUIRED_FIELDS_BEFORE_SAVE) or {}
+            if not validation.get('ok'):
+                print(f"[VALIDATION] 누락: {', '.join(validation.get('issues') or [])}")
                 print("[ERROR] 필수 필드 검증 실패 - 임시저장 불가")
                 print("[INFO] 누락된 필드들을 먼저 입력해주세요")
                 return False
@@ -943,29 +725,8 @@ class FinalVerifiedAutomation:
             print("[TEMP_SAVE] 임시저장 버튼 클릭 시도")
             clicked = False
             try:
-                temp_save_js = """
-                console.log('=== 임시저장 버튼 찾기(강화) ===');
-                const cands = Array.from(document.querySelectorAll(
-                  'button, input[type="button"], input[type="submit"], a, [role="button"]'
-                ));
-                let target = null;
-                for (const el of cands) {
-                  const txt = (el.textContent || el.value || '').trim();
-                  const oc  = (el.getAttribute && el.getAttribute('onclick')) || '';
-                  if (txt.includes('임시저장') || txt.includes('저장') || (oc && oc.includes('save'))) {
-                    target = el; break;
-                  }
-                }
-                if (target) {
-                  try { console.log('임시저장 후보 outerHTML:', target.outerHTML); } catch(e) {}
-                  try { target.scrollIntoView({behavior:'instant', block:'center'}); } catch(e) {}
-                  target.click();
-                  console.log('✅ 임시저장 후보 클릭 완료');
-                  return true;
-                }
-                return false;
-                """
-                res = driver.execute_script(temp_save_js)
+                # 텍스트에 '임시저장'/'저장' 또는 onclick 에 'save' 가 있는 첫 버튼 (페이지 헬퍼)
+                res = call_page_helper(driver, 'clickByText', ['임시저장', '저장'], ['save'])
                 clicked = bool(res)
             except Exception:
                 # 알럿이 이미 떠서 스크립트가 중단된 경우로 간주
@@ -1048,15 +809,14 @@ class FinalVerifiedAutomation:
             if not clicked:
                 print("⚠️ 임시저장 버튼을 프로그램이 직접 클릭하지 못했습니다. (팝업 존재 여부를 확인합니다)")
             
-            time.sleep(2)
-            
             # 2단계: JavaScript Alert/Confirm 팝업 자동 처리
             print("[POPUP] 확인 팝업 처리 (JavaScript Alert)")
             
             try:
-                # JavaScript alert/confirm 대기 및 처리
-                WebDriverWait(driver, 5).until(EC.alert_is_present())
-                alert = driver.switch_to.alert
+                # JavaScript alert/confirm 대기 및 처리 (뜨는 즉시 처리)
+                alert = wait_for_alert(driver, timeout=7, budget=2, label='임시저장 확인 팝업')
+                if alert is None:
+                    raise TimeoutError('확인 팝업 없음')
                 alert_text = alert.text
                 print(f"[POPUP] 팝업 메시지: {alert_text}")
                 
@@ -1091,7 +851,7 @@ class FinalVerifiedAutomation:
                 except Exception:
                     pass
             
-            time.sleep(3)
+            wait_for(driver, network_idle(500), timeout=3, budget=3, label='임시저장 처리')
             
             # 3단계: 새 창 대기 및 전환
             print("🔍 새 창 또는 동일 창 내 확인코드 입력 플로우 대기 중...")
@@ -1108,7 +868,9 @@ class FinalVerifiedAutomation:
                         driver.switch_to.window(window)
                         break
                 
-                time.sleep(2)
+                # 확인코드 화면이 그려지면 바로 진행
+                wait_for(driver, all_of(dom_ready(), element_present(['#randeomChk', 'input[type="text"]'])),
+                         timeout=5, budget=2, label='확인코드 창')
                 
                 # 4단계: 실시간 확인코드 추출 (매번 다름!)
                 print("[CODE] 화면에서 실시간 확인코드 추출 중...")
@@ -1221,72 +983,25 @@ class FinalVerifiedAutomation:
             
             # 모든 필드 자동 입력 (모듈화된 스크립트 사용)
             try:
-                driver.execute_script(build_fill_script(user_data))
+                result = fill_fields_planned(driver, user_data)
+                if result.get('error'):
+                    raise RuntimeError(result['error'])
             except Exception:
                 js_script = self.auto_fill_all_fields(driver, user_data)
                 driver.execute_script(js_script)
             
-            # 입력 완료 대기
-            time.sleep(5)
-            
-            # 누락된 필드 강제 입력 시도
-            print(f"[FORCE] 누락된 필드 강제 입력")
-            self.force_fill_missing_fields(driver, user_data)
+            # 입력 완료 대기 (값은 같은 호출에서 확인했으므로 페이지 change 핸들러 요청만 기다림)
+            wait_for(driver, network_idle(300), timeout=2, budget=1, label='입력 후 처리')
             
-            # 추가 대기
-            time.sleep(3)
+            # 입력 값을 한 번에 읽어 비교하고 틀린 필드만 재입력
+            print(f"[VERIFY] 입력 결과 확인")
+            verify_and_refill(driver, user_data)
             
             # 입력 결과 즉시 검증
-            validation_result = driver.execute_script("""
-            console.log('=== 입력 결과 즉시 검증 ===');
-            
-            const checkFields = [
-                { id: 'req_nm', name: '성명' },
-                { id: 'mobile', name: '휴대전화' },
-                { id: 'birth1', name: '생년월일' },
-                { selector: 'input[name="req_sex"]:checked', name: '성별' },
-                { id: 'req_kind', name: '신청유형' },
-                { id: 'model_cd', name: '신청차종' }
-            ];
-            
-            let allValid = true;
-            const issues = [];
-            
-            checkFields.forEach(field => {
-                let element = field.selector ? 
-                    document.querySelector(field.selector) : 
-                    document.getElementById(field.id);
-                
-                if (!element) {
-                    issues.push(`${field.name}: 요소 없음`);
-                    allValid = false;
-                } else if (field.selector) {
-                    console.log(`✅ ${field.name}: 선택됨 (${element.value})`);
-                } else if (element.tagName === 'SELECT') {
-                    if (!element.value) {
-                        issues.push(`${field.name}: 선택 안됨`);
-                        allValid = false;
-                    } else {
-                        console.log(`✅ ${field.name}: ${element.options[element.selectedIndex].text}`);
-                    }
-                } else {
-                    if (!element.value) {
-                        issues.push(`${field.name}: 값 없음`);
-                        allValid = false;
-                    } else {
-                        console.log(`✅ ${field.name}: ${element.value}`);
-                    }
-                }
-            });
-            
-            if (allValid) {
-                console.log('✅ 모든 필수 필드 입력 완료');
-                return true;
-            } else {
-                console.log('❌ 필수 필드 누락:', issues);
-                return false;
-            }
-            """)
+            validation = call_page_helper(driver, 'validate', REQUIRED_FIELDS_AFTER_FILL) or {}
+            validation_result = bool(validation.get('ok'))
+            if not validation_result:
+                print(f"[VALIDATION] 필수 필드 누락: {', '.join(validation.get('issues') or [])}")
             
             if validation_result:
                 print(f"[SUCCESS] 프로필 {profile_id} 모든 필드 입력 및 검증 완료")
@@ -1324,51 +1039,73 @@ class FinalVerifiedAutomation:
         print("🎯 최종 검증된 자동화 시스템")
         print("=" * 60)
         
-        # 데이터 로드
-        # 데이터 로드 (모듈 분리)
-        try:
-            self.users_data = load_users_from_excel(self.excel_file)
-        except Exception:
-            self.load_users_from_excel()
-        
         # 기존 학습 로그에서 셀렉터 매핑 로드(존재 시)
         try:
             self.build_selector_map_from_logs()
         except Exception:
             pass
         
-        if not self.users_data:
-            print("처리할 데이터가 없습니다.")
-            return
-        
-        # 처리할 사용자 선택
-        print(f"\n처리 가능한 사용자:")
-        for i, user in enumerate(self.users_data):
-            priority_info = user.get('우선순위', '일반')
-            print(f"  {i+1}. {user['성명']} - {user['휴대전화']} - {priority_info}")
-        
-        max_users = min(2, len(self.users_data))
-        print(f"\n{max_users}명을 동시 처리합니다.")
-        
-        # 멀티스레딩 실행
+        max_users = 2
         threads = []
-        for i in range(max_users):
+        reset_wait_stats()
+        reset_verify_stats()
+        
+        def start_user(user):
+            """사용자 스레드 시작 (동시 처리 인원까지만, 사전 검증 실패 시 건너뜀)"""
+            if len(threads) >= max_users:
+                return
+            issues = validate_user(user)
+            if issues:
+                print(f"[PREFLIGHT] {user.get('성명', '')} 건너뜀: {summarize_issues(issues)}")
+                return
             thread = threading.Thread(
                 target=self.process_user,
-                args=(self.users_data[i], i+1)
+                args=(user, len(threads)+1)
             )
             threads.append(thread)
-        
-        # 스레드 시작
-        for thread in threads:
             thread.start()
             time.sleep(2)
         
+        # 캐시로 전체 목록을 이미 알면 브라우저를 띄우기 전에 사전 검증 표 출력
+        # (스트리밍일 때는 레코드마다 건너뛰기만 하고 표는 끝에 요약으로 출력)
+        upfront_users = cached_users_from_excel(self.excel_file)
+        if upfront_users is not None:
+            print_report(run_preflight(upfront_users))
+        
+        # 데이터 로드 (시트가 파싱되는 대로 바로 브라우저 작업 시작)
+        print(f"\n처리 가능한 사용자:")
+        self.users_data = []
+        try:
+            for user in iter_users_from_excel(self.excel_file):
+                self.users_data.append(user)
+                priority_info = user.get('우선순위', '일반')
+                print(f"  {len(self.users_data)}. {user['성명']} - {user['휴대전화']} - {priority_info}")
+                start_user(user)
+        except Exception as e:
+            print(f"[ERROR] 엑셀 스트리밍 로드 실패: {e}")
+            if not threads:
+                self.users_data = []
+                self.load_users_from_excel()
+                for user in self.users_data:
+                    start_user(user)
+        
+        if not self.users_data:
+            print("처리할 데이터가 없습니다.")
+            return
+        
+        if upfront_users is None:
+            print_report(run_preflight(self.users_data))
+        print(f"\n{len(threads)}명을 동시 처리합니다.")
+        
         # 완료 대기
         for thread in threads:
             thread.join()
         
         print(f"\n🎊 전체 처리 완료!")
+        print(format_wait_report())
+        get_locator_cache().flush()
+        print(get_locator_cache().format_stats())
+        print(format_verify_report())
     
     def cleanup(self):
         """정리 (사용자 확인 후)"""
@@ -7,7 +7,13 @@ import importlib
 import sys
 from ev_automation.browser import create_stealth_browser, create_normal_browser, create_browser_with_reuse, create_browser_simple, start_chrome_with_debugging
 from ev_automation.excel_loader import load_users_from_excel
-from ev_automation.fill_fields import build_fill_script, fill_fields_selenium_human_like
+from ev_automation.incremental_loader import IncrementalWorkbookLoader
+from ev_automation.preflight import format_report, run_preflight
+from ev_automation.input_adapters import EXCEL_EXTENSIONS, load_users_from_file
+from ev_automation.fill_fields import fill_fields_selenium_human_like
+from ev_automation.selectors_learning import get_locator_cache
+from ev_automation.verify_fill import format_verify_report, reset_verify_stats, verify_and_refill
+from ev_automation.waits import format_wait_report, reset_wait_stats
 from ev_automation.temp_save import force_temp_save_with_retry
 from ev_automation.file_attachment import attach_pdf_files, find_and_click_submit_button, handle_final_popup
 from selenium.webdriver.common.by import By
@@ -26,6 +32,7 @@ class AutomationGUI:
         self.driver = None
         self.session_maintained = False  # 세션 유지 상태
         self.browser_reuse_started = False  # 브라우저 재사용 모드 시작 여부
+        self.workbook_loader = None  # 증분 새로고침용 워크북 로더
         
         self.setup_ui()
     
@@ -133,8 +140,29 @@ class AutomationGUI:
             # ev_automation 모듈들 리로드
             modules_to_reload = [
                 'ev_automation.browser',
+                'ev_automation.normalize',
+                'ev_automation.priority_flags',
+                'ev_automation.model_index',
+                'ev_automation.model_catalog',
+                'ev_automation.address_index',
+                'ev_automation.header_alias',
+                'ev_automation.user_record',
+                'ev_automation.field_rules',
+                'ev_automation.xlsx_reader',
+                'ev_automation.workbook_cache',
                 'ev_automation.excel_loader', 
+                'ev_automation.incremental_loader',
+                'ev_automation.preflight',
+                'ev_automation.input_adapters',
+                'ev_automation.fill_script',
+                'ev_automation.page_helpers',
+                'ev_automation.selectors_learning',
+                'ev_automation.locator',
+                'ev_automation.button_finder',
+                'ev_automation.waits',
+                'ev_automation.fill_plan',
                 'ev_automation.fill_fields',
+                'ev_automation.verify_fill',
                 'ev_automation.temp_save',
                 'ev_automation.file_attachment'
             ]
@@ -156,8 +184,18 @@ class AutomationGUI:
         try:
             self.log_message("📁 파일 목록 새로고침 중...")
             
-            # 엑셀 파일 경로가 있으면 다시 로드
-            if self.excel_path.get():
+            # 같은 엑셀 파일이면 바뀐 시트만 다시 읽음
+            loader = self.workbook_loader
+            if loader and loader.excel_file == self.excel_path.get():
+                result = loader.refresh()
+                self.users_data = loader.users
+                self.update_user_listbox()
+                if result['full_reload']:
+                    self.log_message("📄 전체 시트 다시 로드")
+                else:
+                    self.log_message(f"📄 변경 {len(result['changed'])}개, 추가 {len(result['added'])}개, "
+                                     f"삭제 {len(result['removed'])}개 시트 반영")
+            elif self.excel_path.get():
                 self.load_users()
             
             self.log_message("✅ 파일 목록 새로고침 완료")
@@ -168,7 +206,8 @@ class AutomationGUI:
     def browse_excel(self):
         filename = filedialog.askopenfilename(
             title="엑셀 파일 선택",
-            filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
+            filetypes=[("Excel files", "*.xlsx *.xls"), ("CRM export", "*.csv *.jsonl *.ndjson *.parquet"),
+                       ("All files", "*.*")]
         )
         if filename:
             self.excel_path.set(filename)
@@ -190,16 +229,21 @@ class AutomationGUI:
             return
         
         try:
-            # 사용자 목록 로드
-            self.users_data = load_users_from_excel(self.excel_path.get())
-            
-            # 리스트박스 초기화
-            self.user_listbox.delete(0, tk.END)
+            # 사용자 목록 로드 (변경 없는 워크북은 캐시에서 바로 로드)
+            if not self.excel_path.get().lower().endswith(EXCEL_EXTENSIONS):
+                # CRM 내보내기 CSV/JSONL/Parquet
+                self.workbook_loader = None
+                self.users_data = load_users_from_file(self.excel_path.get())
+            else:
+                try:
+                    self.workbook_loader = IncrementalWorkbookLoader(self.excel_path.get())
+                    self.users_data = self.workbook_loader.load()
+                except Exception as e:
+                    self.log_message(f"⚠️ 증분 로더 사용 불가, 기본 로더 사용: {e}")
+                    self.workbook_loader = None
+                    self.users_data = load_users_from_excel(self.excel_path.get(), use_cache=True)
             
-            # 사용자 목록 추가
-            for i, user in enumerate(self.users_data):
-                user_info = f"{i+1}. {user['성명']} - {user['휴대전화']} - {user.get('우선순위', '일반')}"
-                self.user_listbox.insert(tk.END, user_info)
+            self.update_user_listbox()
             
             self.log_message(f"총 {len(self.users_data)}명의 사용자 로드 완료")
             
@@ -207,6 +251,16 @@ class AutomationGUI:
             messagebox.showerror("오류", f"사용자 목록 로드 실패: {str(e)}")
             self.log_message(f"오류: {str(e)}")
     
+    def update_user_listbox(self):
+        """사용자 목록 리스트박스 다시 그리기"""
+        # 리스트박스 초기화
+        self.user_listbox.delete(0, tk.END)
+        
+        # 사용자 목록 추가
+        for i, user in enumerate(self.users_data):
+            user_info = f"{i+1}. {user['성명']} - {user['휴대전화']} - {user.get('우선순위', '일반')}"
+            self.user_listbox.insert(tk.END, user_info)
+    
     def start_automation(self):
         if not self.excel_path.get():
             messagebox.showerror("오류", "엑셀 파일을 선택해주세요.")
@@ -222,6 +276,11 @@ class AutomationGUI:
             messagebox.showerror("오류", "처리할 사용자를 선택해주세요.")
             return
         
+        # 사전 검증: 브라우저를 띄우기 전에 선택된 사용자 전체 검사
+        selected_indices = self.run_preflight_check(selected_indices)
+        if not selected_indices:
+            return
+        
         # 브라우저 재사용 모드가 시작되었는지 확인
         if self.browser_reuse_started and not self.reuse_browser_var.get():
             self.log_message("🔧 브라우저 재사용 모드가 시작되었으므로 자동으로 활성화합니다")
@@ -244,6 +303,30 @@ class AutomationGUI:
         self.automation_thread.daemon = True
         self.automation_thread.start()
     
+    def run_preflight_check(self, selected_indices):
+        """선택된 사용자 사전 검증. 진행할 인덱스 반환 (취소 시 빈 튜플)"""
+        result = run_preflight([self.users_data[i] for i in selected_indices])
+        for line in format_report(result).splitlines():
+            self.log_message(line)
+        if not result['failed']:
+            return selected_indices
+        
+        passed_ids = {id(record) for record in result['passed']}
+        passed_indices = tuple(i for i in selected_indices if id(self.users_data[i]) in passed_ids)
+        failed_names = ", ".join(record.name or '(이름 없음)' for record, _ in result['failed'])
+        if not passed_indices:
+            messagebox.showerror("사전 검증 실패", f"선택한 사용자 모두 검증에 실패했습니다.\n{failed_names}\n\n자세한 내용은 로그를 확인하세요.")
+            return ()
+        if not messagebox.askyesno("사전 검증", f"{len(result['failed'])}명 검증 실패: {failed_names}\n\n"
+                                               f"통과한 {len(passed_indices)}명만 진행하시겠습니까?"):
+            return ()
+        
+        # 통과한 사용자만 선택 상태로 남김 (process_selected_users 가 선택 목록을 다시 읽음)
+        self.user_listbox.selection_clear(0, tk.END)
+        for i in passed_indices:
+            self.user_listbox.selection_set(i)
+        return passed_indices
+    
     def run_automation(self, selected_indices):
         try:
             self.log_message("🚀 자동화 시작...")
@@ -380,6 +463,8 @@ class AutomationGUI:
             self.log_message(f"📝 {len(selected_users)}명의 사용자 처리 시작")
             
             attempted_count = 0
+            reset_wait_stats()
+            reset_verify_stats()
             for i, user in enumerate(selected_users):
                 if not self.automation_running:
                     break
@@ -420,74 +505,22 @@ class AutomationGUI:
                 self.log_message("📝 1단계: 신청서 필드 입력 중...")
                 self.log_message(f"🔍 사용자 정보: {user.get('성명', '')} - {user.get('휴대전화', '')}")
                 try:
-                    # 사람처럼 입력 지연 제거(Fast 모드)
-                    self.log_message("🔄 fill_fields_selenium_human_like(fast_mode=True) 호출 중...")
+                    # 사람처럼 입력 지연 제거(Fast 모드) + 입력 계획 단계별로 한 번씩 입력
+                    self.log_message("🔄 fill_fields_selenium_human_like(fast_mode=True, single_call=True) 호출 중...")
                     attempted_count += 1
-                    success = fill_fields_selenium_human_like(self.driver, user, fast_mode=True)
+                    success = fill_fields_selenium_human_like(self.driver, user, fast_mode=True, single_call=True)
                     self.log_message(f"📊 fill_fields_selenium_human_like 결과: {success}")
                     if not success:
                         self.log_message(f"⚠️ {user.get('성명', '')} 필드 입력이 완전히 성공하지 않았습니다")
                         self.log_message("💡 일부 필드만 입력되었을 수 있지만 계속 진행합니다")
                     
-                    # 생년월일 필드 누락 확인 및 재입력
-                    self.log_message("🔍 생년월일 필드 누락 확인 중...")
-                    time.sleep(2)
-                    
-                    try:
-                        # 생년월일 필드 상태 확인
-                        birth_element = self.driver.find_element(By.ID, 'birth')
-                        birth_value = birth_element.get_attribute('value')
-                        birth1_element = self.driver.find_element(By.ID, 'birth1')
-                        birth1_value = birth1_element.get_attribute('value')
-                        
-                        expected_birth = user.get('생년월일', '')
-                        self.log_message(f"📊 생년월일 필드 상태:")
-                        self.log_message(f"   - birth: {birth_value}")
-                        self.log_message(f"   - birth1: {birth1_value}")
-                        self.log_message(f"   - 예상값: {expected_birth}")
-                        
-                        # 누락된 경우 재입력
-                        if not birth_value and not birth1_value:
-                            self.log_message("⚠️ 생년월일 필드 누락 - 재입력 시도...")
-                            
-                            # JavaScript로 강제 입력
-                            js_script = f"""
-                            try {{
-                                const birthField = document.getElementById('birth');
-                                const birth1Field = document.getElementById('birth1');
-                                
-                                if (birthField) {{
-                                    birthField.removeAttribute('readonly');
-                                    birthField.value = '{expected_birth}';
-                                    birthField.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                                    birthField.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                                }}
-                                
-                                if (birth1Field) {{
-                                    birth1Field.removeAttribute('readonly');
-                                    birth1Field.value = '{expected_birth}';
-                                    birth1Field.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                                    birth1Field.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                                }}
-                                
-                                return true;
-                            }} catch(e) {{
-                                console.error('생년월일 재입력 실패:', e);
-                                return false;
-                            }}
-                            """
-                            result = self.driver.execute_script(js_script)
-                            if result:
-                                self.log_message("✅ 생년월일 재입력 완료")
-                            else:
-                                self.log_message("❌ 생년월일 재입력 실패")
-                        else:
-                            self.log_message("✅ 생년월일 필드 정상 입력됨")
-                            
-                    except Exception as e:
-                        self.log_message(f"⚠️ 생년월일 필드 확인 중 오류: {e}")
-                    
-                    time.sleep(3)
+                    # 입력 값을 한 번에 읽어 비교하고 틀린 필드만 재입력 (생년월일 누락 등)
+                    self.log_message("🔍 입력 결과 확인 중...")
+                    report = verify_and_refill(self.driver, user)
+                    self.log_message(f"📊 입력 확인: 재입력으로 맞춤 {', '.join(report['fixed']) or '없음'}"
+                                     f" / 실패 {', '.join(report['failed']) or '없음'} (재입력 {report['rounds']}회)")
+                    if report.get('error'):
+                        self.log_message(f"⚠️ 입력 확인 중 오류: {report['error']}")
                     self.log_message("✅ 신청서 필드 입력 완료")
                     
                     # 필드 입력 완료 후 수동 작업 안내
@@ -529,6 +562,10 @@ class AutomationGUI:
                 if attempted_count > 0:
                     self.progress_var.set("자동화 완료")
                     self.log_message("\n🎊 모든 자동화 작업이 완료되었습니다!")
+                    self.log_message(format_wait_report())
+                    get_locator_cache().flush()
+                    self.log_message(get_locator_cache().format_stats())
+                    self.log_message(format_verify_report())
                     messagebox.showinfo("완료", "자동화가 성공적으로 완료되었습니다.")
                 else:
                     self.progress_var.set("대기")
@@ -10,7 +10,10 @@ import time
 from ev_automation.browser import create_stealth_browser, wait_for_page_load
 from ev_automation.fill_fields import fill_fields_selenium
 from ev_automation.temp_save import force_temp_save_with_retry
-from ev_automation.excel_loader import load_users_from_excel
+from ev_automation.input_adapters import cached_users_from_file, iter_users_from_file
+from ev_automation.preflight import print_report, run_preflight, summarize_issues, validate_user
+from ev_automation.selectors_learning import get_locator_cache
+from ev_automation.waits import format_wait_report, reset_wait_stats
 
 class EVAutomation:
     def __init__(self):
@@ -115,34 +118,60 @@ class EVAutomation:
             return False
     
     def run_batch_automation(self, excel_file_path):
-        """Excel 파일에서 데이터를 읽어 배치 자동화 실행"""
+        """Excel(또는 CSV/JSONL/Parquet) 파일에서 데이터를 읽어 배치 자동화 실행"""
         try:
-            users = load_users_from_excel(excel_file_path)
-            print(f"📊 총 {len(users)}명의 사용자 데이터 로드 완료")
-            
+            # 시트가 파싱되는 대로 처리 (나머지 시트는 백그라운드에서 계속 파싱)
             success_count = 0
-            total_count = len(users)
+            total_count = 0
+            loaded_users = []
+            reset_wait_stats()
+            
+            # 캐시로 전체 목록을 이미 알면 브라우저를 띄우기 전에 사전 검증 표 출력
+            # (스트리밍일 때는 레코드마다 건너뛰기만 하고 표는 끝에 요약으로 출력)
+            upfront_users = cached_users_from_file(excel_file_path)
+            if upfront_users is not None:
+                print_report(run_preflight(upfront_users))
             
-            for i, user_data in enumerate(users, 1):
-                print(f"\n📝 진행률: {i}/{total_count}")
+            for user_data in iter_users_from_file(excel_file_path):
+                loaded_users.append(user_data)
+                
+                # 사전 검증 실패 레코드는 건너뜀
+                issues = validate_user(user_data)
+                if issues:
+                    print(f"[PREFLIGHT] {user_data.get('성명', 'Unknown')} 건너뜀: {summarize_issues(issues)}")
+                    continue
+                
+                total_count += 1
+                i = total_count
+                
+                # 다음 사용자 전 대기
+                if i > 1:
+                    print("⏳ 다음 사용자 처리 전 대기...")
+                    time.sleep(3)
+                
+                print(f"\n📝 진행 중: {i}번째 사용자 ({user_data.get('성명', 'Unknown')})")
                 
                 try:
                     success = self.run_automation(user_data)
                     if success:
                         success_count += 1
-                    
-                    # 다음 사용자 전 대기
-                    if i < total_count:
-                        print("⏳ 다음 사용자 처리 전 대기...")
-                        time.sleep(3)
                         
                 except Exception as e:
                     print(f"❌ 사용자 {user_data.get('성명', 'Unknown')} 처리 중 오류: {e}")
                     continue
             
+            if upfront_users is None:
+                print_report(run_preflight(loaded_users))
+            print(f"📊 총 {total_count}명의 사용자 데이터 처리")
+            if total_count == 0:
+                return
+            
             print(f"\n{'='*60}")
             print(f"📊 배치 자동화 완료")
             print(f"성공: {success_count}/{total_count} ({success_count/total_count*100:.1f}%)")
+            print(format_wait_report())
+            get_locator_cache().flush()
+            print(get_locator_cache().format_stats())
             print(f"{'='*60}")
             
         except Exception as e:
@@ -179,7 +208,7 @@ def main():
             
         elif choice == "2":
             # Excel 파일 배치 처리
-            excel_file = input("Excel 파일 경로를 입력하세요: ").strip()
+            excel_file = input("Excel/CSV/JSONL/Parquet 파일 경로를 입력하세요: ").strip()
             
             if not os.path.exists(excel_file):
                 print(f"❌ 파일을 찾을 수 없습니다: {excel_file}")
@@ -1,11 +1,18 @@
 import os
-import time
 import json
 import threading
 from typing import Dict, Optional, Tuple
 
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
+from ev_automation.fill_script import build_fill_payload, field_payload, summarize_fill_results
+from ev_automation.model_catalog import pick_model_option
+from ev_automation.page_helpers import (
+    REQUIRED_FIELDS_AFTER_FILL, call_page_helper_playwright, install_page_helpers_playwright
+)
+from ev_automation.user_record import UserRecord
+from ev_automation.waits import all_of, dom_ready, network_idle, wait_for_playwright
+
 
 class PlaywrightEVAutomation:
     """Playwright 기반 EV 신청서 자동화 (학습 모드 + 재생 모드)
@@ -47,6 +54,8 @@ class PlaywrightEVAutomation:
         self.page.add_init_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
         )
+        # 페이지 헬퍼(window.__ev)는 컨텍스트에 등록해 팝업/새 탭에도 주입
+        install_page_helpers_playwright(self.context)
 
     def close(self) -> None:
         try:
@@ -236,121 +245,65 @@ class PlaywrightEVAutomation:
         return collected
 
     # ---------- 자동 입력 ----------
-    def _fill_text(self, sel: str, value: str) -> None:
-        try:
-            self.page.fill(sel, value)
-        except Exception:
-            # readonly 등 우회
-            self.page.evaluate(
-                "(s,v)=>{const el=document.querySelector(s); if(!el) return; el.removeAttribute('readonly'); el.value=v; el.dispatchEvent(new Event('input',{bubbles:true})); el.dispatchEvent(new Event('change',{bubbles:true})); el.setAttribute('readonly','readonly');}",
-                sel,
-                value,
-            )
-
-    def auto_fill(self, user: Dict[str, str]) -> None:
-        # id 우선 → selector 폴백
-        def sel_for(key: str, default_id: Optional[str]) -> Optional[str]:
+    def auto_fill(self, user) -> dict:
+        """페이지 헬퍼(window.__ev.fill) 호출 한 번으로 입력하고 필드별 확인 결과 반환"""
+        # 로드 시점에 정규화된 레코드 사용 (dict 가 오면 한 번만 변환)
+        record = UserRecord.coerce(user)
+
+        # 기록해 둔 선택자가 있으면 id 보다 먼저 시도
+        selectors = {}
+        for key in ('성명', '휴대전화', '이메일', '전화', '주소', '신청대수'):
             entry = self.selector_map.get(key) or {}
-            if default_id:
-                return f"#{entry.get('id', default_id)}" if entry.get('id') or default_id else (entry.get('selector') or None)
-            return entry.get('selector') or (f"#{entry.get('id')}" if entry.get('id') else None)
-
-        # 기본 텍스트
-        mapping = [
-            (sel_for('성명', 'req_nm'), user.get('성명','')),
-            (sel_for('휴대전화', 'mobile'), user.get('휴대전화','')),
-            (sel_for('이메일', 'email'), user.get('이메일','.')),
-            (sel_for('전화', 'phone'), user.get('전화','.')),
-            (sel_for('주소', None) or 'input[name="addr"]', user.get('주소','')),
-            (sel_for('신청대수', 'req_cnt'), user.get('신청대수','1')),
-        ]
-        for selector, value in mapping:
-            if not selector:
-                continue
-            try:
-                self.page.wait_for_selector(selector, timeout=3000)
-                self._fill_text(selector, value)
-            except PlaywrightTimeoutError:
-                pass
-
-        # 날짜 필드 처리 (readonly 우회)
-        contract_val = user.get('계약일자', '2025-08-16')
-        delivery_val = user.get('출고예정일자', '2025-08-29')
-        birth_val = user.get('생년월일', '1990-01-01')
-        self.page.evaluate(
-            "(contract,birth,delivery)=>{\n"
-            " const c=document.getElementById('contract_day'); if(c){c.removeAttribute('readonly'); c.value=contract; c.setAttribute('readonly','readonly'); c.dispatchEvent(new Event('change',{bubbles:true}));}\n"
-            " const hb=document.getElementById('birth'); if(hb){hb.value=birth;}\n"
-            " const b=document.getElementById('birth1'); if(b){b.removeAttribute('readonly'); b.value=birth; b.setAttribute('readonly','readonly'); b.dispatchEvent(new Event('input',{bubbles:true})); b.dispatchEvent(new Event('change',{bubbles:true}));}\n"
-            " const d=document.getElementById('delivery_sch_day'); if(d){d.removeAttribute('readonly'); d.value=delivery; d.setAttribute('readonly','readonly'); d.dispatchEvent(new Event('change',{bubbles:true}));}\n"
-            "}",
-            contract_val,
-            birth_val,
-            delivery_val,
-        )
-
-        # 성별 라디오
-        gender = user.get('성별', '남자')
-        target_id = 'req_sex1' if gender == '남자' else 'req_sex2'
-        try:
-            self.page.check(f"#{target_id}")
-        except Exception:
-            self.page.evaluate(
-                "(id)=>{const r=document.getElementById(id); if(!r) return; r.checked=true; r.click(); r.dispatchEvent(new Event('change',{bubbles:true}));}",
-                target_id,
-            )
+            selector = f"#{entry['id']}" if entry.get('id') else entry.get('selector')
+            if selector:
+                selectors[key] = selector
 
-        # 드롭다운 선택
+        # 폼이 그려질 때까지 한 번만 대기 (필드별 대기 없음)
         try:
-            self.page.select_option('#req_kind', value='P')
-        except Exception:
+            self.page.wait_for_selector(selectors.get('성명', '#req_nm'), timeout=3000)
+        except PlaywrightTimeoutError:
             pass
 
-        # 차종 매핑
-        model = user.get('신청차종','')
-        model_val = ''
-        if 'EV3' in model and '스탠다드' in model:
-            model_val = 'EV3_2WD_S'
-        elif '레이' in model:
-            model_val = 'RAY_4_R'
-        elif 'EV3' in model and '롱레인지' in model:
-            model_val = 'EV3_2WD_L17'
-        if model_val:
-            try:
-                self.page.select_option('#model_cd', value=model_val)
-            except Exception:
-                pass
+        # 우선순위(사회계층, 다자녀, 생애최초 등)도 같은 호출에서 적용
+        payload = build_fill_payload(record, selectors=selectors)
+        result = call_page_helper_playwright(self.page, 'fill', payload) or {}
+        fields = result.get('fields') or {}
+        if result.get('priority'):
+            print("[PRIORITY] 우선순위 매핑 적용 완료:", ", ".join(result['priority']))
+
+        # 차종 (코드는 로드 시 해석, 옵션에 없으면 실제 옵션 기준으로 다시 해석)
+        options = (fields.get('model_cd') or {}).get('options')
+        if options and record.model:
+            model_val = pick_model_option(record.model, record.model_code, [tuple(o) for o in options])
+            if model_val:
+                retry = call_page_helper_playwright(self.page, 'fill', {
+                    'fields': [field_payload('신청차종', 'model_cd', 'select', model_val)],
+                    'priority': None,
+                }) or {}
+                fields.update(retry.get('fields') or {})
+
+        _, failed = summarize_fill_results(fields)
+        if failed:
+            print(f"[WARNING] 확인되지 않은 필드: {', '.join(failed)}")
+        return fields
 
     # ---------- 검증/임시저장 ----------
     def validate_required(self) -> bool:
-        return bool(self.page.evaluate(
-            "()=>{\n"
-            " const required=[\n"
-            "  {id:'req_nm',name:'성명'}, {id:'mobile',name:'휴대전화'}, {id:'birth1',name:'생년월일'},\n"
-            "  {selector:'input[name=\\'req_sex\\']:checked',name:'성별'}, {id:'req_kind',name:'신청유형',isSelect:true}, {id:'model_cd',name:'신청차종',isSelect:true}\n"
-            " ];\n"
-            " let ok=true;\n"
-            " for (const f of required){\n"
-            "  let el=f.selector?document.querySelector(f.selector):document.getElementById(f.id);\n"
-            "  if(!el){ ok=false; break; }\n"
-            "  if(f.isSelect){ if(!el.value){ ok=false; break; } } else { if(!el.value){ ok=false; break; } }\n"
-            " }\n"
-            " return ok; }"
-        ))
+        validation = call_page_helper_playwright(self.page, 'validate', REQUIRED_FIELDS_AFTER_FILL) or {}
+        if not validation.get('ok'):
+            print(f"[VALIDATION] 필수 필드 누락: {', '.join(validation.get('issues') or [])}")
+        return bool(validation.get('ok'))
 
     def temp_save_flow(self) -> bool:
         # 버튼 클릭
-        clicked = self.page.evaluate(
-            "()=>{\n"
-            " const cands=[...document.querySelectorAll('button'),...document.querySelectorAll('input[type=\\'button\\']')];\n"
-            " const btn=cands.find(b=>{const t=(b.textContent||b.value||''); return t.includes('임시저장')||t.includes('저장');});\n"
-            " if(btn){ btn.click(); return true; } return false; }"
+        clicked = call_page_helper_playwright(
+            self.page, 'clickByText', ['임시저장', '저장'], [], 'button, input[type="button"]'
         )
         if not clicked:
             return False
 
-        # 확인 버튼 처리 (대기 후 클릭 시도)
-        time.sleep(1.5)
+        # 확인 버튼 처리 (저장 요청이 끝난 뒤 클릭 시도)
+        wait_for_playwright(self.page, network_idle(300), timeout=3, budget=1.5, label='임시저장 확인')
         try:
             self.page.evaluate(
                 "()=>{\n"
@@ -370,7 +323,10 @@ class PlaywrightEVAutomation:
         if not new_page:
             return False
 
-        time.sleep(1.5)
+        try:
+            new_page.wait_for_load_state('domcontentloaded', timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
         extracted = new_page.evaluate(
             "()=>{\n"
             " const els=document.querySelectorAll('span,div,p,strong,td,label,h1,h2,h3');\n"
@@ -390,7 +346,11 @@ class PlaywrightEVAutomation:
             reversed_code,
         )
         if ok:
-            time.sleep(3)
+            # 확인 버튼은 0.5초 뒤 눌리므로 팝업이 닫힐 때까지 대기 (안 닫히면 최대 3초)
+            try:
+                new_page.wait_for_event('close', timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
         try:
             new_page.close()
         except Exception:
@@ -417,7 +377,8 @@ class PlaywrightEVAutomation:
 
             # 자동 입력
             self.auto_fill(user)
-            time.sleep(5)
+            wait_for_playwright(self.page, all_of(dom_ready(), network_idle(500)), timeout=5, budget=5,
+                                label='입력 후 로딩')
 
             # 검증 + 임시저장 여부
             if not self.validate_required():
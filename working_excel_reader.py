@@ -1,58 +1,87 @@
-import pandas as pd
-import re
-from datetime import datetime
-
-def read_user_sheet(excel_file, sheet_name):
-    """실제 엑셀 파일 구조에 맞는 사용자 데이터 읽기"""
-    try:
-        df = pd.read_excel(excel_file, sheet_name=sheet_name)
-        
-        # 데이터 추출
-        user_data = {}
-        
-        for i in range(len(df)):
-            row = df.iloc[i]
-            
-            # 열 12(인덱스 12)에 필드명, 열 13(인덱스 13)에 값이 있음
-            field_name = str(row.iloc[12]) if pd.notna(row.iloc[12]) else ""
-            field_value = str(row.iloc[13]) if pd.notna(row.iloc[13]) else ""
-            
-            if field_name and field_value and field_name != 'nan':
-                # 특수 처리
-                if field_name == '생년월일':
-                    # Excel 날짜 형식을 변환
-                    try:
-                        if field_value.isdigit():
-                            excel_date = int(field_value)
-                            # Excel의 1900년 기준 날짜를 변환
-                            date_obj = datetime(1900, 1, 1) + pd.Timedelta(days=excel_date-2)
-                            field_value = date_obj.strftime('%Y-%m-%d')
-                    except:
-                        pass
-                
-                elif field_name == '성별':
-                    # '여'를 '여자'로 변환
-                    if field_value == '여':
-                        field_value = '여자'
-                    elif field_value == '남':
-                        field_value = '남자'
-                
-                elif field_name == '주소':
-                    # 주소에 시도 정보 추가
-                    if '제천시' in field_value and not field_value.startswith('충청북도'):
-                        field_value = '충청북도 ' + field_value
-                
-                user_data[field_name] = field_value
-        
-        # 필수 필드 확인
-        required_fields = ['성명', '휴대전화', '생년월일', '성별', '주소']
-        missing_fields = [field for field in required_fields if field not in user_data]
-        
-        if missing_fields:
-            print(f"[WARNING] {sheet_name} 시트에서 누락된 필드: {missing_fields}")
-        
-        return user_data
-        
-    except Exception as e:
-        print(f"[ERROR] {sheet_name} 시트 읽기 실패: {e}")
-        return None
+import numpy as np
+import pandas as pd
+import re
+from ev_automation.address_index import normalize_addresses
+from ev_automation.header_alias import canonicalize_keys, resolve_header
+from ev_automation.field_rules import warn_missing_fields
+
+# Excel 1900 날짜 체계 기준일 (1900년 윤년 버그 포함: 1900-01-01 + (n-2)일)
+EXCEL_EPOCH = np.datetime64('1899-12-30', 'D')
+# datetime 으로 표현 가능한 최대 일련번호 (9999-12-31)
+EXCEL_MAX_SERIAL = 2958465
+
+
+def _column_to_text(column: pd.Series) -> pd.Series:
+    """열 전체를 문자열로 변환 (cell_to_text 의 열 단위 버전)"""
+    text = column.astype(str)
+    # 문자열이 아닌 셀(숫자)의 '.0' 제거
+    integral_float = ~text.eq(column) & text.str.endswith('.0')
+    return text.where(~integral_float, text.str[:-2])
+
+
+def extract_user_fields(frame: pd.DataFrame) -> pd.DataFrame:
+    """필드명/값 열 단위 추출 단계
+
+    frame 의 'field'(열 12), 'value'(열 13) 열을 한 번에 정리한다. 다른 열(예: 'sheet')은 그대로 둔다.
+    - NaN 행 일괄 제거 후 문자열 변환 (정수형 실수 29269.0 → '29269')
+    - 생년월일 Excel 일련번호 → YYYY-MM-DD
+    - 성별 '여'/'남' → '여자'/'남자'
+    - 주소 시도/시군구 보정 (행정구역 인덱스, 주소 행만 일괄 처리)
+    주소 보정 외에는 행별 파이썬 루프 없이 열 연산으로만 처리한다.
+    """
+    frame = frame.dropna(subset=['field', 'value'])
+
+    field = _column_to_text(frame['field'])
+    value = _column_to_text(frame['value'])
+
+    keep = field.ne('') & value.ne('') & field.ne('nan')
+    field = field[keep]
+    value = value[keep].copy()
+
+    # 필드별 보정 대상은 표준 키 기준으로 판별 (키 자체는 dict 로 모을 때 canonicalize_keys 로 변환)
+    canonical = field.map({name: resolve_header(name)[0] or name for name in field.unique()})
+
+    # 생년월일: Excel 일련번호 변환
+    birth = canonical.eq('생년월일') & value.str.fullmatch(r'[0-9]{1,9}')
+    if birth.any():
+        serial = value[birth].astype('int64')
+        serial = serial[serial <= EXCEL_MAX_SERIAL]
+        dates = EXCEL_EPOCH + serial.to_numpy().astype('timedelta64[D]')
+        value.loc[serial.index] = np.datetime_as_string(dates, unit='D')
+
+    # 성별: 약어 변환
+    gender = canonical.eq('성별')
+    if gender.any():
+        value = value.where(~gender, value.replace({'여': '여자', '남': '남자'}))
+
+    # 주소: 시도/시군구 보정
+    address = canonical.eq('주소')
+    if address.any():
+        value.loc[address] = normalize_addresses(value[address].tolist())
+
+    result = frame.loc[field.index].copy()
+    result['field'] = field
+    result['value'] = value
+    return result
+
+
+def read_user_sheet(excel_file, sheet_name):
+    """실제 엑셀 파일 구조에 맞는 사용자 데이터 읽기"""
+    try:
+        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+
+        # 열 12(인덱스 12)에 필드명, 열 13(인덱스 13)에 값이 있음
+        frame = extract_user_fields(pd.DataFrame({
+            'field': df.iloc[:, 12],
+            'value': df.iloc[:, 13],
+        }))
+        user_data = canonicalize_keys(dict(zip(frame['field'], frame['value'])))
+
+        # 필수 필드 확인
+        warn_missing_fields(user_data, sheet_name)
+
+        return user_data
+
+    except Exception as e:
+        print(f"[ERROR] {sheet_name} 시트 읽기 실패: {e}")
+        return None